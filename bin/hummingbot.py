@@ -20,8 +20,10 @@ from hummingbot.client.hummingbot_application import HummingbotApplication
 from hummingbot.client.settings import AllConnectorSettings
 from hummingbot.client.ui import login_prompt
 from hummingbot.client.ui.style import load_style
+from hummingbot.connector.exchange_info_cache import ExchangeInfoCache
 from hummingbot.core.event.event_listener import EventListener
 from hummingbot.core.event.events import HummingbotUIEvent
+from hummingbot.core.event.side_channel_event_bus import SideChannelEventBus
 from hummingbot.core.utils import detect_available_port
 from hummingbot.core.utils.async_utils import safe_gather
 
@@ -59,6 +61,8 @@ async def main_async(client_config_map: ClientConfigAdapter):
 
     # This init_logging() call is important, to skip over the missing config warnings.
     init_logging("hummingbot_logs.yml", client_config_map)
+    ExchangeInfoCache.enable()
+    SideChannelEventBus.get_instance().start()
 
     AllConnectorSettings.initialize_paper_trade_settings(client_config_map.paper_trade.paper_trade_exchanges)
 
@@ -28,7 +28,9 @@ from hummingbot.client.hummingbot_application import HummingbotApplication
 from hummingbot.client.settings import STRATEGIES_CONF_DIR_PATH, AllConnectorSettings
 from hummingbot.client.ui import login_prompt
 from hummingbot.client.ui.style import load_style
+from hummingbot.connector.exchange_info_cache import ExchangeInfoCache
 from hummingbot.core.event.events import HummingbotUIEvent
+from hummingbot.core.event.side_channel_event_bus import SideChannelEventBus
 from hummingbot.core.management.console import start_management_console
 from hummingbot.core.utils.async_utils import safe_gather
 
@@ -89,6 +91,8 @@ async def quick_start(args: argparse.Namespace, secrets_manager: BaseSecretsMana
     await Security.wait_til_decryption_done()
     await create_yml_files_legacy()
     init_logging("hummingbot_logs.yml", client_config_map)
+    ExchangeInfoCache.enable()
+    SideChannelEventBus.get_instance().start()
     await read_system_configs_from_yml()
 
     AllConnectorSettings.initialize_paper_trade_settings(client_config_map.paper_trade.paper_trade_exchanges)
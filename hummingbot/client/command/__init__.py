@@ -1,4 +1,5 @@
 from .balance_command import BalanceCommand
+from .clock_stats_command import ClockStatsCommand
 from .config_command import ConfigCommand
 from .connect_command import ConnectCommand
 from .create_command import CreateCommand
@@ -8,6 +9,7 @@ from .gateway_command import GatewayCommand
 from .help_command import HelpCommand
 from .history_command import HistoryCommand
 from .import_command import ImportCommand
+from .latency_command import LatencyCommand
 from .mqtt_command import MQTTCommand
 from .order_book_command import OrderBookCommand
 from .pmm_script_command import PMMScriptCommand
@@ -15,12 +17,14 @@ from .previous_strategy_command import PreviousCommand
 from .rate_command import RateCommand
 from .silly_commands import SillyCommands
 from .start_command import StartCommand
+from .startup_profile_command import StartupProfileCommand
 from .status_command import StatusCommand
 from .stop_command import StopCommand
 from .ticker_command import TickerCommand
 
 __all__ = [
     BalanceCommand,
+    ClockStatsCommand,
     ConfigCommand,
     ConnectCommand,
     CreateCommand,
@@ -30,12 +34,14 @@ __all__ = [
     HelpCommand,
     HistoryCommand,
     ImportCommand,
+    LatencyCommand,
     OrderBookCommand,
     PMMScriptCommand,
     PreviousCommand,
     RateCommand,
     SillyCommands,
     StartCommand,
+    StartupProfileCommand,
     StatusCommand,
     StopCommand,
     TickerCommand,
@@ -0,0 +1,67 @@
+import threading
+from typing import TYPE_CHECKING, Optional
+
+import pandas as pd
+
+from hummingbot.client.ui.interface_utils import format_df_for_printout
+from hummingbot.core.utils.clock_instrumentation import ClockInstrumentation
+
+if TYPE_CHECKING:
+    from hummingbot.client.hummingbot_application import HummingbotApplication  # noqa: F401
+
+CLOCK_STATS_OPTIONS = ["enable", "disable", "reset"]
+
+
+class ClockStatsCommand:
+    def clock_stats(self,  # type: HummingbotApplication
+                    option: Optional[str] = None):
+        if threading.current_thread() != threading.main_thread():
+            self.ev_loop.call_soon_threadsafe(self.clock_stats, option)
+            return
+
+        if option == "enable":
+            ClockInstrumentation.enable()
+            if self.clock is not None:
+                self.clock.set_instrumentation(ClockInstrumentation.get_instance())
+            self.notify("Clock tick instrumentation enabled.")
+        elif option == "disable":
+            ClockInstrumentation.disable()
+            if self.clock is not None:
+                self.clock.set_instrumentation(None)
+            self.notify("Clock tick instrumentation disabled.")
+        elif option == "reset":
+            ClockInstrumentation.get_instance().reset()
+            self.notify("Clock tick statistics have been reset.")
+        else:
+            self.notify(self.clock_stats_report_str())
+
+    def clock_stats_report_str(self,  # type: HummingbotApplication
+                               ) -> str:
+        status = "enabled" if ClockInstrumentation.enabled else "disabled"
+        lines = [f"Clock tick instrumentation is {status}."]
+        instrumentation = ClockInstrumentation.get_instance()
+        if not instrumentation.has_samples:
+            lines.append("No clock tick samples recorded.")
+            return "\n".join(lines)
+
+        columns = ["Iterator", "Ticks", "Missed", "Mean (ms)", "p50 (ms)", "p90 (ms)", "p99 (ms)", "Max (ms)"]
+        data = [
+            [name,
+             stats.tick_duration.count,
+             stats.missed_ticks,
+             round(stats.tick_duration.mean, 3),
+             round(stats.tick_duration.percentile(50), 3),
+             round(stats.tick_duration.percentile(90), 3),
+             round(stats.tick_duration.percentile(99), 3),
+             round(stats.tick_duration.max, 3)]
+            for name, stats in instrumentation.iterator_stats.items()
+        ]
+        df = pd.DataFrame(data=data, columns=columns)
+        lines.append("\n  Tick durations:")
+        lines.extend(["    " + line for line in format_df_for_printout(
+            df, table_format=self.client_config_map.tables_format).split("\n")])
+
+        lateness = instrumentation.tick_lateness
+        lines.append(f"\n  Tick lateness: {lateness.count} ticks, mean {lateness.mean:.3f} ms, "
+                     f"p99 {lateness.percentile(99):.3f} ms, max {lateness.max:.3f} ms")
+        return "\n".join(lines)
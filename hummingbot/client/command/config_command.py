@@ -83,6 +83,8 @@ client_configs_to_display = ["autofill_import",
                              "commands_timeout",
                              "create_command_timeout",
                              "other_commands_timeout",
+                             "startup_step_timeout",
+                             "non_critical_startup_step_timeout",
                              "tables_format",
                              "tick_size",
                              "market_data_collection",
@@ -0,0 +1,59 @@
+import threading
+from typing import TYPE_CHECKING, Optional
+
+import pandas as pd
+
+from hummingbot.client.ui.interface_utils import format_df_for_printout
+from hummingbot.core.utils.order_latency_tracer import OrderLatencyTracer
+
+if TYPE_CHECKING:
+    from hummingbot.client.hummingbot_application import HummingbotApplication  # noqa: F401
+
+LATENCY_OPTIONS = ["enable", "disable", "reset"]
+
+
+class LatencyCommand:
+    def latency(self,  # type: HummingbotApplication
+                option: Optional[str] = None):
+        if threading.current_thread() != threading.main_thread():
+            self.ev_loop.call_soon_threadsafe(self.latency, option)
+            return
+
+        if option == "enable":
+            OrderLatencyTracer.enable()
+            self.notify("Order latency tracing enabled.")
+        elif option == "disable":
+            OrderLatencyTracer.disable()
+            self.notify("Order latency tracing disabled.")
+        elif option == "reset":
+            OrderLatencyTracer.reset_all()
+            self.notify("Order latency statistics have been reset.")
+        else:
+            self.notify(self.order_latency_report_str())
+
+    def order_latency_report_str(self,  # type: HummingbotApplication
+                                 ) -> str:
+        status = "enabled" if OrderLatencyTracer.enabled else "disabled"
+        lines = [f"Order latency tracing is {status}."]
+        tracers = [tracer for tracer in OrderLatencyTracer.all_tracers().values() if tracer.has_samples]
+        if len(tracers) == 0:
+            lines.append("No order latency samples recorded.")
+            return "\n".join(lines)
+
+        columns = ["Stage", "Count", "Mean (ms)", "p50 (ms)", "p90 (ms)", "p99 (ms)", "Max (ms)"]
+        for tracer in tracers:
+            data = [
+                [stage,
+                 histogram.count,
+                 round(histogram.mean, 3),
+                 round(histogram.percentile(50), 3),
+                 round(histogram.percentile(90), 3),
+                 round(histogram.percentile(99), 3),
+                 round(histogram.max, 3)]
+                for stage, histogram in tracer.histograms.items()
+            ]
+            df = pd.DataFrame(data=data, columns=columns)
+            lines.append(f"\n  {tracer.connector_name}:")
+            lines.extend(["    " + line for line in format_df_for_printout(
+                df, table_format=self.client_config_map.tables_format).split("\n")])
+        return "\n".join(lines)
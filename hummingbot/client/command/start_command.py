@@ -19,9 +19,11 @@ from hummingbot.client.config.config_helpers import get_strategy_starter_file
 from hummingbot.client.config.config_validators import validate_bool
 from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.connector.startup_orchestrator import StartupOrchestrator
 from hummingbot.core.clock import Clock, ClockMode
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.clock_instrumentation import ClockInstrumentation
 from hummingbot.exceptions import InvalidScriptModule, OracleRateUnavailable
 from hummingbot.strategy.directional_strategy_base import DirectionalStrategyBase
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
@@ -32,6 +34,8 @@ if TYPE_CHECKING:
 
 
 GATEWAY_READY_TIMEOUT = 300  # seconds
+# The connectors are not ticked more often than this, even when the strategy runs with a shorter tick size
+CONNECTOR_TICK_PERIOD = 1.0  # seconds
 
 
 class StartCommand(GatewayChainApiManager):
@@ -243,11 +247,24 @@ class StartCommand(GatewayChainApiManager):
                                   ):
         try:
             self.start_time = time.time() * 1e3  # Time in milliseconds
+            # Initializes the connectors concurrently before the clock starts them
+            commands_timeout = self.client_config_map.commands_timeout
+            self.startup_orchestrator = StartupOrchestrator(
+                step_timeout=float(commands_timeout.startup_step_timeout),
+                non_critical_step_timeout=float(commands_timeout.non_critical_startup_step_timeout))
+            for market in self.markets.values():
+                if market is not None:
+                    self.startup_orchestrator.add_connector(market)
+            await self.startup_orchestrator.run()
             tick_size = self.client_config_map.tick_size
             self.logger().info(f"Creating the clock with tick size: {tick_size}")
             self.clock = Clock(ClockMode.REALTIME, tick_size=tick_size)
+            if ClockInstrumentation.enabled:
+                self.clock.set_instrumentation(ClockInstrumentation.get_instance())
             for market in self.markets.values():
                 if market is not None:
+                    if tick_size < CONNECTOR_TICK_PERIOD:
+                        market.set_tick_period(CONNECTOR_TICK_PERIOD)
                     self.clock.add_iterator(market)
                     self.markets_recorder.restore_market_states(self.strategy_file_name, market)
                     if len(market.limit_orders) > 0:
@@ -272,6 +289,7 @@ class StartCommand(GatewayChainApiManager):
             if self._trading_required:
                 self.kill_switch = self.client_config_map.kill_switch_mode.get_kill_switch(self)
                 await self.wait_till_ready(self.kill_switch.start)
+                self.startup_orchestrator.record_ready()
         except Exception as e:
             self.logger().error(str(e), exc_info=True)
 
@@ -0,0 +1,47 @@
+import threading
+from typing import TYPE_CHECKING
+
+import pandas as pd
+
+from hummingbot.client.ui.interface_utils import format_df_for_printout
+
+if TYPE_CHECKING:
+    from hummingbot.client.hummingbot_application import HummingbotApplication  # noqa: F401
+
+
+class StartupProfileCommand:
+    def startup_profile(self,  # type: HummingbotApplication
+                        ):
+        if threading.current_thread() != threading.main_thread():
+            self.ev_loop.call_soon_threadsafe(self.startup_profile)
+            return
+        self.notify(self.startup_profile_str())
+
+    def startup_profile_str(self,  # type: HummingbotApplication
+                            ) -> str:
+        orchestrator = self.startup_orchestrator
+        if orchestrator is None or orchestrator.start_time is None:
+            return "The connectors have not been started yet."
+
+        columns = ["Connector", "Step", "Status", "Start (ms)", "Duration (ms)"]
+        data = []
+        for step in sorted(orchestrator.steps, key=lambda s: (s.connector_name, s.start_time or float("inf"))):
+            start = "" if step.start_time is None else round((step.start_time - orchestrator.start_time) * 1e3, 1)
+            duration = "" if step.duration is None else round(step.duration * 1e3, 1)
+            status = step.status if step.error is None else f"{step.status} ({step.error})"
+            data.append([step.connector_name, step.name, status, start, duration])
+
+        lines = []
+        if len(data) > 0:
+            df = pd.DataFrame(data=data, columns=columns)
+            lines.extend(["  " + line for line in format_df_for_printout(
+                df, table_format=self.client_config_map.tables_format).split("\n")])
+        else:
+            lines.append("  No connector startup steps were executed.")
+        if orchestrator.duration is not None:
+            lines.append(f"\n  Startup steps completed in {orchestrator.duration * 1e3:.1f} ms.")
+        if orchestrator.time_to_ready is not None:
+            lines.append(f"  Connectors ready after {orchestrator.time_to_ready * 1e3:.1f} ms.")
+        else:
+            lines.append("  Connectors not ready yet.")
+        return "\n".join(lines)
@@ -653,12 +653,35 @@ class CommandsTimeoutConfigMap(BaseClientModel):
         ),
     )
 
+    startup_step_timeout: Decimal = Field(
+        default=Decimal("30"),
+        gt=Decimal("0"),
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Network timeout of each step of the connectors startup in the start command"
+                " (i.e. time synchronization, trading rules, balances; in seconds)"
+            ),
+        ),
+    )
+    non_critical_startup_step_timeout: Decimal = Field(
+        default=Decimal("5"),
+        gt=Decimal("0"),
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Network timeout of the steps of the connectors startup the connectors can start without"
+                " (i.e. trading fees, trading pairs symbols; in seconds)"
+            ),
+        ),
+    )
+
     class Config:
         title = "commands_timeout"
 
     @validator(
         "create_command_timeout",
         "other_commands_timeout",
+        "startup_step_timeout",
+        "non_critical_startup_step_timeout",
         pre=True,
     )
     def validate_decimals(cls, v: str, field: Field):
@@ -648,18 +648,35 @@ def get_strategy_pydantic_config_cls(strategy_name: str) -> Optional[ModelMetacl
 async def load_strategy_config_map_from_file(yml_path: Path) -> Union[ClientConfigAdapter, Dict[str, ConfigVar]]:
     strategy_name = strategy_name_from_file(yml_path)
     config_cls = get_strategy_pydantic_config_cls(strategy_name)
+    config_data = read_yml_file(yml_path)
+    # The trading pairs of the config are validated against the trading pairs of its connectors
+    request_connectors_trading_pairs(config_data)
     if config_cls is None:  # legacy
         config_map = get_strategy_config_map(strategy_name)
         template_path = get_strategy_template_path(strategy_name)
         await load_yml_into_cm_legacy(str(yml_path), str(template_path), config_map)
     else:
-        config_data = read_yml_file(yml_path)
         hb_config = config_cls.construct()
         config_map = ClientConfigAdapter(hb_config)
         _load_yml_data_into_map(config_data, config_map)
     return config_map
 
 
+def request_connectors_trading_pairs(config_data: Dict[str, Any]):
+    """
+    Starts fetching in the background the trading pairs of the connectors referenced in the config data, without
+    waiting for them (the trading pairs are validated only once they are fetched)
+    """
+    from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
+
+    connector_names = AllConnectorSettings.get_connector_settings().keys()
+    config_connectors = {value for value in config_data.values() if isinstance(value, str) and value in connector_names}
+    if len(config_connectors) > 0:
+        trading_pair_fetcher = TradingPairFetcher.get_instance()
+        for connector_name in config_connectors:
+            trading_pair_fetcher.request_trading_pairs(connector_name)
+
+
 def load_connector_config_map_from_file(yml_path: Path) -> ClientConfigAdapter:
     config_data = read_yml_file(yml_path)
     connector_name = connector_name_from_file(yml_path)
@@ -30,6 +30,7 @@ from hummingbot.client.ui.parser import ThrowingArgumentParser, load_parser
 from hummingbot.connector.exchange.paper_trade import create_paper_trade_market
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.connector.markets_recorder import MarketsRecorder
+from hummingbot.connector.startup_orchestrator import StartupOrchestrator
 from hummingbot.core.clock import Clock
 from hummingbot.core.gateway.gateway_status_monitor import GatewayStatusMonitor
 from hummingbot.core.utils.kill_switch import KillSwitch
@@ -105,6 +106,7 @@ class HummingbotApplication(*commands):
         self.trade_fill_db: Optional[SQLConnectionManager] = None
         self.markets_recorder: Optional[MarketsRecorder] = None
         self._pmm_script_iterator = None
+        self.startup_orchestrator: Optional[StartupOrchestrator] = None
         self._binance_connector = None
         self._shared_client = None
         self._mqtt: MQTTGateway = None
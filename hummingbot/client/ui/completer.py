@@ -11,7 +11,9 @@ from prompt_toolkit.completion import CompleteEvent, Completer, WordCompleter
 from prompt_toolkit.document import Document
 
 from hummingbot.client import settings
+from hummingbot.client.command.clock_stats_command import CLOCK_STATS_OPTIONS
 from hummingbot.client.command.connect_command import OPTIONS as CONNECT_OPTIONS
+from hummingbot.client.command.latency_command import LATENCY_OPTIONS
 from hummingbot.client.config.config_data_types import BaseClientModel
 from hummingbot.client.settings import (
     GATEWAY_CONNECTORS,
@@ -100,6 +102,8 @@ class HummingbotCompleter(Completer):
         self._controller_completer = self.get_available_controllers()
         self._rate_oracle_completer = WordCompleter(list(RATE_ORACLE_SOURCES.keys()), ignore_case=True)
         self._mqtt_completer = WordCompleter(["start", "stop", "restart"], ignore_case=True)
+        self._latency_completer = WordCompleter(LATENCY_OPTIONS, ignore_case=True)
+        self._clock_stats_completer = WordCompleter(CLOCK_STATS_OPTIONS, ignore_case=True)
         self._gateway_chains = []
         self._gateway_networks = []
         self._list_gateway_wallets_parameters = {"wallets": [], "chain": ""}
@@ -169,7 +173,9 @@ class HummingbotCompleter(Completer):
             if exchange in self.prompt_text:
                 market = exchange
                 break
-        trading_pairs = trading_pair_fetcher.trading_pairs.get(market, []) if trading_pair_fetcher.ready and market else []
+        if market:
+            trading_pair_fetcher.request_trading_pairs(market)
+        trading_pairs = trading_pair_fetcher.trading_pairs.get(market, []) if trading_pair_fetcher.is_ready(market) else []
         return WordCompleter(trading_pairs, ignore_case=True, sentence=True)
 
     @property
@@ -329,6 +335,14 @@ class HummingbotCompleter(Completer):
         text_before_cursor: str = document.text_before_cursor
         return text_before_cursor.startswith("mqtt ")
 
+    def _complete_latency_arguments(self, document: Document) -> bool:
+        text_before_cursor: str = document.text_before_cursor
+        return text_before_cursor.startswith("latency ")
+
+    def _complete_clock_stats_arguments(self, document: Document) -> bool:
+        text_before_cursor: str = document.text_before_cursor
+        return text_before_cursor.startswith("clock-stats ")
+
     def get_completions(self, document: Document, complete_event: CompleteEvent):
         """
         Get completions for the current scope. This is the defining function for the completer
@@ -489,6 +503,14 @@ class HummingbotCompleter(Completer):
             for c in self._mqtt_completer.get_completions(document, complete_event):
                 yield c
 
+        elif self._complete_latency_arguments(document):
+            for c in self._latency_completer.get_completions(document, complete_event):
+                yield c
+
+        elif self._complete_clock_stats_arguments(document):
+            for c in self._clock_stats_completer.get_completions(document, complete_event):
+                yield c
+
         else:
             text_before_cursor: str = document.text_before_cursor
             try:
@@ -1,7 +1,9 @@
 import argparse
 from typing import TYPE_CHECKING, Any, List
 
+from hummingbot.client.command.clock_stats_command import CLOCK_STATS_OPTIONS
 from hummingbot.client.command.connect_command import OPTIONS as CONNECT_OPTIONS
+from hummingbot.client.command.latency_command import LATENCY_OPTIONS
 from hummingbot.exceptions import ArgumentParserError
 
 if TYPE_CHECKING:
@@ -186,6 +188,20 @@ def load_parser(hummingbot: "HummingbotApplication", command_tabs) -> [ThrowingA
         for i in range(len(args)):
             shortcut_parser.add_argument(f'${i+1}', help=args[i])
 
+    latency_parser = subparsers.add_parser("latency", help="Show or manage order latency tracing statistics")
+    latency_parser.add_argument("option", nargs="?", choices=LATENCY_OPTIONS, default=None,
+                                help="Enable, disable or reset order latency tracing")
+    latency_parser.set_defaults(func=hummingbot.latency)
+
+    clock_stats_parser = subparsers.add_parser("clock-stats", help="Show or manage the clock tick statistics")
+    clock_stats_parser.add_argument("option", nargs="?", choices=CLOCK_STATS_OPTIONS, default=None,
+                                    help="Enable, disable or reset the clock tick instrumentation")
+    clock_stats_parser.set_defaults(func=hummingbot.clock_stats)
+
+    startup_profile_parser = subparsers.add_parser("startup-profile",
+                                                   help="Show the timing of the connectors startup steps")
+    startup_profile_parser.set_defaults(func=hummingbot.startup_profile)
+
     rate_parser = subparsers.add_parser('rate', help="Show rate of a given trading pair")
     rate_parser.add_argument("-p", "--pair", default=None,
                              dest="pair", help="The market trading pair for which you want to get a rate.")
@@ -0,0 +1,180 @@
+import logging
+from decimal import Decimal
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+from hummingbot.connector.constants import s_decimal_0
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, TradeUpdate
+from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:
+    from hummingbot.connector.connector_base import ConnectorBase
+
+bl_logger = None
+
+
+class BalanceLedger:
+    """
+    Keeps the connector total and available balances up to date between balance requests to the exchange, applying
+    locally the changes caused by the bot orders:
+    - creating an order locks its collateral (quote asset for buy orders, base asset for sell orders)
+    - fills move the balances between the base and quote assets and pay the fees
+    - cancellations, failures and completions unlock the collateral still locked by the order
+
+    The balances requested to the exchange replace the local ones when the connector reconciles the ledger, what
+    happens periodically or as soon as a drift is detected (a balance becoming negative or a fee that can not be
+    converted to a balance change). The changes applied while the balances are being requested are applied again
+    on top of the exchange balances, since the exchange response might not include them.
+    """
+
+    def __init__(self, connector: "ConnectorBase", reconciliation_interval: float):
+        self._connector = connector
+        self._reconciliation_interval = reconciliation_interval
+        self._last_reconciliation_timestamp: float = 0
+        self._drift_detected: bool = True
+        self._locked_by_order: Dict[str, Tuple[str, Decimal]] = {}  # Dict[client_order_id, (asset, amount)]
+        # The total and available balance changes applied since the balances were requested to the exchange
+        self._changes_since_balances_request: Optional[Dict[str, Tuple[Decimal, Decimal]]] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global bl_logger
+        if bl_logger is None:
+            bl_logger = logging.getLogger(__name__)
+        return bl_logger
+
+    @property
+    def drift_detected(self) -> bool:
+        return self._drift_detected
+
+    @property
+    def locked_balances(self) -> Dict[str, Decimal]:
+        balances: Dict[str, Decimal] = {}
+        for asset, amount in self._locked_by_order.values():
+            balances[asset] = balances.get(asset, s_decimal_0) + amount
+        return balances
+
+    def is_reconciliation_required(self, timestamp: float) -> bool:
+        return (self._drift_detected
+                or timestamp - self._last_reconciliation_timestamp >= self._reconciliation_interval)
+
+    def start_balances_request(self):
+        """
+        To be called before requesting the balances to the exchange. The balance changes applied from now on (orders
+        created, filled or done while the request is in flight) are applied again when reconciling.
+        """
+        self._changes_since_balances_request = {}
+
+    def reconcile(self, timestamp: float):
+        """
+        To be called after the balances have been updated with the information from the exchange.
+        The locks of the active orders are kept, to be able to release them when the orders are done.
+        """
+        changes = self._changes_since_balances_request or {}
+        self._changes_since_balances_request = None
+        self._last_reconciliation_timestamp = timestamp
+        self._drift_detected = False
+        for asset, (total_change, available_change) in changes.items():
+            self._add_to_total_balance(asset, total_change)
+            self._add_to_available_balance(asset, available_change)
+        if len(changes) > 0:
+            # The exchange response might already include some of the changes, the next balance update reconciles
+            # the ledger again
+            self._drift_detected = True
+
+    def lock(self, order: InFlightOrder):
+        asset, amount = self._collateral_locked_by(order)
+        if amount > s_decimal_0:
+            self._locked_by_order[order.client_order_id] = (asset, amount)
+            self._add_to_available_balance(asset, -amount)
+
+    def release(self, order: InFlightOrder):
+        locked = self._locked_by_order.pop(order.client_order_id, None)
+        if locked is not None:
+            asset, amount = locked
+            self._add_to_available_balance(asset, amount)
+
+    def apply_trade_update(self, order: InFlightOrder, trade_update: TradeUpdate):
+        """
+        Applies the balance changes of a fill. Has to be called after the order has been updated with the fill.
+        """
+        if order.trade_type == TradeType.BUY:
+            balance_changes = {
+                order.base_asset: trade_update.fill_base_amount,
+                order.quote_asset: -trade_update.fill_quote_amount,
+            }
+        else:
+            balance_changes = {
+                order.base_asset: -trade_update.fill_base_amount,
+                order.quote_asset: trade_update.fill_quote_amount,
+            }
+        for token, fee_amount in self._fee_amounts(order, trade_update).items():
+            balance_changes[token] = balance_changes.get(token, s_decimal_0) - fee_amount
+
+        for asset, change in balance_changes.items():
+            self._add_to_total_balance(asset, change)
+            self._add_to_available_balance(asset, change)
+
+        # The collateral of the filled amount is no longer locked (it has been already deducted with the fill)
+        previous_lock = self._locked_by_order.get(order.client_order_id)
+        if previous_lock is not None:
+            asset, previous_amount = previous_lock
+            _, current_amount = self._collateral_locked_by(order)
+            current_amount = max(current_amount, s_decimal_0)
+            self._locked_by_order[order.client_order_id] = (asset, current_amount)
+            self._add_to_available_balance(asset, previous_amount - current_amount)
+
+    def _fee_amounts(self, order: InFlightOrder, trade_update: TradeUpdate) -> Dict[str, Decimal]:
+        fee = trade_update.fee
+        amounts: Dict[str, Decimal] = {}
+        for flat_fee in fee.flat_fees:
+            amounts[flat_fee.token] = amounts.get(flat_fee.token, s_decimal_0) + flat_fee.amount
+        if fee.percent > s_decimal_0:
+            if isinstance(fee, DeductedFromReturnsTradeFee):
+                returns_token = order.base_asset if order.trade_type == TradeType.BUY else order.quote_asset
+                returns_amount = (trade_update.fill_base_amount
+                                  if order.trade_type == TradeType.BUY
+                                  else trade_update.fill_quote_amount)
+                token, amount = returns_token, returns_amount * fee.percent
+            else:
+                token, amount = order.quote_asset, trade_update.fill_quote_amount * fee.percent
+            if fee.percent_token is not None and fee.percent_token != token:
+                # The fee is charged in a third token, and the ledger does not know the conversion rate
+                self._drift_detected = True
+            else:
+                amounts[token] = amounts.get(token, s_decimal_0) + amount
+        return amounts
+
+    def _collateral_locked_by(self, order: InFlightOrder) -> Tuple[str, Decimal]:
+        outstanding_amount = order.amount - order.executed_amount_base
+        if order.trade_type == TradeType.BUY:
+            price: Optional[Decimal] = order.price
+            if price is None or not price.is_finite():
+                return order.quote_asset, s_decimal_0
+            return order.quote_asset, outstanding_amount * price
+        return order.base_asset, outstanding_amount
+
+    def _add_to_total_balance(self, asset: str, amount: Decimal):
+        self._record_change_since_balances_request(asset, total_change=amount)
+        new_balance = self._connector._account_balances.get(asset, s_decimal_0) + amount
+        self._connector._account_balances[asset] = new_balance
+        if new_balance < s_decimal_0:
+            self._drift_detected = True
+
+    def _add_to_available_balance(self, asset: str, amount: Decimal):
+        self._record_change_since_balances_request(asset, available_change=amount)
+        new_balance = self._connector._account_available_balances.get(asset, s_decimal_0) + amount
+        self._connector._account_available_balances[asset] = new_balance
+        if new_balance < s_decimal_0:
+            self._drift_detected = True
+
+    def _record_change_since_balances_request(self,
+                                              asset: str,
+                                              total_change: Decimal = s_decimal_0,
+                                              available_change: Decimal = s_decimal_0):
+        if self._changes_since_balances_request is not None:
+            previous_total_change, previous_available_change = self._changes_since_balances_request.get(
+                asset, (s_decimal_0, s_decimal_0))
+            self._changes_since_balances_request[asset] = (previous_total_change + total_change,
+                                                           previous_available_change + available_change)
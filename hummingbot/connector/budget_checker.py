@@ -2,9 +2,10 @@ import typing
 from collections import defaultdict
 from copy import copy
 from decimal import Decimal
-from typing import Dict, List
+from typing import Callable, Dict, List, Optional, Tuple
 
 from hummingbot.core.data_type.order_candidate import OrderCandidate
+from hummingbot.core.data_type.trade_fee import TradeFeeBase
 
 if typing.TYPE_CHECKING:  # avoid circular import problems
     from hummingbot.connector.exchange_base import ExchangeBase
@@ -28,6 +29,9 @@ class BudgetChecker:
         """
         self._exchange = exchange
         self._locked_collateral: Dict[str, Decimal] = defaultdict(lambda: Decimal("0"))
+        # Only set while a batch of candidates is being adjusted (see `adjust_candidates`)
+        self._batch_fees: Optional[Dict[Tuple, TradeFeeBase]] = None
+        self._batch_balances: Optional[Dict[Tuple[str, bool], Decimal]] = None
 
     def reset_locked_collateral(self):
         """
@@ -45,16 +49,28 @@ class BudgetChecker:
         See the doc string for `adjust_candidate` to learn more about how the adjusted order
         amount is derived.
 
+        The candidates are processed as a batch: the fee of all the candidates sharing the same fee parameters
+        (trading pair, side, order type...) is built only once, and the balances are read only once per token.
+        The collateral locked by each candidate is accumulated, so every candidate is checked against the balances
+        minus the collateral of the candidates before it, and the result is the same as adjusting the candidates
+        one by one with `adjust_candidate_and_lock_available_collateral`.
+
         :param order_candidates: A list of candidate orders to check and adjust.
         :param all_or_none: Should the order amount be set to zero on insufficient balance.
         :return: The list of adjusted order candidates.
         """
         self.reset_locked_collateral()
-        adjusted_candidates = [
-            self.adjust_candidate_and_lock_available_collateral(order_candidate, all_or_none)
-            for order_candidate in order_candidates
-        ]
-        self.reset_locked_collateral()
+        self._batch_fees = {}
+        self._batch_balances = {}
+        try:
+            adjusted_candidates = [
+                self.adjust_candidate_and_lock_available_collateral(order_candidate, all_or_none)
+                for order_candidate in order_candidates
+            ]
+        finally:
+            self._batch_fees = None
+            self._batch_balances = None
+            self.reset_locked_collateral()
         return adjusted_candidates
 
     def adjust_candidate_and_lock_available_collateral(
@@ -116,16 +132,22 @@ class BudgetChecker:
         :return: The adjusted order candidate.
         """
         order_candidate = copy(order_candidate)
-        order_candidate.populate_collateral_entries(self._exchange)
+        order_candidate.populate_collateral_entries(self._exchange, fee=self._get_batch_fee(order_candidate))
         return order_candidate
 
+    def _get_batch_fee(self, order_candidate: OrderCandidate) -> Optional[TradeFeeBase]:
+        if self._batch_fees is None:
+            return None
+        key = order_candidate.fee_cache_key()
+        fee = self._batch_fees.get(key)
+        if fee is None:
+            fee = order_candidate._get_fee(self._exchange)
+            self._batch_fees[key] = fee
+        return fee
+
     def _get_available_balances(self, order_candidate: OrderCandidate) -> Dict[str, Decimal]:
         available_balances = {}
-        balance_fn = (
-            self._exchange.get_available_balance
-            if not order_candidate.from_total_balances
-            else self._exchange.get_balance
-        )
+        balance_fn = self._balance_function(order_candidate.from_total_balances)
 
         if order_candidate.order_collateral is not None:
             token, _ = order_candidate.order_collateral
@@ -145,6 +167,21 @@ class BudgetChecker:
 
         return available_balances
 
+    def _balance_function(self, from_total_balances: bool) -> Callable[[str], Decimal]:
+        balance_fn = self._exchange.get_balance if from_total_balances else self._exchange.get_available_balance
+        if self._batch_balances is None:
+            return balance_fn
+
+        def batch_balance_fn(token: str) -> Decimal:
+            key = (token, from_total_balances)
+            balance = self._batch_balances.get(key)
+            if balance is None:
+                balance = balance_fn(token)
+                self._batch_balances[key] = balance
+            return balance
+
+        return batch_balance_fn
+
     def _quantize_adjusted_order(self, order_candidate: OrderCandidate) -> OrderCandidate:
         trading_pair = order_candidate.trading_pair
         adjusted_amount = order_candidate.amount
@@ -21,9 +21,11 @@ from hummingbot.core.event.events import (
     SellOrderCreatedEvent,
 )
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.order_latency_tracer import EXCHANGE_CONFIRMATION, OrderLatencyTracer
 from hummingbot.logger.logger import HummingbotLogger
 
 if TYPE_CHECKING:
+    from hummingbot.connector.balance_ledger import BalanceLedger
     from hummingbot.connector.connector_base import ConnectorBase
 
 cot_logger = None
@@ -58,6 +60,8 @@ class ClientOrderTracker:
         self._cached_orders: TTLCache = TTLCache(maxsize=self.MAX_CACHE_SIZE, ttl=self.CACHED_ORDER_TTL)
         self._lost_orders: Dict[str, InFlightOrder] = {}
 
+        self._balance_ledger: Optional["BalanceLedger"] = None
+
         self._order_tracking_task: Optional[asyncio.Task] = None
         self._last_poll_timestamp: int = -1
         self._order_not_found_records: Dict[str, int] = defaultdict(lambda: 0)
@@ -132,6 +136,17 @@ class ClientOrderTracker:
         """
         return {client_order_id: order for client_order_id, order in self._lost_orders.items()}
 
+    @property
+    def balance_ledger(self) -> Optional["BalanceLedger"]:
+        """
+        Returns the balance ledger notified about the orders locking and releasing balance and about their fills
+        """
+        return self._balance_ledger
+
+    @balance_ledger.setter
+    def balance_ledger(self, value: Optional["BalanceLedger"]):
+        self._balance_ledger = value
+
     @property
     def lost_order_count_limit(self) -> int:
         return self._lost_order_count_limit
@@ -142,11 +157,18 @@ class ClientOrderTracker:
 
     def start_tracking_order(self, order: InFlightOrder):
         self._in_flight_orders[order.client_order_id] = order
+        if self._balance_ledger is not None:
+            self._balance_ledger.lock(order)
+        if OrderLatencyTracer.enabled:
+            OrderLatencyTracer.for_connector(self._connector.name).start_trace(order)
 
     def stop_tracking_order(self, client_order_id: str):
         if client_order_id in self._in_flight_orders:
-            self._cached_orders[client_order_id] = self._in_flight_orders[client_order_id]
+            order = self._in_flight_orders[client_order_id]
+            self._cached_orders[client_order_id] = order
             del self._in_flight_orders[client_order_id]
+            if self._balance_ledger is not None:
+                self._balance_ledger.release(order)
             if client_order_id in self._order_not_found_records:
                 del self._order_not_found_records[client_order_id]
 
@@ -206,10 +228,14 @@ class ClientOrderTracker:
         tracked_order: Optional[InFlightOrder] = self.all_fillable_orders.get(client_order_id)
 
         if tracked_order:
+            if tracked_order.latency_trace is not None:
+                self._stamp_exchange_confirmation(tracked_order)
             previous_executed_amount_base: Decimal = tracked_order.executed_amount_base
 
             updated: bool = tracked_order.update_with_trade_update(trade_update)
             if updated:
+                if self._balance_ledger is not None:
+                    self._balance_ledger.apply_trade_update(tracked_order, trade_update)
                 self._trigger_order_fills(
                     tracked_order=tracked_order,
                     prev_executed_amount_base=previous_executed_amount_base,
@@ -276,6 +302,8 @@ class ClientOrderTracker:
         )
 
         if tracked_order:
+            if tracked_order.latency_trace is not None:
+                self._stamp_exchange_confirmation(tracked_order)
             if order_update.new_state == OrderState.FILLED and not tracked_order.is_done:
                 try:
                     await asyncio.wait_for(
@@ -304,6 +332,14 @@ class ClientOrderTracker:
             else:
                 self.logger().debug(f"Order is not/no longer being tracked ({order_update})")
 
+    @staticmethod
+    def _stamp_exchange_confirmation(tracked_order: InFlightOrder):
+        # The update processed while placing the order is the creation response, not the exchange confirmation
+        trace = tracked_order.latency_trace
+        if (OrderLatencyTracer.current_trace() is not trace
+                and (trace.request_sent is not None or trace.response_received is not None)):
+            trace.stamp(EXCHANGE_CONFIRMATION)
+
     def _trigger_created_event(self, order: InFlightOrder):
         event_tag = MarketEvent.BuyOrderCreated if order.trade_type is TradeType.BUY else MarketEvent.SellOrderCreated
         event_class: Callable = BuyOrderCreatedEvent if order.trade_type is TradeType.BUY else SellOrderCreatedEvent
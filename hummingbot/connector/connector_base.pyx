@@ -480,6 +480,20 @@ cdef class ConnectorBase(NetworkIterator):
         """
         return self.c_quantize_order_amount(trading_pair, amount)
 
+    def quantize_many(self,
+                      trading_pair: str,
+                      prices: List[Decimal],
+                      amounts: List[Decimal]) -> Tuple[List[Decimal], List[Decimal]]:
+        """
+        Applies trading rule to quantize all the prices and amounts of a proposal at once.
+        :param trading_pair: the trading pair the orders are for
+        :param prices: the order prices
+        :param amounts: the order amounts
+        :return: a tuple with the list of quantized prices and the list of quantized amounts
+        """
+        return ([self.quantize_order_price(trading_pair, price) for price in prices],
+                [self.quantize_order_amount(trading_pair, amount) for amount in amounts])
+
     async def get_quote_price(self, trading_pair: str, is_buy: bool, amount: Decimal) -> Decimal:
         """
         Returns a quote price (or exchange rate) for a given amount, like asking how much does it cost to buy 4 apples?
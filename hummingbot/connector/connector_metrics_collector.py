@@ -8,8 +8,8 @@ from os.path import dirname, join, realpath
 from typing import TYPE_CHECKING, List, Tuple
 
 from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
-from hummingbot.core.event.event_forwarder import EventForwarder
 from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
+from hummingbot.core.event.side_channel_event_bus import SideChannelEventForwarder
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
@@ -78,9 +78,10 @@ class TradeVolumeMetricCollector(MetricsCollector):
         self._last_executed_collection_process = None
         self._collected_events = []
 
-        self._fill_event_forwarder = EventForwarder(self._register_fill_event)
+        self._fill_event_forwarder = SideChannelEventForwarder(
+            self._did_fill_order, name="TradeVolumeMetricCollector", drop_on_overflow=True)
 
-        self._event_pairs: List[Tuple[MarketEvent, EventForwarder]] = [
+        self._event_pairs: List[Tuple[MarketEvent, SideChannelEventForwarder]] = [
             (MarketEvent.OrderFilled, self._fill_event_forwarder),
         ]
 
@@ -165,5 +166,8 @@ class TradeVolumeMetricCollector(MetricsCollector):
 
         self._dispatcher.request(metric_request)
 
+    def _did_fill_order(self, event_tag: int, market: 'ConnectorBase', event: OrderFilledEvent):
+        self._register_fill_event(event)
+
     def _register_fill_event(self, event: OrderFilledEvent):
         self._collected_events.append(event)
@@ -116,6 +116,11 @@ class BitmartExchange(ExchangePyBase):
     def is_trading_required(self) -> bool:
         return self._trading_required
 
+    @property
+    def use_balance_ledger(self) -> bool:
+        # BitMart only provides the balances through REST requests
+        return True
+
     def supported_order_types(self) -> List[OrderType]:
         """
         :return a list of OrderType supported by this connector.
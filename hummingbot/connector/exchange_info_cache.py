@@ -0,0 +1,218 @@
+import asyncio
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+from hummingbot.connector.constants import DAY
+from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.logger import HummingbotLogger
+
+eic_logger = None
+
+CACHE_FORMAT_VERSION = 1
+
+_DECIMAL_RULE_FIELDS = (
+    "min_order_size",
+    "max_order_size",
+    "min_price_increment",
+    "min_base_amount_increment",
+    "min_quote_amount_increment",
+    "min_notional_size",
+    "min_order_value",
+    "max_price_significant_digits",
+)
+
+
+class ExchangeInfoCacheEntry:
+    """
+    The exchange information of one connector and domain as it was stored in the cache
+    """
+
+    def __init__(self,
+                 timestamp: float,
+                 trading_rules: Optional[List[TradingRule]],
+                 symbol_map: Optional[Dict[str, str]]):
+        self.timestamp = timestamp
+        self.trading_rules = trading_rules
+        self.symbol_map = symbol_map
+
+
+class ExchangeInfoCache:
+    """
+    Stores on disk the trading rules and the trading pair symbol map of each connector and domain, so that connectors
+    can be ready right after starting, without waiting for the exchange info request and its processing.
+    The entries older than the configured time to live are ignored.
+
+    The cache is disabled by default and has to be enabled by the application at startup (it is not used by
+    non-interactive usages of the connectors, like unit tests). The connectors store the entries with `save_async`,
+    that writes the file in a thread to not block the event loop.
+    """
+    DEFAULT_TTL = DAY
+
+    _shared_instance: Optional["ExchangeInfoCache"] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global eic_logger
+        if eic_logger is None:
+            eic_logger = logging.getLogger(__name__)
+        return eic_logger
+
+    @classmethod
+    def enable(cls, cache_dir: Optional[str] = None, ttl: float = DEFAULT_TTL):
+        if cache_dir is None:
+            from hummingbot import data_path
+            cache_dir = os.path.join(data_path(), "exchange_info_cache")
+        cls._shared_instance = cls(cache_dir=cache_dir, ttl=ttl)
+
+    @classmethod
+    def disable(cls):
+        cls._shared_instance = None
+
+    @classmethod
+    def get_instance(cls) -> Optional["ExchangeInfoCache"]:
+        """
+        Returns the shared cache, or None if the cache is not enabled
+        """
+        return cls._shared_instance
+
+    def __init__(self, cache_dir: str, ttl: float = DEFAULT_TTL):
+        self._cache_dir = cache_dir
+        self._ttl = ttl
+        # Serializes the writes, that can run concurrently in different threads
+        self._save_lock = threading.Lock()
+
+    @property
+    def cache_dir(self) -> str:
+        return self._cache_dir
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl
+
+    def load(self, connector_name: str, domain: Optional[str] = None) -> Optional[ExchangeInfoCacheEntry]:
+        """
+        Returns the cached exchange information for the connector, or None if there is no valid entry
+        :param connector_name: the name of the connector
+        :param domain: the domain the connector is configured for
+        """
+        file_path = self._file_path(connector_name, domain)
+        try:
+            with open(file_path, "r") as cache_file:
+                data = json.load(cache_file)
+            if data.get("version") != CACHE_FORMAT_VERSION or time.time() - data["timestamp"] > self._ttl:
+                return None
+            trading_rules = data.get("trading_rules")
+            return ExchangeInfoCacheEntry(
+                timestamp=data["timestamp"],
+                trading_rules=(None
+                               if trading_rules is None
+                               else [self._trading_rule_from_json(rule) for rule in trading_rules]),
+                symbol_map=data.get("symbol_map"),
+            )
+        except FileNotFoundError:
+            return None
+        except Exception:
+            self.logger().warning(f"Ignoring invalid exchange info cache file {file_path}.", exc_info=True)
+            return None
+
+    def save(self,
+             connector_name: str,
+             domain: Optional[str] = None,
+             trading_rules: Optional[Iterable[TradingRule]] = None,
+             symbol_map: Optional[Mapping[str, str]] = None):
+        """
+        Stores the exchange information for the connector. The information not provided is kept from the current
+        entry (if it has not expired), so the trading rules and the symbol map can be stored independently.
+        :param connector_name: the name of the connector
+        :param domain: the domain the connector is configured for
+        :param trading_rules: the parsed trading rules
+        :param symbol_map: the map from exchange symbols to trading pairs
+        """
+        with self._save_lock:
+            current_entry = None
+            if trading_rules is None or symbol_map is None:
+                current_entry = self.load(connector_name=connector_name, domain=domain)
+            if trading_rules is None and current_entry is not None:
+                trading_rules = current_entry.trading_rules
+            if symbol_map is None and current_entry is not None:
+                symbol_map = current_entry.symbol_map
+
+            data = {
+                "version": CACHE_FORMAT_VERSION,
+                "timestamp": time.time(),
+                "trading_rules": (None
+                                  if trading_rules is None
+                                  else [self._trading_rule_to_json(rule) for rule in trading_rules]),
+                "symbol_map": None if symbol_map is None else dict(symbol_map),
+            }
+            file_path = self._file_path(connector_name, domain)
+            temp_file_path = f"{file_path}.tmp"
+            try:
+                os.makedirs(self._cache_dir, exist_ok=True)
+                with open(temp_file_path, "w") as cache_file:
+                    json.dump(data, cache_file)
+                # Replacing the file is atomic, a process reading the cache never sees a partially written entry
+                os.replace(temp_file_path, file_path)
+            except Exception:
+                self.logger().warning(f"Could not write exchange info cache file {file_path}.", exc_info=True)
+
+    async def save_async(self,
+                         connector_name: str,
+                         domain: Optional[str] = None,
+                         trading_rules: Optional[Iterable[TradingRule]] = None,
+                         symbol_map: Optional[Mapping[str, str]] = None):
+        """
+        Stores the exchange information for the connector like `save`, serializing and writing it in a thread of the
+        default executor. The trading rules and the symbol map are copied before, so they can change meanwhile.
+        :param connector_name: the name of the connector
+        :param domain: the domain the connector is configured for
+        :param trading_rules: the parsed trading rules
+        :param symbol_map: the map from exchange symbols to trading pairs
+        """
+        await asyncio.get_event_loop().run_in_executor(
+            None,
+            functools.partial(
+                self.save,
+                connector_name=connector_name,
+                domain=domain,
+                trading_rules=None if trading_rules is None else list(trading_rules),
+                symbol_map=None if symbol_map is None else dict(symbol_map)))
+
+    def invalidate(self, connector_name: str, domain: Optional[str] = None):
+        try:
+            os.remove(self._file_path(connector_name, domain))
+        except FileNotFoundError:
+            pass
+
+    def _file_path(self, connector_name: str, domain: Optional[str]) -> str:
+        file_name = connector_name if not domain or domain == connector_name else f"{connector_name}_{domain}"
+        return os.path.join(self._cache_dir, f"{file_name}.json")
+
+    @staticmethod
+    def _trading_rule_to_json(trading_rule: TradingRule) -> Dict[str, Any]:
+        rule_json = {field: str(getattr(trading_rule, field)) for field in _DECIMAL_RULE_FIELDS}
+        rule_json.update({
+            "trading_pair": trading_rule.trading_pair,
+            "supports_limit_orders": trading_rule.supports_limit_orders,
+            "supports_market_orders": trading_rule.supports_market_orders,
+            "buy_order_collateral_token": trading_rule.buy_order_collateral_token,
+            "sell_order_collateral_token": trading_rule.sell_order_collateral_token,
+        })
+        return rule_json
+
+    @staticmethod
+    def _trading_rule_from_json(rule_json: Dict[str, Any]) -> TradingRule:
+        return TradingRule(
+            trading_pair=rule_json["trading_pair"],
+            supports_limit_orders=rule_json["supports_limit_orders"],
+            supports_market_orders=rule_json["supports_market_orders"],
+            buy_order_collateral_token=rule_json["buy_order_collateral_token"],
+            sell_order_collateral_token=rule_json["sell_order_collateral_token"],
+            **{field: Decimal(rule_json[field]) for field in _DECIMAL_RULE_FIELDS},
+        )
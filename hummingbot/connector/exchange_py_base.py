@@ -1,16 +1,19 @@
 import asyncio
-import copy
 import logging
 import math
+import time
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, AsyncIterable, Callable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, AsyncIterable, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from async_timeout import timeout
+from bidict import bidict
 
+from hummingbot.connector.balance_ledger import BalanceLedger
 from hummingbot.connector.client_order_tracker import ClientOrderTracker
 from hummingbot.connector.constants import MINUTE, TWELVE_HOURS, s_decimal_0, s_decimal_NaN
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.exchange_info_cache import ExchangeInfoCache
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
@@ -28,6 +31,7 @@ from hummingbot.core.data_type.user_stream_tracker import UserStreamTracker
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
+from hummingbot.core.utils.order_latency_tracer import RESPONSE_RECEIVED, OrderLatencyTracer
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
@@ -45,6 +49,10 @@ class ExchangePyBase(ExchangeBase, ABC):
     TRADING_RULES_INTERVAL = 30 * MINUTE
     TRADING_FEES_INTERVAL = TWELVE_HOURS
     TICK_INTERVAL_LIMIT = 60.0
+    BALANCE_RECONCILIATION_INTERVAL = 60.0
+    # Startup steps the connector can start without: the trading fees are estimated from the fees configuration until
+    # they are updated, and the symbols map is loaded from the exchange info cache or requested when first needed
+    NON_CRITICAL_STARTUP_STEPS = ("trading_fees", "symbols_map")
 
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__(client_config_map)
@@ -60,6 +68,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._trading_rules_polling_task: Optional[asyncio.Task] = None
         self._trading_fees_polling_task: Optional[asyncio.Task] = None
         self._lost_orders_update_task: Optional[asyncio.Task] = None
+        # The time each startup step finished updating the information also updated by the polling loops
+        self._startup_steps_end_times: Dict[str, float] = {}
 
         self._time_synchronizer = TimeSynchronizer()
         self._throttler = AsyncThrottler(
@@ -83,6 +93,12 @@ class ExchangePyBase(ExchangeBase, ABC):
 
         self._order_tracker: ClientOrderTracker = self._create_order_tracker()
 
+        self._balance_ledger: Optional[BalanceLedger] = None
+        if self.use_balance_ledger:
+            self._balance_ledger = BalanceLedger(
+                connector=self, reconciliation_interval=self.BALANCE_RECONCILIATION_INTERVAL)
+            self._order_tracker.balance_ledger = self._balance_ledger
+
     @classmethod
     def logger(cls) -> HummingbotLogger:
         if cls._logger is None:
@@ -157,6 +173,18 @@ class ExchangePyBase(ExchangeBase, ABC):
     def in_flight_orders(self) -> Dict[str, InFlightOrder]:
         return self._order_tracker.active_orders
 
+    @property
+    def use_balance_ledger(self) -> bool:
+        """
+        Connectors that only get balance updates through REST requests can enable the balance ledger to keep the
+        balances updated locally with the orders and fills, requesting them to the exchange only to reconcile
+        """
+        return False
+
+    @property
+    def latency_tracer(self) -> OrderLatencyTracer:
+        return OrderLatencyTracer.for_connector(self.name)
+
     @property
     def trading_rules(self) -> Dict[str, TradingRule]:
         return self._trading_rules
@@ -221,7 +249,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         :param price: the starting point price
         """
         trading_rule = self._trading_rules[trading_pair]
-        return Decimal(trading_rule.min_price_increment)
+        return trading_rule.price_quantum
 
     def get_order_size_quantum(self, trading_pair: str, order_size: Decimal) -> Decimal:
         """
@@ -232,7 +260,63 @@ class ExchangePyBase(ExchangeBase, ABC):
         :param order_size: the starting point order price
         """
         trading_rule = self._trading_rules[trading_pair]
-        return Decimal(trading_rule.min_base_amount_increment)
+        return trading_rule.size_quantum
+
+    def quantize_order_price(self, trading_pair: str, price: Decimal) -> Decimal:
+        """
+        Applies trading rule to quantize order price, using the quantization table cached in the trading rule
+        unless the connector defines its own price quantum.
+
+        :param trading_pair: the trading pair of the order
+        :param price: the price to quantize
+        """
+        if self._uses_trading_rule_price_quantum():
+            return self._trading_rules[trading_pair].quantize_price(price)
+        return super().quantize_order_price(trading_pair, price)
+
+    def quantize_order_amount(self, trading_pair: str, amount: Decimal) -> Decimal:
+        """
+        Applies trading rule to quantize order amount, using the quantization table cached in the trading rule
+        unless the connector defines its own size quantum.
+
+        :param trading_pair: the trading pair of the order
+        :param amount: the amount to quantize
+        """
+        if self._uses_trading_rule_size_quantum():
+            return self._trading_rules[trading_pair].quantize_amount(amount)
+        return super().quantize_order_amount(trading_pair, amount)
+
+    def quantize_many(
+            self,
+            trading_pair: str,
+            prices: List[Decimal],
+            amounts: List[Decimal]) -> Tuple[List[Decimal], List[Decimal]]:
+        """
+        Applies trading rule to quantize all the prices and amounts of a proposal at once.
+
+        :param trading_pair: the trading pair of the orders
+        :param prices: the order prices
+        :param amounts: the order amounts
+        :return: a tuple with the list of quantized prices and the list of quantized amounts
+        """
+        if (self._uses_trading_rule_price_quantum()
+                and self._uses_trading_rule_size_quantum()
+                and type(self).quantize_order_price is ExchangePyBase.quantize_order_price
+                and type(self).quantize_order_amount is ExchangePyBase.quantize_order_amount):
+            return self._trading_rules[trading_pair].quantize_many(prices, amounts)
+        return super().quantize_many(trading_pair, prices, amounts)
+
+    def _uses_trading_rule_price_quantum(self) -> bool:
+        return type(self).get_order_price_quantum is ExchangePyBase.get_order_price_quantum
+
+    def _uses_trading_rule_size_quantum(self) -> bool:
+        return type(self).get_order_size_quantum is ExchangePyBase.get_order_size_quantum
+
+    def apply_balance_update_since_snapshot(self, currency: str, available_balance: Decimal) -> Decimal:
+        if self._balance_ledger is not None:
+            # The ledger has already applied the changes caused by the orders since the last balance update
+            return available_balance
+        return super().apply_balance_update_since_snapshot(currency, available_balance)
 
     def get_order_book(self, trading_pair: str) -> OrderBook:
         """
@@ -280,7 +364,7 @@ class ExchangePyBase(ExchangeBase, ABC):
             hbot_order_id_prefix=self.client_order_id_prefix,
             max_id_len=self.client_order_id_max_length
         )
-        safe_ensure_future(self._create_order(
+        create_order_task = safe_ensure_future(self._create_order(
             trade_type=TradeType.BUY,
             order_id=order_id,
             trading_pair=trading_pair,
@@ -288,6 +372,8 @@ class ExchangePyBase(ExchangeBase, ABC):
             order_type=order_type,
             price=price,
             **kwargs))
+        if OrderLatencyTracer.enabled:
+            self._record_order_decision(order_id=order_id, create_order_task=create_order_task)
         return order_id
 
     def sell(self,
@@ -310,7 +396,7 @@ class ExchangePyBase(ExchangeBase, ABC):
             hbot_order_id_prefix=self.client_order_id_prefix,
             max_id_len=self.client_order_id_max_length
         )
-        safe_ensure_future(self._create_order(
+        create_order_task = safe_ensure_future(self._create_order(
             trade_type=TradeType.SELL,
             order_id=order_id,
             trading_pair=trading_pair,
@@ -318,8 +404,23 @@ class ExchangePyBase(ExchangeBase, ABC):
             order_type=order_type,
             price=price,
             **kwargs))
+        if OrderLatencyTracer.enabled:
+            self._record_order_decision(order_id=order_id, create_order_task=create_order_task)
         return order_id
 
+    def _record_order_decision(self, order_id: str, create_order_task: asyncio.Task):
+        """
+        Registers the moment the strategy requested the creation of the order, for the order latency tracing. The
+        decision is moved to the latency trace of the order when it starts being tracked, and it is discarded once the
+        order creation ends in case the order could not be tracked (e.g. the creation failed before tracking it).
+
+        :param order_id: the client id of the order
+        :param create_order_task: the task creating the order
+        """
+        latency_tracer = self.latency_tracer
+        latency_tracer.record_decision(order_id)
+        create_order_task.add_done_callback(lambda _: latency_tracer.discard_decision(order_id))
+
     def get_fee(self,
                 base_currency: str,
                 quote_currency: str,
@@ -448,8 +549,13 @@ class ExchangePyBase(ExchangeBase, ABC):
                                   f"created. Increase the amount or the price to be higher than the minimum notional.")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
             return
+        latency_trace = order.latency_trace
+        latency_trace_token = (
+            OrderLatencyTracer.set_current_trace(latency_trace) if latency_trace is not None else None)
         try:
             await self._place_order_and_process_update(order=order, **kwargs,)
+            if latency_trace is not None:
+                latency_trace.stamp(RESPONSE_RECEIVED)
 
         except asyncio.CancelledError:
             raise
@@ -464,6 +570,9 @@ class ExchangePyBase(ExchangeBase, ABC):
                 exception=ex,
                 **kwargs,
             )
+        finally:
+            if latency_trace_token is not None:
+                OrderLatencyTracer.reset_current_trace(latency_trace_token)
 
     async def _place_order_and_process_update(self, order: InFlightOrder, **kwargs) -> str:
         exchange_order_id, update_timestamp = await self._place_order(
@@ -660,12 +769,16 @@ class ExchangePyBase(ExchangeBase, ABC):
     async def start_network(self):
         """
         Start all required tasks to update the status of the connector. Those tasks include:
+        - Loading the trading rules and symbols map from the exchange info cache (if enabled)
         - The order book tracker
         - The polling loops to update the trading rules and trading fees
         - The polling loop to update order status and balance status using REST API (backup for main update process)
         - The background task to process the events received through the user stream tracker (websocket connection)
         """
         self._stop_network()
+        # The cached exchange information makes the connector ready without waiting for the first trading rules
+        # request, that is still performed in the background by the trading rules polling loop
+        self._load_exchange_info_from_cache()
         self.order_book_tracker.start()
         if self.is_trading_required:
             self._trading_rules_polling_task = safe_ensure_future(self._trading_rules_polling_loop())
@@ -675,6 +788,44 @@ class ExchangePyBase(ExchangeBase, ABC):
             self._user_stream_event_listener_task = safe_ensure_future(self._user_stream_event_listener())
             self._lost_orders_update_task = safe_ensure_future(self._lost_orders_update_polling_loop())
 
+    def startup_steps(self) -> List[Tuple[str, Callable[[], Awaitable], Tuple[str, ...]]]:
+        """
+        Returns the initialization steps that can be executed before the network is started, to have the connector
+        ready as soon as it starts (the polling loops started with the network keep the information updated).
+        Used by the StartupOrchestrator to run the steps of all connectors concurrently.
+
+        :return: a list of tuples with the step name, the coroutine function executing it and the names of the
+            steps it depends on
+        """
+        if not self.is_trading_required:
+            return [("symbols_map", self._initialize_trading_pair_symbol_map, ())]
+        return [
+            ("time_synchronizer", self._update_time_synchronizer, ()),
+            # Updating the trading rules also initializes the symbols map
+            ("trading_rules", self._polled_startup_step("trading_rules", self._update_trading_rules), ()),
+            ("trading_fees", self._polled_startup_step("trading_fees", self._update_trading_fees), ()),
+            ("balances", self._polled_startup_step("balances", self._request_all_balances), ("time_synchronizer",)),
+        ]
+
+    def _polled_startup_step(self, name: str, function: Callable[[], Awaitable]) -> Callable[[], Awaitable]:
+        """
+        Wraps a startup step updating information that is also updated by a polling loop, registering when the step
+        finished so the polling loop can skip its first update (see `_updated_by_startup_step`)
+        """
+        async def startup_step():
+            await function()
+            self._startup_steps_end_times[name] = time.monotonic()
+
+        return startup_step
+
+    def _updated_by_startup_step(self, name: str, interval: float) -> bool:
+        """
+        Returns True if the startup step finished less than `interval` seconds ago. Only the first call after the step
+        can return True, so only the first update of the polling loops is skipped.
+        """
+        end_time = self._startup_steps_end_times.pop(name, None)
+        return end_time is not None and time.monotonic() - end_time < interval
+
     async def stop_network(self):
         """
         This function is executed when the connector is stopped. It perform a general cleanup and stops all background
@@ -729,7 +880,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         while True:
             try:
-                await safe_gather(self._update_trading_rules())
+                if not self._updated_by_startup_step("trading_rules", self.TRADING_RULES_INTERVAL):
+                    await safe_gather(self._update_trading_rules())
                 await self._sleep(self.TRADING_RULES_INTERVAL)
             except NotImplementedError:
                 raise
@@ -749,7 +901,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         while True:
             try:
-                await safe_gather(self._update_trading_fees())
+                if not self._updated_by_startup_step("trading_fees", self.TRADING_FEES_INTERVAL):
+                    await safe_gather(self._update_trading_fees())
                 await self._sleep(self.TRADING_FEES_INTERVAL)
             except NotImplementedError:
                 raise
@@ -857,6 +1010,37 @@ class ExchangePyBase(ExchangeBase, ABC):
         for trading_rule in trading_rules_list:
             self._trading_rules[trading_rule.trading_pair] = trading_rule
         self._initialize_trading_pair_symbols_from_exchange_info(exchange_info=exchange_info)
+        await self._save_exchange_info_to_cache(trading_rules=trading_rules_list)
+
+    def _load_exchange_info_from_cache(self) -> bool:
+        """
+        Initializes the trading rules and the trading pairs symbol map with the information stored in the exchange
+        info cache. The information already loaded in the connector is not replaced.
+
+        :return: True if the cache had valid information for the connector, False otherwise
+        """
+        cache = ExchangeInfoCache.get_instance()
+        if cache is None:
+            return False
+        entry = cache.load(connector_name=self.name, domain=self.domain)
+        if entry is None:
+            return False
+        if entry.trading_rules is not None and len(self._trading_rules) == 0:
+            for trading_rule in entry.trading_rules:
+                self._trading_rules[trading_rule.trading_pair] = trading_rule
+        if entry.symbol_map and not self.trading_pair_symbol_map_ready():
+            self._set_trading_pair_symbol_map(bidict(entry.symbol_map))
+        return True
+
+    async def _save_exchange_info_to_cache(self, trading_rules: Optional[List[TradingRule]] = None):
+        cache = ExchangeInfoCache.get_instance()
+        # The readiness check prevents trading_pair_symbol_map from trying to initialize the map
+        if cache is not None and self.trading_pair_symbol_map_ready():
+            await cache.save_async(
+                connector_name=self.name,
+                domain=self.domain,
+                trading_rules=trading_rules,
+                symbol_map=await self.trading_pair_symbol_map())
 
     async def _api_get(self, *args, **kwargs):
         kwargs["method"] = RESTMethod.GET
@@ -937,11 +1121,12 @@ class ExchangePyBase(ExchangeBase, ABC):
 
     async def _update_all_balances(self):
         try:
-            await self._update_balances()
-            if not self.real_time_balance_update:
-                # This is only required for exchanges that do not provide balance update notifications through websocket
-                self._in_flight_orders_snapshot = {k: copy.copy(v) for k, v in self.in_flight_orders.items()}
-                self._in_flight_orders_snapshot_timestamp = self.current_timestamp
+            if self._updated_by_startup_step("balances", self.SHORT_POLL_INTERVAL):
+                return
+            if (self._balance_ledger is not None
+                    and not self._balance_ledger.is_reconciliation_required(self.current_timestamp)):
+                return
+            await self._request_all_balances()
         except asyncio.CancelledError:
             raise
         except Exception as request_error:
@@ -950,6 +1135,21 @@ class ExchangePyBase(ExchangeBase, ABC):
                 exc_info=request_error,
             )
 
+    async def _request_all_balances(self):
+        """
+        Requests the balances to the exchange, and reconciles the balance ledger or takes the snapshot of the in flight
+        orders the balances correspond to. Used by the polling loop and by the balances startup step.
+        """
+        if self._balance_ledger is not None:
+            self._balance_ledger.start_balances_request()
+        await self._update_balances()
+        if self._balance_ledger is not None:
+            self._balance_ledger.reconcile(self.current_timestamp)
+        elif not self.real_time_balance_update:
+            # This is only required for exchanges that do not provide balance update notifications through websocket
+            self._in_flight_orders_snapshot = InFlightOrder.copy_on_write_snapshot(self.in_flight_orders)
+            self._in_flight_orders_snapshot_timestamp = self.current_timestamp
+
     async def _update_orders_fills(self, orders: List[InFlightOrder]):
         for order in orders:
             try:
@@ -1070,9 +1270,12 @@ class ExchangePyBase(ExchangeBase, ABC):
         return ClientOrderTracker(connector=self)
 
     async def _initialize_trading_pair_symbol_map(self):
+        if self._load_exchange_info_from_cache() and self.trading_pair_symbol_map_ready():
+            return
         try:
             exchange_info = await self._make_trading_pairs_request()
             self._initialize_trading_pair_symbols_from_exchange_info(exchange_info=exchange_info)
+            await self._save_exchange_info_to_cache()
         except Exception:
             self.logger().exception("There was an error requesting exchange info.")
 
@@ -9,6 +9,7 @@ from shutil import move
 from typing import Dict, List, Optional, Tuple, Union
 
 import pandas as pd
+from sqlalchemy import false, func, true
 from sqlalchemy.orm import Query, Session
 
 from hummingbot import data_path
@@ -16,7 +17,6 @@ from hummingbot.client.config.client_config_map import MarketDataCollectionConfi
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.connector.utils import TradeFillOrderDetails
 from hummingbot.core.data_type.common import PriceType
-from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
     BuyOrderCreatedEvent,
@@ -34,6 +34,7 @@ from hummingbot.core.event.events import (
     SellOrderCompletedEvent,
     SellOrderCreatedEvent,
 )
+from hummingbot.core.event.side_channel_event_bus import SideChannelEventBus, SideChannelEventForwarder
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.controllers import Controllers
 from hummingbot.model.executors import Executors
@@ -96,20 +97,28 @@ class MarketsRecorder:
             exchange_order_ids = self.get_orders_for_config_and_market(self._config_file_path, market, True, 2000)
             market.add_exchange_order_ids_from_market_recorder({o.exchange_order_id: o.id for o in exchange_order_ids})
 
-        self._create_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_create_order)
-        self._fill_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_fill_order)
-        self._cancel_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_cancel_order)
-        self._fail_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_fail_order)
-        self._complete_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_complete_order)
-        self._expire_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_expire_order)
-        self._funding_payment_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(
-            self._did_complete_funding_payment)
-        self._update_range_position_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(
-            self._did_update_range_position)
-        self._close_range_position_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(
-            self._did_close_position)
-
-        self._event_pairs: List[Tuple[MarketEvent, SourceInfoEventForwarder]] = [
+        # The records are written to the database outside of the connectors event dispatch, but the events are never
+        # dropped (the recording is synchronous when the side channel event bus is full)
+        self._create_order_forwarder: SideChannelEventForwarder = SideChannelEventForwarder(
+            self._did_create_order, name="MarketsRecorder")
+        self._fill_order_forwarder: SideChannelEventForwarder = SideChannelEventForwarder(
+            self._did_fill_order, name="MarketsRecorder")
+        self._cancel_order_forwarder: SideChannelEventForwarder = SideChannelEventForwarder(
+            self._did_cancel_order, name="MarketsRecorder")
+        self._fail_order_forwarder: SideChannelEventForwarder = SideChannelEventForwarder(
+            self._did_fail_order, name="MarketsRecorder")
+        self._complete_order_forwarder: SideChannelEventForwarder = SideChannelEventForwarder(
+            self._did_complete_order, name="MarketsRecorder")
+        self._expire_order_forwarder: SideChannelEventForwarder = SideChannelEventForwarder(
+            self._did_expire_order, name="MarketsRecorder")
+        self._funding_payment_forwarder: SideChannelEventForwarder = SideChannelEventForwarder(
+            self._did_complete_funding_payment, name="MarketsRecorder")
+        self._update_range_position_forwarder: SideChannelEventForwarder = SideChannelEventForwarder(
+            self._did_update_range_position, name="MarketsRecorder")
+        self._close_range_position_forwarder: SideChannelEventForwarder = SideChannelEventForwarder(
+            self._did_close_position, name="MarketsRecorder")
+
+        self._event_pairs: List[Tuple[MarketEvent, SideChannelEventForwarder]] = [
             (MarketEvent.BuyOrderCreated, self._create_order_forwarder),
             (MarketEvent.SellOrderCreated, self._create_order_forwarder),
             (MarketEvent.OrderFilled, self._fill_order_forwarder),
@@ -186,6 +195,8 @@ class MarketsRecorder:
             self._start_market_data_recording()
 
     def stop(self):
+        # Record the events still waiting in the side channel event bus
+        SideChannelEventBus.get_instance().flush()
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.remove_listener(event_pair[0], event_pair[1])
@@ -228,6 +239,32 @@ class MarketsRecorder:
             executors = session.query(Executors).filter(Executors.controller_id == controller_id).all()
             return [executor.to_executor_info() for executor in executors]
 
+    def get_closed_executors_performance(self) -> List[Tuple[Optional[str], Optional[int], float, float, int]]:
+        """
+        Aggregates the closed executors stored, by controller and close type.
+
+        :return: a list of (controller id, close type, sum of the net pnl quote, sum of the filled amount quote,
+        number of executors) tuples
+        """
+        with self._sql_manager.get_new_session() as session:
+            rows = (session.query(Executors.controller_id,
+                                  Executors.close_type,
+                                  func.sum(Executors.net_pnl_quote),
+                                  func.sum(Executors.filled_amount_quote),
+                                  func.count(Executors.id))
+                    .filter(Executors.is_active == false())
+                    .group_by(Executors.controller_id, Executors.close_type)
+                    .all())
+            return [tuple(row) for row in rows]
+
+    def get_active_executors(self) -> List[ExecutorInfo]:
+        """
+        Returns the executors stored while they were still active (e.g. when the strategy was stopped)
+        """
+        with self._sql_manager.get_new_session() as session:
+            executors = session.query(Executors).filter(Executors.is_active == true()).all()
+            return [executor.to_executor_info() for executor in executors]
+
     def get_orders_for_config_and_market(self, config_file_path: str, market: ConnectorBase,
                                          with_exchange_order_id_present: Optional[bool] = False,
                                          number_of_rows: Optional[int] = None) -> List[Order]:
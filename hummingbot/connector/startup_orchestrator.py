@@ -0,0 +1,222 @@
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from hummingbot.logger import HummingbotLogger
+
+so_logger = None
+
+StartupStepFunction = Callable[[], Awaitable]
+
+
+class StartupStepStatus:
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+
+
+class StartupStep:
+    """
+    One step of the startup of a connector, with the steps of the same connector it depends on and its timing
+    """
+
+    def __init__(self,
+                 connector_name: str,
+                 name: str,
+                 function: StartupStepFunction,
+                 dependencies: Sequence[str] = (),
+                 critical: bool = True):
+        self.connector_name = connector_name
+        self.name = name
+        self.function = function
+        self.dependencies = tuple(dependencies)
+        self.critical = critical
+        self.status = StartupStepStatus.PENDING
+        self.start_time: Optional[float] = None
+        self.end_time: Optional[float] = None
+        self.error: Optional[str] = None
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        return self.connector_name, self.name
+
+    @property
+    def duration(self) -> Optional[float]:
+        if self.start_time is None or self.end_time is None:
+            return None
+        return self.end_time - self.start_time
+
+
+class StartupOrchestrator:
+    """
+    Runs the startup steps of several connectors (time synchronization, trading rules, symbols map, balances...)
+    as a dependency graph: every step starts as soon as the steps it depends on are done, so the steps of different
+    connectors, and the independent steps of the same connector, run concurrently.
+
+    The requests of each step go through the connector throttler, so the exchange rate limits are respected. The
+    number of steps running at the same time can also be limited with `max_concurrent_steps`.
+
+    A failing step does not stop the startup (the connector polling loops retry the updates later), but the steps
+    depending on it are skipped. The steps the connectors can start without (non critical steps) have a shorter
+    timeout, so they do not delay the startup when the exchange is slow to answer.
+    """
+    STEP_TIMEOUT = 30.0
+    NON_CRITICAL_STEP_TIMEOUT = 5.0
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global so_logger
+        if so_logger is None:
+            so_logger = logging.getLogger(__name__)
+        return so_logger
+
+    def __init__(self,
+                 max_concurrent_steps: Optional[int] = None,
+                 step_timeout: float = STEP_TIMEOUT,
+                 non_critical_step_timeout: float = NON_CRITICAL_STEP_TIMEOUT):
+        self._steps: Dict[Tuple[str, str], StartupStep] = {}
+        self._semaphore = asyncio.Semaphore(max_concurrent_steps) if max_concurrent_steps else None
+        self._step_timeout = step_timeout
+        self._non_critical_step_timeout = non_critical_step_timeout
+        self._start_time: Optional[float] = None
+        self._end_time: Optional[float] = None
+        self._ready_time: Optional[float] = None
+
+    @property
+    def steps(self) -> List[StartupStep]:
+        return list(self._steps.values())
+
+    @property
+    def start_time(self) -> Optional[float]:
+        return self._start_time
+
+    @property
+    def duration(self) -> Optional[float]:
+        if self._start_time is None or self._end_time is None:
+            return None
+        return self._end_time - self._start_time
+
+    @property
+    def time_to_ready(self) -> Optional[float]:
+        """
+        The time since the startup began until all the connectors reported to be ready
+        """
+        if self._start_time is None or self._ready_time is None:
+            return None
+        return self._ready_time - self._start_time
+
+    def record_ready(self):
+        self._ready_time = time.perf_counter()
+
+    def add_step(self,
+                 connector_name: str,
+                 name: str,
+                 function: StartupStepFunction,
+                 dependencies: Sequence[str] = (),
+                 critical: bool = True):
+        """
+        Registers a step
+        :param connector_name: the name of the connector the step belongs to
+        :param name: the name of the step, unique per connector
+        :param function: the coroutine function performing the step
+        :param dependencies: the names of the steps of the same connector that have to finish before this one starts
+        :param critical: False if the connector can start without the step, to run it with the non critical timeout
+        """
+        step = StartupStep(connector_name=connector_name,
+                           name=name,
+                           function=function,
+                           dependencies=dependencies,
+                           critical=critical)
+        if step.key in self._steps:
+            raise ValueError(f"The step {name} is already registered for {connector_name}.")
+        self._steps[step.key] = step
+
+    def add_connector(self, connector):
+        """
+        Registers the startup steps of a connector. Connectors not providing startup steps are ignored.
+        """
+        from hummingbot.connector.exchange_py_base import ExchangePyBase
+
+        if isinstance(connector, ExchangePyBase):
+            for name, function, dependencies in connector.startup_steps():
+                self.add_step(connector_name=connector.name,
+                              name=name,
+                              function=function,
+                              dependencies=dependencies,
+                              critical=name not in connector.NON_CRITICAL_STARTUP_STEPS)
+
+    async def run(self):
+        """
+        Runs all the registered steps and waits until all of them have finished (successfully or not)
+        """
+        self._validate_dependencies()
+        self._start_time = time.perf_counter()
+        tasks: Dict[Tuple[str, str], asyncio.Task] = {}
+        for key, step in self._steps.items():
+            tasks[key] = asyncio.ensure_future(self._run_step(step=step, tasks=tasks))
+        try:
+            await asyncio.gather(*tasks.values())
+        finally:
+            for task in tasks.values():
+                task.cancel()
+            self._end_time = time.perf_counter()
+
+    def _validate_dependencies(self):
+        # Steps already verified to be free of cycles
+        verified = set()
+        for step in self._steps.values():
+            pending = [(step, iter(step.dependencies))]
+            while pending:
+                current, dependencies = pending[-1]
+                dependency = next(dependencies, None)
+                if dependency is None:
+                    verified.add(current.key)
+                    pending.pop()
+                    continue
+                dependency_key = (current.connector_name, dependency)
+                if dependency_key not in self._steps:
+                    raise ValueError(f"The step {current.name} of {current.connector_name} depends on the unknown "
+                                     f"step {dependency}.")
+                if dependency_key in verified:
+                    continue
+                if any(pending_step.key == dependency_key for pending_step, _ in pending):
+                    raise ValueError(f"The startup steps of {current.connector_name} have a circular dependency "
+                                     f"({current.name} -> {dependency}).")
+                dependency_step = self._steps[dependency_key]
+                pending.append((dependency_step, iter(dependency_step.dependencies)))
+
+    async def _run_step(self, step: StartupStep, tasks: Dict[Tuple[str, str], asyncio.Task]):
+        # All the tasks are created before any of them runs, so the tasks of the dependencies are always available
+        for dependency in step.dependencies:
+            await asyncio.shield(tasks[(step.connector_name, dependency)])
+            if self._steps[(step.connector_name, dependency)].status != StartupStepStatus.DONE:
+                step.status = StartupStepStatus.SKIPPED
+                step.error = f"{dependency} did not complete"
+                return
+
+        if self._semaphore is not None:
+            await self._semaphore.acquire()
+        try:
+            step.status = StartupStepStatus.RUNNING
+            step.start_time = time.perf_counter()
+            timeout = self._step_timeout if step.critical else self._non_critical_step_timeout
+            await asyncio.wait_for(step.function(), timeout=timeout)
+            step.status = StartupStepStatus.DONE
+        except asyncio.CancelledError:
+            raise
+        except asyncio.TimeoutError:
+            step.status = StartupStepStatus.FAILED
+            step.error = "timeout"
+            self.logger().warning(f"The startup step {step.name} of {step.connector_name} timed out.")
+        except Exception as exception:
+            step.status = StartupStepStatus.FAILED
+            step.error = str(exception)
+            self.logger().warning(f"The startup step {step.name} of {step.connector_name} failed ({exception}).",
+                                  exc_info=True)
+        finally:
+            step.end_time = time.perf_counter()
+            if self._semaphore is not None:
+                self._semaphore.release()
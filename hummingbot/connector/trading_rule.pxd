@@ -13,3 +13,11 @@ cdef class TradingRule:
         public bint supports_market_orders             # if market order is allowed for this trading pair
         public object buy_order_collateral_token       # Indicates the collateral token used for buy orders
         public object sell_order_collateral_token      # Indicates the collateral token used for sell orders
+        object _price_quantum_source
+        object _price_quantum
+        object _price_quantize_exponent
+        object _size_quantum_source
+        object _size_quantum
+        object _size_quantize_exponent
+
+    cdef _refresh_quantization_table(self)
@@ -1,5 +1,5 @@
-from decimal import Decimal
-from typing import Optional
+from decimal import ROUND_DOWN, Decimal
+from typing import List, Optional, Sequence, Tuple
 
 from hummingbot.connector.utils import split_hb_trading_pair
 
@@ -8,6 +8,21 @@ s_decimal_max = Decimal("1e56")
 s_decimal_min = Decimal(1) / s_decimal_max
 
 
+cdef object _quantize_exponent(object quantum):
+    # Decimal.quantize only matches (value // quantum) * quantum when the quantum is an exact power of ten
+    if quantum.is_finite() and quantum > s_decimal_0 and quantum.as_tuple().digits == (1,):
+        return quantum
+    return None
+
+
+cdef object _quantize(object value, object quantum, object exponent):
+    if value.is_nan():
+        return value
+    if exponent is not None and value.is_finite():
+        return value.quantize(exponent, rounding=ROUND_DOWN)
+    return (value // quantum) * quantum
+
+
 cdef class TradingRule:
     def __init__(self,
                  trading_pair: str,
@@ -38,6 +53,63 @@ cdef class TradingRule:
         self.buy_order_collateral_token = buy_order_collateral_token or quote_token
         self.sell_order_collateral_token = sell_order_collateral_token or quote_token
 
+    cdef _refresh_quantization_table(self):
+        # The derived values are calculated on first use, and again only if the increments are replaced in the rule
+        if self._price_quantum_source is not self.min_price_increment:
+            self._price_quantum_source = self.min_price_increment
+            self._price_quantum = Decimal(self.min_price_increment)
+            self._price_quantize_exponent = _quantize_exponent(self._price_quantum)
+        if self._size_quantum_source is not self.min_base_amount_increment:
+            self._size_quantum_source = self.min_base_amount_increment
+            self._size_quantum = Decimal(self.min_base_amount_increment)
+            self._size_quantize_exponent = _quantize_exponent(self._size_quantum)
+
+    @property
+    def price_quantum(self) -> Decimal:
+        self._refresh_quantization_table()
+        return self._price_quantum
+
+    @property
+    def size_quantum(self) -> Decimal:
+        self._refresh_quantization_table()
+        return self._size_quantum
+
+    def quantize_price(self, price: Decimal) -> Decimal:
+        """
+        Rounds the price down to a multiple of min_price_increment
+        """
+        self._refresh_quantization_table()
+        return _quantize(price, self._price_quantum, self._price_quantize_exponent)
+
+    def quantize_amount(self, amount: Decimal) -> Decimal:
+        """
+        Rounds the amount down to a multiple of min_base_amount_increment
+        """
+        self._refresh_quantization_table()
+        return _quantize(amount, self._size_quantum, self._size_quantize_exponent)
+
+    def quantize_many(self,
+                      prices: Sequence[Decimal],
+                      amounts: Sequence[Decimal]) -> Tuple[List[Decimal], List[Decimal]]:
+        """
+        Quantizes all the prices and amounts of a proposal in one call
+        :param prices: the prices to round down to a multiple of min_price_increment
+        :param amounts: the amounts to round down to a multiple of min_base_amount_increment
+        :return: a tuple with the list of quantized prices and the list of quantized amounts
+        """
+        cdef:
+            object price_quantum
+            object price_exponent
+            object size_quantum
+            object size_exponent
+        self._refresh_quantization_table()
+        price_quantum = self._price_quantum
+        price_exponent = self._price_quantize_exponent
+        size_quantum = self._size_quantum
+        size_exponent = self._size_quantize_exponent
+        return ([_quantize(price, price_quantum, price_exponent) for price in prices],
+                [_quantize(amount, size_quantum, size_exponent) for amount in amounts])
+
     def __repr__(self) -> str:
         return f"TradingRule(trading_pair='{self.trading_pair}', " \
                f"min_order_size={self.min_order_size}, " \
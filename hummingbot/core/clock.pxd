@@ -1,5 +1,8 @@
 # distutils: language=c++
 
+from libc.stdint cimport int64_t
+
+
 cdef class Clock:
     cdef:
         object _clock_mode
@@ -10,3 +13,24 @@ cdef class Clock:
         list _current_context
         double _current_tick
         bint _started
+        bint _event_driven
+        double _tick_origin
+        list _tick_queue
+        dict _schedules
+        int64_t _next_sequence
+        list _requested_ticks
+        object _wakeup_future
+        object _instrumentation
+
+    cdef int64_t c_tick_index(self, double timestamp)
+    cdef c_schedule_iterator(self, object iterator)
+    cdef c_reschedule_all(self)
+    cdef int64_t c_next_due_tick_index(self, int64_t tick_index)
+    cdef int64_t c_next_event_tick_index(self, int64_t tick_index)
+    cdef int64_t c_tick_index_ceil(self, double timestamp)
+    cdef list c_pop_due_iterators(self, int64_t tick_index)
+    cdef list c_pop_requested_iterators(self)
+    cdef c_request_tick(self, object iterator)
+    cdef c_tick_iterator(self, object iterator)
+    cdef c_backtest_tick_iterators(self, list iterators)
+    cdef c_event_driven_backtest_til(self, double timestamp)
@@ -1,19 +1,80 @@
 # distutils: language=c++
 
 import asyncio
+import heapq
 import logging
+import math
 import time
-from typing import List
+from operator import attrgetter
+from typing import List, Optional
 
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.utils.clock_instrumentation import ClockInstrumentation
 from hummingbot.logger import HummingbotLogger
 
 s_logger = None
 
 
+cdef class _IteratorSchedule:
+    """
+    The tick schedule of one iterator of the clock, in clock ticks
+    """
+    cdef:
+        public object iterator
+        public int64_t sequence
+        public int64_t period_ticks
+        public int64_t phase_ticks
+        public int64_t next_tick_index
+        public bint every_step
+
+    def __init__(self,
+                 iterator: TimeIterator,
+                 int64_t sequence,
+                 int64_t period_ticks,
+                 int64_t phase_ticks,
+                 bint every_step = False):
+        self.iterator = iterator
+        self.sequence = sequence
+        self.period_ticks = period_ticks
+        self.phase_ticks = phase_ticks
+        self.next_tick_index = 0
+        # In event driven back testing, the iterators without tick period are ticked at every step of the clock
+        self.every_step = every_step
+
+    cdef int64_t c_next_tick_index_after(self, int64_t tick_index):
+        # The first tick after tick_index that is `phase_ticks` after a multiple of the period
+        return tick_index + 1 + (self.phase_ticks - (tick_index + 1)) % self.period_ticks
+
+
+def _resolve_wakeup_future(future: asyncio.Future):
+    if not future.done():
+        future.set_result(None)
+
+
 cdef class Clock:
+    """
+    Ticks the time iterators (connectors, strategies...) periodically, either in real time or as fast as possible in
+    back testing mode.
+
+    The tick size is the resolution of the clock. Each iterator is ticked every clock tick by default, or every
+    `tick_period` seconds if the iterator declares a period (see `TimeIterator.set_tick_period`). The clock keeps the
+    iterators in a timer queue ordered by their next tick, so only the iterators that are due are ticked, and in real
+    time mode the clock sleeps until the next tick where some iterator is due. The iterators due on the same tick are
+    ticked in the order they were added to the clock.
+
+    Iterators can also request an out-of-band tick (see `TimeIterator.request_tick`), for example when an order is
+    filled. The clock wakes up and ticks them right away, without changing their regular schedule.
+
+    When an instrumentation is attached (see `set_instrumentation`), the clock records the duration of the ticks of
+    each iterator, how late the ticks start and the ticks missed because the clock was late.
+
+    In event driven back testing mode, the clock does not step through every tick. It jumps to the next tick where
+    something happens: either a data source iterator has an event (see `TimeIterator.next_event_timestamp`) or an
+    iterator with a tick period is due. The iterators without tick period (e.g. the strategies) are ticked at each of
+    those steps. Events between two ticks are processed on the following tick, like in regular back testing.
+    """
     @classmethod
     def logger(cls) -> HummingbotLogger:
         global s_logger
@@ -21,14 +82,24 @@ cdef class Clock:
             s_logger = logging.getLogger(__name__)
         return s_logger
 
-    def __init__(self, clock_mode: ClockMode, tick_size: float = 1.0, start_time: float = 0.0, end_time: float = 0.0):
+    def __init__(self,
+                 clock_mode: ClockMode,
+                 tick_size: float = 1.0,
+                 start_time: float = 0.0,
+                 end_time: float = 0.0,
+                 event_driven: bool = False):
         """
         :param clock_mode: either real time mode or back testing mode
         :param tick_size: time interval of each tick
         :param start_time: (back testing mode only) start of simulation in UNIX timestamp
         :param end_time: (back testing mode only) end of simulation in UNIX timestamp. NaN to simulate to end of data.
+        :param event_driven: (back testing mode only) jump to the next tick where something happens instead of
+        stepping through every tick
         """
+        if event_driven and clock_mode is not ClockMode.BACKTEST:
+            raise ValueError("The event driven mode is only available in back testing mode.")
         self._clock_mode = clock_mode
+        self._event_driven = event_driven
         self._tick_size = tick_size
         self._start_time = start_time
         self._end_time = end_time
@@ -36,11 +107,23 @@ cdef class Clock:
         self._child_iterators = []
         self._current_context = None
         self._started = False
+        # The tick indexes are counted from the start time in back testing mode, and from the epoch in real time mode
+        self._tick_origin = start_time if clock_mode is ClockMode.BACKTEST else 0.0
+        self._tick_queue = []
+        self._schedules = {}
+        self._next_sequence = 0
+        self._requested_ticks = []
+        self._wakeup_future = None
+        self._instrumentation = None
 
     @property
     def clock_mode(self) -> ClockMode:
         return self._clock_mode
 
+    @property
+    def event_driven(self) -> bool:
+        return self._event_driven
+
     @property
     def start_time(self) -> float:
         return self._start_time
@@ -57,6 +140,16 @@ cdef class Clock:
     def current_timestamp(self) -> float:
         return self._current_tick
 
+    @property
+    def instrumentation(self) -> Optional[ClockInstrumentation]:
+        return self._instrumentation
+
+    def set_instrumentation(self, instrumentation: Optional[ClockInstrumentation]):
+        """
+        Starts recording the tick statistics of the iterators in the instrumentation, or stops recording them if None
+        """
+        self._instrumentation = instrumentation
+
     def __enter__(self) -> Clock:
         if self._current_context is not None:
             raise EnvironmentError("Clock context is not re-entrant.")
@@ -75,12 +168,153 @@ cdef class Clock:
         if self._started:
             (<TimeIterator>iterator).c_start(self, self._current_tick)
         self._child_iterators.append(iterator)
+        self.c_schedule_iterator(iterator)
 
     def remove_iterator(self, iterator: TimeIterator):
         if self._current_context is not None and iterator in self._current_context:
             (<TimeIterator>iterator).c_stop(self)
             self._current_context.remove(iterator)
         self._child_iterators.remove(iterator)
+        if iterator not in self._child_iterators:
+            # The entries of the iterator in the timer queue are discarded when they are due
+            self._schedules.pop(iterator, None)
+            if iterator in self._requested_ticks:
+                self._requested_ticks.remove(iterator)
+
+    def request_tick(self, iterator: TimeIterator):
+        """
+        Ticks the iterator as soon as possible, out of its regular schedule. In back testing mode the iterator is
+        ticked right after the current tick, with the same timestamp.
+        """
+        self.c_request_tick(iterator)
+
+    def next_tick_time(self, iterator: TimeIterator) -> float:
+        """
+        Returns the timestamp of the next regular tick of the iterator, or NaN if the iterator is not in the clock
+        """
+        schedule = self._schedules.get(iterator)
+        if schedule is None:
+            return float("nan")
+        return self._tick_origin + (<_IteratorSchedule>schedule).next_tick_index * self._tick_size
+
+    cdef int64_t c_tick_index(self, double timestamp):
+        # The tolerance avoids rounding a tick timestamp down to the previous tick because of the float precision
+        return <int64_t>math.floor((timestamp - self._tick_origin) / self._tick_size + 1e-6)
+
+    cdef c_schedule_iterator(self, object iterator):
+        cdef:
+            TimeIterator typed_iterator = iterator
+            int64_t period_ticks = 1
+            int64_t phase_ticks = 0
+            _IteratorSchedule schedule
+
+        if typed_iterator._tick_period > 0:
+            period_ticks = max(1, <int64_t>round(typed_iterator._tick_period / self._tick_size))
+            phase_ticks = (<int64_t>round(typed_iterator._tick_phase / self._tick_size)) % period_ticks
+        schedule = _IteratorSchedule(iterator,
+                                     self._next_sequence,
+                                     period_ticks,
+                                     phase_ticks,
+                                     every_step=self._event_driven and typed_iterator._tick_period <= 0)
+        self._next_sequence += 1
+        schedule.next_tick_index = schedule.c_next_tick_index_after(self.c_tick_index(self._current_tick))
+        self._schedules[iterator] = schedule
+        if not schedule.every_step:
+            heapq.heappush(self._tick_queue, (schedule.next_tick_index, schedule.sequence, schedule))
+
+    cdef c_reschedule_all(self):
+        cdef:
+            int64_t tick_index = self.c_tick_index(self._current_tick)
+            _IteratorSchedule schedule
+
+        self._tick_queue = []
+        for schedule in self._schedules.values():
+            schedule.next_tick_index = schedule.c_next_tick_index_after(tick_index)
+            if not schedule.every_step:
+                self._tick_queue.append((schedule.next_tick_index, schedule.sequence, schedule))
+        heapq.heapify(self._tick_queue)
+
+    cdef int64_t c_next_due_tick_index(self, int64_t tick_index):
+        cdef:
+            _IteratorSchedule schedule
+
+        # Discard the entries of the iterators no longer in the clock
+        while len(self._tick_queue) > 0:
+            schedule = self._tick_queue[0][2]
+            if self._schedules.get(schedule.iterator) is schedule:
+                return max(tick_index + 1, self._tick_queue[0][0])
+            heapq.heappop(self._tick_queue)
+        return tick_index + 1
+
+    cdef int64_t c_next_event_tick_index(self, int64_t tick_index):
+        cdef:
+            int64_t next_tick_index = -1
+            int64_t event_tick_index
+            double event_timestamp
+            _IteratorSchedule schedule
+
+        if len(self._tick_queue) > 0:
+            next_tick_index = self.c_next_due_tick_index(tick_index)
+            if len(self._tick_queue) == 0:
+                next_tick_index = -1
+        for schedule in self._schedules.values():
+            event_timestamp = schedule.iterator.next_event_timestamp()
+            if event_timestamp == event_timestamp:
+                # Events between two ticks are processed on the following tick
+                event_tick_index = max(tick_index + 1, self.c_tick_index_ceil(event_timestamp))
+                if next_tick_index < 0 or event_tick_index < next_tick_index:
+                    next_tick_index = event_tick_index
+        return next_tick_index
+
+    cdef int64_t c_tick_index_ceil(self, double timestamp):
+        return <int64_t>math.ceil((timestamp - self._tick_origin) / self._tick_size - 1e-6)
+
+    cdef list c_pop_due_iterators(self, int64_t tick_index):
+        cdef:
+            list due_schedules = []
+            _IteratorSchedule schedule
+
+        while len(self._tick_queue) > 0 and self._tick_queue[0][0] <= tick_index:
+            schedule = heapq.heappop(self._tick_queue)[2]
+            if self._schedules.get(schedule.iterator) is schedule:
+                due_schedules.append(schedule)
+                if (self._instrumentation is not None
+                        and not self._event_driven
+                        and schedule.next_tick_index < tick_index):
+                    # The clock was late, the iterator is ticked once for all the ticks it was due since then
+                    self._instrumentation.record_missed_ticks(
+                        schedule.iterator, (tick_index - schedule.next_tick_index) // schedule.period_ticks)
+        for schedule in due_schedules:
+            schedule.next_tick_index = schedule.c_next_tick_index_after(tick_index)
+            heapq.heappush(self._tick_queue, (schedule.next_tick_index, schedule.sequence, schedule))
+        if self._event_driven:
+            due_schedules.extend([schedule for schedule in self._schedules.values() if schedule.every_step])
+        if len(due_schedules) > 1:
+            due_schedules.sort(key=attrgetter("sequence"))
+        return [schedule.iterator for schedule in due_schedules]
+
+    cdef list c_pop_requested_iterators(self):
+        cdef list requested_iterators = self._requested_ticks
+        self._requested_ticks = []
+        return requested_iterators
+
+    cdef c_request_tick(self, object iterator):
+        if iterator not in self._schedules or iterator in self._requested_ticks:
+            return
+        self._requested_ticks.append(iterator)
+        if self._wakeup_future is not None:
+            _resolve_wakeup_future(self._wakeup_future)
+
+    async def _wait_for_next_tick(self, delay: float):
+        # Like asyncio.sleep(), but out-of-band tick requests can wake the clock up earlier
+        loop = asyncio.get_event_loop()
+        self._wakeup_future = loop.create_future()
+        timer_handle = loop.call_later(delay, _resolve_wakeup_future, self._wakeup_future)
+        try:
+            await self._wakeup_future
+        finally:
+            timer_handle.cancel()
+            self._wakeup_future = None
 
     async def run(self):
         await self.run_til(float("nan"))
@@ -90,6 +324,9 @@ cdef class Clock:
             TimeIterator child_iterator
             double now = time.time()
             double next_tick_time
+            double scheduled_tick_time
+            int64_t next_tick_index
+            list iterators
 
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
@@ -100,6 +337,7 @@ cdef class Clock:
                 child_iterator = ci
                 child_iterator.c_start(self, self._current_tick)
             self._started = True
+        self.c_reschedule_all()
 
         try:
             while True:
@@ -107,16 +345,30 @@ cdef class Clock:
                 if now >= timestamp:
                     return
 
-                # Sleep until the next tick
-                next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
-                await asyncio.sleep(next_tick_time - now)
-                self._current_tick = next_tick_time
+                if len(self._requested_ticks) == 0:
+                    # Sleep until the next tick where some iterator is due, or until an out-of-band tick is requested
+                    next_tick_index = self.c_next_due_tick_index(self.c_tick_index(now))
+                    next_tick_time = self._tick_origin + next_tick_index * self._tick_size
+                    await self._wait_for_next_tick(min(next_tick_time, timestamp) - now)
+                    if len(self._requested_ticks) == 0 and next_tick_time > timestamp:
+                        continue
 
-                # Run through all the child iterators.
-                for ci in self._current_context:
-                    child_iterator = ci
+                if len(self._requested_ticks) > 0:
+                    self._current_tick = time.time()
+                    iterators = self.c_pop_requested_iterators()
+                else:
+                    self._current_tick = next_tick_time
+                    if self._instrumentation is not None and len(self._tick_queue) > 0:
+                        # Measured from the time the earliest iterator was due, that is before the tick time when
+                        # the previous ticks took too long
+                        scheduled_tick_time = self._tick_origin + self._tick_queue[0][0] * self._tick_size
+                        self._instrumentation.record_tick_lateness((time.time() - scheduled_tick_time) * 1e3)
+                    iterators = self.c_pop_due_iterators(next_tick_index)
+
+                # Run through the child iterators due.
+                for ci in iterators:
                     try:
-                        child_iterator.c_tick(self._current_tick)
+                        self.c_tick_iterator(ci)
                     except StopIteration:
                         self.logger().error("Stop iteration triggered in real time mode. This is not expected.")
                         return
@@ -127,6 +379,27 @@ cdef class Clock:
                 child_iterator = ci
                 child_iterator._clock = None
 
+    cdef c_tick_iterator(self, object iterator):
+        cdef double tick_start
+
+        if self._instrumentation is None:
+            (<TimeIterator>iterator).c_tick(self._current_tick)
+        else:
+            tick_start = time.perf_counter()
+            try:
+                (<TimeIterator>iterator).c_tick(self._current_tick)
+            finally:
+                self._instrumentation.record_tick_duration(iterator, (time.perf_counter() - tick_start) * 1e3)
+
+    cdef c_backtest_tick_iterators(self, list iterators):
+        for ci in iterators:
+            try:
+                self.c_tick_iterator(ci)
+            except StopIteration:
+                raise
+            except Exception:
+                self.logger().error("Unexpected error running clock tick.", exc_info=True)
+
     def backtest_til(self, timestamp: float):
         cdef TimeIterator child_iterator
 
@@ -136,17 +409,44 @@ cdef class Clock:
                 child_iterator.c_start(self, self._start_time)
             self._started = True
 
+        if self._event_driven:
+            self.c_event_driven_backtest_til(timestamp)
+            return
+
         try:
             while not (self._current_tick >= timestamp):
                 self._current_tick += self._tick_size
-                for ci in self._child_iterators:
-                    child_iterator = ci
-                    try:
-                        child_iterator.c_tick(self._current_tick)
-                    except StopIteration:
-                        raise
-                    except Exception:
-                        self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                # The iterators requesting an out-of-band tick are ticked right after the regular ones, with the same
+                # timestamp
+                self.c_backtest_tick_iterators(self.c_pop_due_iterators(self.c_tick_index(self._current_tick)))
+                self.c_backtest_tick_iterators(self.c_pop_requested_iterators())
+        except StopIteration:
+            return
+        finally:
+            for ci in self._child_iterators:
+                child_iterator = ci
+                child_iterator._clock = None
+
+    cdef c_event_driven_backtest_til(self, double timestamp):
+        cdef:
+            TimeIterator child_iterator
+            int64_t tick_index
+            int64_t next_tick_index
+            int64_t end_tick_index = self.c_tick_index_ceil(timestamp) if timestamp == timestamp else -1
+
+        try:
+            while not (self._current_tick >= timestamp):
+                tick_index = self.c_tick_index(self._current_tick)
+                next_tick_index = self.c_next_event_tick_index(tick_index)
+                if next_tick_index < 0 or (end_tick_index >= 0 and next_tick_index > end_tick_index):
+                    # Nothing happens until the end of the simulation (or ever, if there is no end)
+                    if end_tick_index >= 0:
+                        self._current_tick = max(self._current_tick,
+                                                 self._tick_origin + end_tick_index * self._tick_size)
+                    return
+                self._current_tick = self._tick_origin + next_tick_index * self._tick_size
+                self.c_backtest_tick_iterators(self.c_pop_due_iterators(next_tick_index))
+                self.c_backtest_tick_iterators(self.c_pop_requested_iterators())
         except StopIteration:
             return
         finally:
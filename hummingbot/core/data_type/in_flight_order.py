@@ -14,6 +14,7 @@ from hummingbot.core.data_type.trade_fee import TradeFeeBase
 
 if typing.TYPE_CHECKING:  # avoid circular import problems
     from hummingbot.connector.exchange_base import ExchangeBase
+    from hummingbot.core.utils.order_latency_tracer import OrderLatencyTrace
 
 s_decimal_0 = Decimal("0")
 
@@ -87,6 +88,34 @@ class TradeUpdate(NamedTuple):
 
 
 class InFlightOrder:
+    __slots__ = (
+        "client_order_id",
+        "creation_timestamp",
+        "trading_pair",
+        "order_type",
+        "trade_type",
+        "price",
+        "amount",
+        "exchange_order_id",
+        "current_state",
+        "leverage",
+        "position",
+        "executed_amount_base",
+        "executed_amount_quote",
+        "last_update_timestamp",
+        "_order_fills",
+        "_exchange_order_id_update_event",
+        "_exchange_order_id_updated",
+        "_completely_filled_event",
+        "_completely_filled",
+        "_processed_by_exchange_event",
+        "_processed_by_exchange",
+        "_snapshot",
+        "latency_trace",
+        "_limit_order",
+        "_limit_order_key",
+    )
+
     def __init__(
             self,
             client_order_id: str,
@@ -118,15 +147,85 @@ class InFlightOrder:
 
         self.last_update_timestamp: float = creation_timestamp
 
-        self.order_fills: Dict[str, TradeUpdate] = {}  # Dict[trade_id, TradeUpdate]
-
-        self.exchange_order_id_update_event = asyncio.Event()
-        if self.exchange_order_id:
-            self.exchange_order_id_update_event.set()
-        self.completely_filled_event = asyncio.Event()
-        self.processed_by_exchange_event = asyncio.Event()
+        self._order_fills: Optional[Dict[str, TradeUpdate]] = None  # Dict[trade_id, TradeUpdate]
+
+        # The asyncio events are only created when something accesses them (usually to wait on them).
+        # Until then the flags below keep the state those events would have.
+        self._exchange_order_id_update_event: Optional[asyncio.Event] = None
+        self._exchange_order_id_updated: bool = bool(self.exchange_order_id)
+        self._completely_filled_event: Optional[asyncio.Event] = None
+        self._completely_filled: bool = False
+        self._processed_by_exchange_event: Optional[asyncio.Event] = None
+        self._processed_by_exchange: bool = False
+        self._snapshot: Optional[Dict[str, "InFlightOrder"]] = None
+        self.latency_trace: Optional["OrderLatencyTrace"] = None
+        # The LimitOrder view of the order, and the values it was built from (see to_limit_order)
+        self._limit_order: Optional[LimitOrder] = None
+        self._limit_order_key: Optional[Tuple[Decimal, Decimal, Decimal, OrderState]] = None
         self.check_processed_by_exchange_condition()
 
+    @property
+    def order_fills(self) -> Dict[str, TradeUpdate]:
+        if self._order_fills is None:
+            self._order_fills = {}
+        return self._order_fills
+
+    @property
+    def exchange_order_id_update_event(self) -> asyncio.Event:
+        if self._exchange_order_id_update_event is None:
+            self._exchange_order_id_update_event = asyncio.Event()
+            if self._exchange_order_id_updated:
+                self._exchange_order_id_update_event.set()
+        return self._exchange_order_id_update_event
+
+    @exchange_order_id_update_event.setter
+    def exchange_order_id_update_event(self, event: asyncio.Event):
+        self._exchange_order_id_update_event = event
+
+    @property
+    def completely_filled_event(self) -> asyncio.Event:
+        if self._completely_filled_event is None:
+            self._completely_filled_event = asyncio.Event()
+            if self._completely_filled:
+                self._completely_filled_event.set()
+        return self._completely_filled_event
+
+    @completely_filled_event.setter
+    def completely_filled_event(self, event: asyncio.Event):
+        self._completely_filled_event = event
+
+    @property
+    def processed_by_exchange_event(self) -> asyncio.Event:
+        if self._processed_by_exchange_event is None:
+            self._processed_by_exchange_event = asyncio.Event()
+            if self._processed_by_exchange:
+                self._processed_by_exchange_event.set()
+        return self._processed_by_exchange_event
+
+    @processed_by_exchange_event.setter
+    def processed_by_exchange_event(self, event: asyncio.Event):
+        self._processed_by_exchange_event = event
+
+    @staticmethod
+    def copy_on_write_snapshot(orders: Dict[str, "InFlightOrder"]) -> Dict[str, "InFlightOrder"]:
+        """
+        Creates a snapshot of the orders that shares the order instances with the live dictionary.
+        An order only copies itself into the snapshot right before it gets modified by an order or trade update.
+        :param orders: the orders to snapshot, keyed by client order id
+        :return: a dictionary with the state of the orders at the moment the snapshot was taken
+        """
+        snapshot = dict(orders)
+        for order in snapshot.values():
+            order._snapshot = snapshot
+        return snapshot
+
+    def _copy_on_write(self):
+        snapshot = self._snapshot
+        if snapshot is not None:
+            self._snapshot = None
+            if snapshot.get(self.client_order_id) is self:
+                snapshot[self.client_order_id] = copy.copy(self)
+
     @property
     def attributes(self) -> Tuple[Any]:
         return copy.deepcopy(
@@ -205,7 +304,7 @@ class InFlightOrder:
     def average_executed_price(self) -> Optional[Decimal]:
         executed_value: Decimal = s_decimal_0
         total_base_amount: Decimal = s_decimal_0
-        for order_fill in self.order_fills.values():
+        for order_fill in (self._order_fills or {}).values():
             executed_value += order_fill.fill_price * order_fill.fill_base_amount
             total_base_amount += order_fill.fill_base_amount
         if executed_value == s_decimal_0 or total_base_amount == s_decimal_0:
@@ -234,9 +333,11 @@ class InFlightOrder:
         )
         order.executed_amount_base = Decimal(data["executed_amount_base"])
         order.executed_amount_quote = Decimal(data["executed_amount_quote"])
-        order.order_fills.update({key: TradeUpdate.from_json(value)
-                                  for key, value
-                                  in data.get("order_fills", {}).items()})
+        order_fills = data.get("order_fills", {})
+        if order_fills:
+            order.order_fills.update({key: TradeUpdate.from_json(value)
+                                      for key, value
+                                      in order_fills.items()})
         order.last_update_timestamp = data.get("last_update_timestamp", order.creation_timestamp)
 
         order.check_filled_condition()
@@ -264,29 +365,41 @@ class InFlightOrder:
             "position": self.position.value,
             "creation_timestamp": self.creation_timestamp,
             "last_update_timestamp": self.last_update_timestamp,
-            "order_fills": {key: fill.to_json() for key, fill in self.order_fills.items()}
+            "order_fills": {key: fill.to_json() for key, fill in (self._order_fills or {}).items()}
         }
 
     def to_limit_order(self) -> LimitOrder:
         """
         Returns this InFlightOrder as a LimitOrder object.
+        The same LimitOrder instance is returned until the price, amount, filled amount or state of the order change.
         :return: LimitOrder object.
         """
-        return LimitOrder(
-            client_order_id=self.client_order_id,
-            trading_pair=self.trading_pair,
-            is_buy=self.trade_type is TradeType.BUY,
-            base_currency=self.base_asset,
-            quote_currency=self.quote_asset,
-            price=self.price,
-            quantity=self.amount,
-            filled_quantity=self.executed_amount_base,
-            creation_timestamp=int(self.creation_timestamp * 1e6)
-        )
+        key = self._limit_order_key
+        # Updates always assign new values to the attributes, so comparing identities is enough to detect changes
+        if (key is None
+                or key[0] is not self.price
+                or key[1] is not self.amount
+                or key[2] is not self.executed_amount_base
+                or key[3] is not self.current_state):
+            self._limit_order = LimitOrder(
+                client_order_id=self.client_order_id,
+                trading_pair=self.trading_pair,
+                is_buy=self.trade_type is TradeType.BUY,
+                base_currency=self.base_asset,
+                quote_currency=self.quote_asset,
+                price=self.price,
+                quantity=self.amount,
+                filled_quantity=self.executed_amount_base,
+                creation_timestamp=int(self.creation_timestamp * 1e6)
+            )
+            self._limit_order_key = (self.price, self.amount, self.executed_amount_base, self.current_state)
+        return self._limit_order
 
     def update_exchange_order_id(self, exchange_order_id: str):
         self.exchange_order_id = exchange_order_id
-        self.exchange_order_id_update_event.set()
+        self._exchange_order_id_updated = True
+        if self._exchange_order_id_update_event is not None:
+            self._exchange_order_id_update_event.set()
 
     async def get_exchange_order_id(self):
         if self.exchange_order_id is None:
@@ -302,7 +415,7 @@ class InFlightOrder:
         :return: the cumulative fee paid for all partial fills in the specified token
         """
         total_fee_in_token = Decimal("0")
-        for trade_update in self.order_fills.values():
+        for trade_update in (self._order_fills or {}).values():
             total_fee_in_token += trade_update.fee.fee_amount_in_token(
                 trading_pair=self.trading_pair,
                 price=trade_update.fill_price,
@@ -323,6 +436,9 @@ class InFlightOrder:
 
         prev_data = (self.exchange_order_id, self.current_state)
 
+        if order_update.new_state != self.current_state:
+            self._copy_on_write()
+
         if self.exchange_order_id is None and order_update.exchange_order_id is not None:
             self.update_exchange_order_id(order_update.exchange_order_id)
 
@@ -343,11 +459,12 @@ class InFlightOrder:
         """
         trade_id: str = trade_update.trade_id
 
-        if (trade_id in self.order_fills
+        if ((self._order_fills is not None and trade_id in self._order_fills)
                 or (self.client_order_id != trade_update.client_order_id
                     and self.exchange_order_id != trade_update.exchange_order_id)):
             return False
 
+        self._copy_on_write()
         self.order_fills[trade_id] = trade_update
 
         self.executed_amount_base += trade_update.fill_base_amount
@@ -360,14 +477,18 @@ class InFlightOrder:
 
     def check_filled_condition(self):
         if (abs(self.amount) - self.executed_amount_base).quantize(Decimal('1e-8')) <= 0:
-            self.completely_filled_event.set()
+            self._completely_filled = True
+            if self._completely_filled_event is not None:
+                self._completely_filled_event.set()
 
     async def wait_until_completely_filled(self):
         await self.completely_filled_event.wait()
 
     def check_processed_by_exchange_condition(self):
         if self.current_state.value > OrderState.PENDING_CREATE.value:
-            self.processed_by_exchange_event.set()
+            self._processed_by_exchange = True
+            if self._processed_by_exchange_event is not None:
+                self._processed_by_exchange_event.set()
 
     async def wait_until_processed_by_exchange(self):
         await self.processed_by_exchange_event.wait()
@@ -380,6 +501,8 @@ class InFlightOrder:
 
 
 class PerpetualDerivativeInFlightOrder(InFlightOrder):
+    __slots__ = ()
+
     def build_order_created_message(self) -> str:
         return (
             f"Created {self.order_type.name.upper()} {self.trade_type.name.upper()} order "
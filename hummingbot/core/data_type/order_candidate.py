@@ -2,7 +2,7 @@ import typing
 from collections import defaultdict
 from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
 from hummingbot.core.data_type.common import OrderType, PositionAction, TradeType
@@ -70,9 +70,14 @@ class OrderCandidate:
     def set_to_zero(self):
         self._scale_order(scaler=Decimal("0"))
 
-    def populate_collateral_entries(self, exchange: 'ExchangeBase'):
+    def populate_collateral_entries(self, exchange: 'ExchangeBase', fee: Optional[TradeFeeBase] = None):
+        """
+        :param exchange: the exchange the order would be sent to
+        :param fee: the fee of the order, if already known (otherwise it is built from the exchange fee schema)
+        """
         self._populate_order_collateral_entry(exchange)
-        fee = self._get_fee(exchange)
+        if fee is None:
+            fee = self._get_fee(exchange)
         self._populate_percent_fee_collateral_entry(exchange, fee)
         self._populate_fixed_fee_collateral_entries(fee)
         self._populate_potential_returns_entry(exchange)
@@ -231,6 +236,12 @@ class OrderCandidate:
             pfc_amount = Decimal("0")
         return TokenAmount(oc_amount, pfc_amount)
 
+    def fee_cache_key(self) -> Tuple:
+        """
+        Returns the parameters the fee of the order depends on. Candidates with the same key have the same fee.
+        """
+        return type(self), self.trading_pair, self.is_maker, self.order_type, self.order_side
+
     def _get_fee(self, exchange: 'ExchangeBase') -> TradeFeeBase:
         trading_pair = self.trading_pair
         price = self.price
@@ -347,6 +358,9 @@ class PerpetualOrderCandidate(OrderCandidate):
             else TradeType.SELL
         )
 
+    def fee_cache_key(self) -> Tuple:
+        return super().fee_cache_key() + (self.position_close,)
+
     def _get_fee(self, exchange: 'ExchangeBase') -> TradeFeeBase:
         base, quote = split_hb_trading_pair(self.trading_pair)
         position_action = PositionAction.CLOSE if self.position_close else PositionAction.OPEN
@@ -0,0 +1,218 @@
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+from hummingbot.core.event.event_listener import EventListener
+from hummingbot.core.pubsub import PubSub
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+sceb_logger = None
+
+
+class SideChannelEventBus:
+    """
+    Delivers connector events to the consumers that are not part of the trading logic (trade recording, remote
+    notifications, metrics) outside of the connector `trigger_event` call.
+
+    The listeners of those consumers (see `SideChannelEventForwarder`) only copy the events to a bounded queue. A
+    task running on the event loop delivers the queued events to the consumers in batches, yielding to the other
+    tasks between batches. This way a slow database commit or a slow publication does not delay the listeners of the
+    strategy processing the same event.
+
+    When the queue is full:
+    - the events of consumers that can afford to lose them are dropped (and counted)
+    - the events of the other consumers are delivered synchronously, after delivering all the queued events to keep
+      the order of the events. This applies backpressure on the producer instead of losing the events.
+
+    The bus is not running by default (events are then delivered synchronously, like with a regular event forwarder).
+    The application starts it once the event loop is running.
+    """
+    DEFAULT_MAX_QUEUE_SIZE = 10000
+    DEFAULT_BATCH_SIZE = 100
+    DROPPED_EVENTS_WARNING_INTERVAL = 60.0
+
+    _shared_instance: Optional["SideChannelEventBus"] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global sceb_logger
+        if sceb_logger is None:
+            sceb_logger = logging.getLogger(__name__)
+        return sceb_logger
+
+    @classmethod
+    def get_instance(cls) -> "SideChannelEventBus":
+        if cls._shared_instance is None:
+            cls._shared_instance = SideChannelEventBus()
+        return cls._shared_instance
+
+    def __init__(self, max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE, batch_size: int = DEFAULT_BATCH_SIZE):
+        self._max_queue_size = max_queue_size
+        self._batch_size = batch_size
+        self._queue: Deque[Tuple["SideChannelEventForwarder", int, Optional[PubSub], Any]] = deque()
+        self._ev_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._events_available: Optional[asyncio.Event] = None
+        self._delivery_task: Optional[asyncio.Task] = None
+        self._delivered_events_count = 0
+        self._dropped_events_count: Dict[str, int] = {}
+        self._backpressure_flushes_count = 0
+        self._max_queue_length = 0
+        self._last_dropped_events_warning = 0.0
+
+    @property
+    def started(self) -> bool:
+        return self._delivery_task is not None
+
+    @property
+    def queue_length(self) -> int:
+        return len(self._queue)
+
+    @property
+    def max_queue_length(self) -> int:
+        """
+        The maximum number of events waiting in the queue since the bus was created
+        """
+        return self._max_queue_length
+
+    @property
+    def delivered_events_count(self) -> int:
+        return self._delivered_events_count
+
+    @property
+    def dropped_events_count(self) -> Dict[str, int]:
+        """
+        The number of dropped events, by consumer name
+        """
+        return dict(self._dropped_events_count)
+
+    @property
+    def backpressure_flushes_count(self) -> int:
+        """
+        The number of times the queue was full and had to be delivered synchronously
+        """
+        return self._backpressure_flushes_count
+
+    def start(self):
+        """
+        Starts delivering the events asynchronously. Has to be called from the event loop thread.
+        """
+        if self.started:
+            return
+        self._ev_loop = asyncio.get_event_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._events_available = asyncio.Event()
+        self._delivery_task = safe_ensure_future(self._delivery_loop())
+
+    def stop(self):
+        """
+        Stops the asynchronous delivery, delivering all the queued events before returning
+        """
+        if self._delivery_task is not None:
+            self._delivery_task.cancel()
+            self._delivery_task = None
+        self.flush()
+
+    def flush(self):
+        """
+        Delivers all the queued events synchronously
+        """
+        while self._queue:
+            self._deliver(*self._queue.popleft())
+
+    def publish(self, forwarder: "SideChannelEventForwarder", event_tag: int, caller: Optional[PubSub], arg: Any):
+        """
+        Queues an event to be delivered to the forwarder consumer, or delivers it synchronously if the bus is not
+        running.
+        """
+        if not self.started:
+            self._deliver(forwarder, event_tag, caller, arg)
+            return
+
+        if len(self._queue) >= self._max_queue_size:
+            if forwarder.drop_on_overflow:
+                self._register_dropped_event(forwarder)
+                return
+            if threading.get_ident() == self._loop_thread_id:
+                self._backpressure_flushes_count += 1
+                self.flush()
+                self._deliver(forwarder, event_tag, caller, arg)
+                return
+            # The queue can only be consumed from the event loop thread, the event is kept even if the queue is full
+
+        self._queue.append((forwarder, event_tag, caller, arg))
+        self._max_queue_length = max(self._max_queue_length, len(self._queue))
+        if threading.get_ident() == self._loop_thread_id:
+            self._events_available.set()
+        else:
+            self._ev_loop.call_soon_threadsafe(self._events_available.set)
+
+    async def _delivery_loop(self):
+        while True:
+            await self._events_available.wait()
+            self._events_available.clear()
+            while self._queue:
+                for _ in range(min(self._batch_size, len(self._queue))):
+                    self._deliver(*self._queue.popleft())
+                # Let the other tasks (trading logic included) run between batches
+                await asyncio.sleep(0)
+
+    def _deliver(self, forwarder: "SideChannelEventForwarder", event_tag: int, caller: Optional[PubSub], arg: Any):
+        try:
+            forwarder.deliver(event_tag, caller, arg)
+        except Exception:
+            self.logger().error(f"Unexpected error while delivering event {event_tag} to {forwarder.name}.",
+                                exc_info=True)
+        self._delivered_events_count += 1
+
+    def _register_dropped_event(self, forwarder: "SideChannelEventForwarder"):
+        self._dropped_events_count[forwarder.name] = self._dropped_events_count.get(forwarder.name, 0) + 1
+        now = time.time()
+        if now - self._last_dropped_events_warning >= self.DROPPED_EVENTS_WARNING_INTERVAL:
+            self._last_dropped_events_warning = now
+            self.logger().warning(f"The side channel event queue is full ({self._max_queue_size} events). "
+                                  f"Dropped events so far: {self._dropped_events_count}.")
+
+
+class SideChannelEventForwarder(EventListener):
+    """
+    Event listener forwarding the events to a non-trading consumer through the side channel event bus.
+    The consumer function receives the event tag, the event source and the event, like with a
+    `SourceInfoEventForwarder`.
+    """
+
+    def __init__(self,
+                 to_function: Callable[[int, Optional[PubSub], Any], None],
+                 name: Optional[str] = None,
+                 drop_on_overflow: bool = False,
+                 event_bus: Optional[SideChannelEventBus] = None):
+        """
+        :param to_function: the function processing the events
+        :param name: the name of the consumer, used in the dropped events metrics
+        :param drop_on_overflow: whether the events can be dropped when the bus queue is full
+        :param event_bus: the bus delivering the events (the shared one by default)
+        """
+        super().__init__()
+        self._to_function = to_function
+        self._name = name or getattr(to_function, "__qualname__", repr(to_function))
+        self._drop_on_overflow = drop_on_overflow
+        self._event_bus = event_bus
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def drop_on_overflow(self) -> bool:
+        return self._drop_on_overflow
+
+    def __call__(self, arg: Any):
+        event_bus = self._event_bus or SideChannelEventBus.get_instance()
+        event_bus.publish(self, self.current_event_tag, self.current_event_caller, arg)
+
+    def deliver(self, event_tag: int, caller: Optional[PubSub], arg: Any):
+        self._to_function(event_tag, caller, arg)
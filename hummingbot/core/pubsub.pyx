@@ -40,7 +40,12 @@ cdef class PubSub:
     2. c_remove_listener():
        Every time. This assumes c_remove_listener() is called infrequently.
     3. c_get_listeners() and c_trigger_event():
-       Every time. Both functions take O(n) already.
+       Only when the listeners snapshot of the event has to be rebuilt (see below).
+
+    Events are triggered much more often than listeners are added or removed, so c_trigger_event() does not walk the
+    listeners collection. It iterates over a snapshot of the listener weak references of the event instead, which is
+    rebuilt (after removing the dead listeners) only after a listener is added or removed, or after a dispatch finds
+    a dead listener. The snapshot is immutable, so listeners can be added or removed while an event is dispatched.
     """
 
     ADD_LISTENER_GC_PROBABILITY = 0.005
@@ -52,6 +57,9 @@ cdef class PubSub:
             class_logger = logging.getLogger(__name__)
         return class_logger
 
+    def __cinit__(self):
+        self._listeners_snapshots = {}
+
     def __init__(self):
         self._events = Events()
 
@@ -83,6 +91,7 @@ cdef class PubSub:
         else:
             new_listeners.insert(listener_wrapper)
             self._events.insert(EventsPair(event_tag, new_listeners))
+        self._listeners_snapshots.pop(event_tag, None)
 
         if random.random() < PubSub.ADD_LISTENER_GC_PROBABILITY:
             self.c_remove_dead_listeners(event_tag)
@@ -100,6 +109,7 @@ cdef class PubSub:
         lit = deref(listeners_ptr).find(listener_wrapper)
         if lit != deref(listeners_ptr).end():
             deref(listeners_ptr).erase(lit)
+            self._listeners_snapshots.pop(event_tag, None)
         self.c_remove_dead_listeners(event_tag)
 
     cdef c_remove_dead_listeners(self, int64_t event_tag):
@@ -120,46 +130,54 @@ cdef class PubSub:
             inc(lit)
         for lit in lit_to_remove:
             deref(listeners_ptr).erase(lit)
+        if lit_to_remove.size() > 0:
+            self._listeners_snapshots.pop(event_tag, None)
         if deref(listeners_ptr).size() < 1:
             self._events.erase(it)
 
     cdef c_get_listeners(self, int64_t event_tag):
-        self.c_remove_dead_listeners(event_tag)
-
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection *listeners_ptr
-            object listener_weafref
-            EventListener typed_listener
-
-        if it == self._events.end():
-            return []
+            object listener
 
         retval = []
-        listeners_ptr = address(deref(it).second)
-        for pyref in deref(listeners_ptr):
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
-            retval.append(typed_listener)
+        for listener_weakref in self.c_get_listeners_snapshot(event_tag):
+            listener = <object>PyWeakref_GetObject(listener_weakref)
+            if listener is not None:
+                retval.append(listener)
         return retval
 
-    cdef c_trigger_event(self, int64_t event_tag, object arg):
+    cdef tuple c_get_listeners_snapshot(self, int64_t event_tag):
+        cdef:
+            tuple snapshot = self._listeners_snapshots.get(event_tag)
+            EventsIterator it
+            EventListenersCollection *listeners_ptr
+
+        if snapshot is not None:
+            return snapshot
+
         self.c_remove_dead_listeners(event_tag)
+        it = self._events.find(event_tag)
+        if it == self._events.end():
+            snapshot = ()
+        else:
+            listeners_ptr = address(deref(it).second)
+            snapshot = tuple([<object>pyref.get() for pyref in deref(listeners_ptr)])
+        self._listeners_snapshots[event_tag] = snapshot
+        return snapshot
 
+    cdef c_trigger_event(self, int64_t event_tag, object arg):
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection listeners
-            object listener_weafref
+            tuple listeners = self.c_get_listeners_snapshot(event_tag)
+            object listener
             EventListener typed_listener
-        if it == self._events.end():
-            return
 
-        # It is extremely important that this set of listeners is a C++ copy - because listeners are allowed to call
-        # c_remove_listener(), which breaks the iterator if we're using the underlying set.
-        listeners = deref(it).second
-        for pyref in listeners:
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
+        for listener_weakref in listeners:
+            listener = <object>PyWeakref_GetObject(listener_weakref)
+            if listener is None:
+                # The listener was garbage collected, the snapshot is rebuilt on the next dispatch
+                self._listeners_snapshots.pop(event_tag, None)
+                continue
+            typed_listener = listener
             try:
                 typed_listener.c_set_event_info(event_tag, self)
                 typed_listener.c_call(arg)
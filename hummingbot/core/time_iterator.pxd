@@ -8,6 +8,8 @@ cdef class TimeIterator(PubSub):
     cdef:
         double _current_timestamp
         Clock _clock
+        double _tick_period
+        double _tick_phase
 
     cdef c_start(self, Clock clock, double timestamp)
     cdef c_stop(self, Clock clock)
@@ -10,6 +10,8 @@ cdef class TimeIterator(PubSub):
     def __init__(self):
         self._current_timestamp = NaN
         self._clock = None
+        self._tick_period = 0
+        self._tick_phase = 0
 
     cdef c_start(self, Clock clock, double timestamp):
         self._clock = clock
@@ -33,6 +35,47 @@ cdef class TimeIterator(PubSub):
     def clock(self) -> Optional[Clock]:
         return self._clock
 
+    @property
+    def tick_period(self) -> float:
+        """
+        The interval between the ticks of the iterator. 0 means the iterator is ticked on every clock tick.
+        """
+        return self._tick_period
+
+    @property
+    def tick_phase(self) -> float:
+        """
+        The offset of the ticks of the iterator within its tick period
+        """
+        return self._tick_phase
+
+    def set_tick_period(self, period: float, phase: float = 0.0):
+        """
+        Makes the clock tick the iterator every `period` seconds (rounded to a multiple of the clock tick size), at
+        the timestamps `phase` seconds after a multiple of the period. Has to be called before the iterator is added
+        to the clock.
+        :param period: the interval between ticks, 0 to be ticked on every clock tick
+        :param phase: the offset of the ticks within the period
+        """
+        self._tick_period = period
+        self._tick_phase = phase
+
+    def request_tick(self):
+        """
+        Requests the clock to tick the iterator as soon as possible, out of its regular schedule (for example when
+        an event the iterator reacts to is received). Has no effect if the iterator is not running in a clock.
+        """
+        if self._clock is not None:
+            self._clock.c_request_tick(self)
+
+    def next_event_timestamp(self) -> float:
+        """
+        Data sources replaying historical data override this to return the timestamp of their next event not processed
+        yet, NaN when they have no more events. The clock uses it in event driven back testing mode to jump to the next
+        tick where something happens.
+        """
+        return NaN
+
     def start(self, clock: Clock):
         self.c_start(clock, clock.current_timestamp)
 
@@ -0,0 +1,156 @@
+import logging
+import time
+import weakref
+from typing import Any, Dict, Optional
+
+from hummingbot.core.utils.latency_histogram import LatencyHistogram
+from hummingbot.logger import HummingbotLogger
+
+ci_logger = None
+
+
+class IteratorTickStats:
+    """
+    The tick statistics of one time iterator of the clock. The label identifies the iterator in the reports, it is
+    the name of the iterator followed by a sequence number if another iterator with the same name was recorded before.
+    """
+    __slots__ = ("name", "label", "tick_duration", "missed_ticks", "last_duration_warning")
+
+    def __init__(self, name: str, label: str):
+        self.name = name
+        self.label = label
+        self.tick_duration = LatencyHistogram()
+        self.missed_ticks = 0
+        self.last_duration_warning = 0.0
+
+    def reset(self):
+        self.tick_duration.reset()
+        self.missed_ticks = 0
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "tick_duration": self.tick_duration.to_json(),
+            "missed_ticks": self.missed_ticks,
+        }
+
+
+class ClockInstrumentation:
+    """
+    Records how the clock ticks its time iterators:
+    - the duration of the `c_tick` call of each iterator
+    - how late each regular tick started, compared to its scheduled time (real time mode only)
+    - the number of ticks each iterator missed because the clock was late (real time mode only)
+
+    A warning is logged (at most once per `WARNING_INTERVAL` seconds for each kind of warning) when a tick of an
+    iterator takes longer than the duration threshold, or when a tick starts later than the lateness threshold.
+
+    The instrumentation is disabled by default. When it is enabled, the shared instance is attached to the
+    application clock, that only measures the ticks while an instrumentation is attached.
+    """
+    DEFAULT_TICK_DURATION_WARNING_THRESHOLD_MS = 100.0
+    DEFAULT_TICK_LATENESS_WARNING_THRESHOLD_MS = 250.0
+    WARNING_INTERVAL = 60.0
+
+    enabled: bool = False
+    _shared_instance: Optional["ClockInstrumentation"] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global ci_logger
+        if ci_logger is None:
+            ci_logger = logging.getLogger(__name__)
+        return ci_logger
+
+    @classmethod
+    def get_instance(cls) -> "ClockInstrumentation":
+        if cls._shared_instance is None:
+            cls._shared_instance = ClockInstrumentation()
+        return cls._shared_instance
+
+    @classmethod
+    def enable(cls):
+        cls.enabled = True
+
+    @classmethod
+    def disable(cls):
+        cls.enabled = False
+
+    def __init__(self,
+                 tick_duration_warning_threshold_ms: float = DEFAULT_TICK_DURATION_WARNING_THRESHOLD_MS,
+                 tick_lateness_warning_threshold_ms: float = DEFAULT_TICK_LATENESS_WARNING_THRESHOLD_MS):
+        self._tick_duration_warning_threshold_ms = tick_duration_warning_threshold_ms
+        self._tick_lateness_warning_threshold_ms = tick_lateness_warning_threshold_ms
+        self._iterator_stats: "weakref.WeakKeyDictionary[Any, IteratorTickStats]" = weakref.WeakKeyDictionary()
+        # The number of iterators recorded with each name, to label the iterators with the same name
+        self._iterator_name_counts: Dict[str, int] = {}
+        self._tick_lateness = LatencyHistogram()
+        self._last_lateness_warning = 0.0
+
+    @property
+    def tick_lateness(self) -> LatencyHistogram:
+        return self._tick_lateness
+
+    @property
+    def iterator_stats(self) -> Dict[str, IteratorTickStats]:
+        """
+        The tick statistics of the iterators, by iterator label
+        """
+        return {stats.label: stats for stats in self._iterator_stats.values()}
+
+    @property
+    def has_samples(self) -> bool:
+        return self._tick_lateness.count > 0 or any(
+            stats.tick_duration.count > 0 for stats in self._iterator_stats.values())
+
+    def record_tick_duration(self, iterator: Any, duration_ms: float):
+        stats = self._get_iterator_stats(iterator)
+        stats.tick_duration.add(duration_ms)
+        if duration_ms > self._tick_duration_warning_threshold_ms:
+            now = time.time()
+            if now - stats.last_duration_warning >= self.WARNING_INTERVAL:
+                stats.last_duration_warning = now
+                self.logger().warning(
+                    f"The clock tick of {stats.label} took {duration_ms:.1f} ms "
+                    f"(warning threshold: {self._tick_duration_warning_threshold_ms} ms).")
+
+    def record_tick_lateness(self, lateness_ms: float):
+        self._tick_lateness.add(max(lateness_ms, 0.0))
+        if lateness_ms > self._tick_lateness_warning_threshold_ms:
+            now = time.time()
+            if now - self._last_lateness_warning >= self.WARNING_INTERVAL:
+                self._last_lateness_warning = now
+                missed_ticks = {stats.label: stats.missed_ticks
+                                for stats in self._iterator_stats.values() if stats.missed_ticks > 0}
+                self.logger().warning(
+                    f"The clock tick started {lateness_ms:.1f} ms late "
+                    f"(warning threshold: {self._tick_lateness_warning_threshold_ms} ms). "
+                    f"Missed ticks so far: {missed_ticks}.")
+
+    def record_missed_ticks(self, iterator: Any, missed_ticks: int):
+        self._get_iterator_stats(iterator).missed_ticks += missed_ticks
+
+    def reset(self):
+        self._tick_lateness.reset()
+        for stats in self._iterator_stats.values():
+            stats.reset()
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "tick_lateness": self._tick_lateness.to_json(),
+            "iterators": {stats.label: stats.to_json() for stats in self._iterator_stats.values()},
+        }
+
+    def _get_iterator_stats(self, iterator: Any) -> IteratorTickStats:
+        stats = self._iterator_stats.get(iterator)
+        if stats is None:
+            name = self._iterator_name(iterator)
+            name_count = self._iterator_name_counts.get(name, 0) + 1
+            self._iterator_name_counts[name] = name_count
+            stats = IteratorTickStats(name=name, label=name if name_count == 1 else f"{name}#{name_count}")
+            self._iterator_stats[iterator] = stats
+        return stats
+
+    @staticmethod
+    def _iterator_name(iterator: Any) -> str:
+        name = getattr(iterator, "name", None)
+        return name if isinstance(name, str) else type(iterator).__name__
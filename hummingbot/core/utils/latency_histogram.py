@@ -0,0 +1,66 @@
+import bisect
+from typing import Any, Dict, Tuple
+
+
+class LatencyHistogram:
+    """
+    Fixed bucket histogram for durations expressed in milliseconds.
+    Adding a sample is O(log(buckets)) and does not allocate, so it can be used in hot paths.
+    """
+    DEFAULT_BUCKET_BOUNDS_MS: Tuple[float, ...] = (
+        0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1_000, 2_500, 5_000, 10_000)
+
+    __slots__ = ("_bucket_bounds", "_counts", "count", "total", "max")
+
+    def __init__(self, bucket_bounds_ms: Tuple[float, ...] = DEFAULT_BUCKET_BOUNDS_MS):
+        self._bucket_bounds = bucket_bounds_ms
+        # The last bucket counts the samples above the highest bound
+        self._counts = [0] * (len(bucket_bounds_ms) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count > 0 else 0.0
+
+    def add(self, value_ms: float):
+        self._counts[bisect.bisect_left(self._bucket_bounds, value_ms)] += 1
+        self.count += 1
+        self.total += value_ms
+        if value_ms > self.max:
+            self.max = value_ms
+
+    def percentile(self, percentile: float) -> float:
+        """
+        Returns the upper bound of the bucket that contains the requested percentile (the maximum observed value
+        for the samples above the highest bucket bound)
+        :param percentile: the percentile to calculate, between 0 and 100
+        """
+        if self.count == 0:
+            return 0.0
+        target = self.count * percentile / 100
+        accumulated = 0
+        for index, bucket_count in enumerate(self._counts):
+            accumulated += bucket_count
+            if accumulated >= target and bucket_count > 0:
+                return min(self._bucket_bounds[index], self.max) if index < len(self._bucket_bounds) else self.max
+        return self.max
+
+    def reset(self):
+        self._counts = [0] * (len(self._bucket_bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean_ms": self.mean,
+            "p50_ms": self.percentile(50),
+            "p90_ms": self.percentile(90),
+            "p99_ms": self.percentile(99),
+            "max_ms": self.max,
+            "buckets": {str(bound): count for bound, count in zip(self._bucket_bounds, self._counts)},
+            "overflow": self._counts[-1],
+        }
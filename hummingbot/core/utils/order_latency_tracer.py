@@ -0,0 +1,185 @@
+import time
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+from hummingbot.core.utils.latency_histogram import LatencyHistogram
+
+if TYPE_CHECKING:
+    from hummingbot.core.data_type.in_flight_order import InFlightOrder
+
+DECISION = "decision"
+TRACKING_START = "tracking_start"
+THROTTLER_ACQUIRED = "throttler_acquired"
+REQUEST_SENT = "request_sent"
+RESPONSE_RECEIVED = "response_received"
+EXCHANGE_CONFIRMATION = "exchange_confirmation"
+TOTAL = "total"
+
+ORDER_LATENCY_STAGES: Tuple[str, ...] = (
+    DECISION,
+    TRACKING_START,
+    THROTTLER_ACQUIRED,
+    REQUEST_SENT,
+    RESPONSE_RECEIVED,
+    EXCHANGE_CONFIRMATION,
+)
+
+# The trace of the order whose creation request is being processed by the current asyncio task
+_current_trace: ContextVar[Optional["OrderLatencyTrace"]] = ContextVar("current_order_latency_trace", default=None)
+
+
+class OrderLatencyTrace:
+    """
+    Monotonic timestamps (time.perf_counter) of each stage an order goes through from the strategy decision
+    to the exchange confirmation.
+    """
+    __slots__ = ("tracer",) + ORDER_LATENCY_STAGES
+
+    def __init__(self, tracer: "OrderLatencyTracer"):
+        self.tracer = tracer
+        self.decision: Optional[float] = None
+        self.tracking_start: Optional[float] = None
+        self.throttler_acquired: Optional[float] = None
+        self.request_sent: Optional[float] = None
+        self.response_received: Optional[float] = None
+        self.exchange_confirmation: Optional[float] = None
+
+    def stamp(self, stage: str):
+        """
+        Registers the time a stage was reached. Only the first time each stage is reached is kept.
+        """
+        if getattr(self, stage) is None:
+            timestamp = time.perf_counter()
+            setattr(self, stage, timestamp)
+            self.tracer.record_stage(self, stage, timestamp)
+
+    def previous_stage_timestamp(self, stage: str) -> Optional[float]:
+        for previous_stage in reversed(ORDER_LATENCY_STAGES[:ORDER_LATENCY_STAGES.index(stage)]):
+            timestamp = getattr(self, previous_stage)
+            if timestamp is not None:
+                return timestamp
+        return None
+
+    def first_stage_timestamp(self) -> Optional[float]:
+        for stage in ORDER_LATENCY_STAGES:
+            timestamp = getattr(self, stage)
+            if timestamp is not None:
+                return timestamp
+        return None
+
+
+class OrderLatencyTracer:
+    """
+    Aggregates the order latency traces of one connector in histograms, one per stage (measuring the time since
+    the previous stage) plus one for the total time from decision to exchange confirmation.
+
+    Tracing is globally disabled by default. When disabled the only cost in the order flow is checking the
+    `enabled` flag.
+    """
+    enabled: bool = False
+    _tracers: Dict[str, "OrderLatencyTracer"] = {}
+
+    @classmethod
+    def enable(cls):
+        cls.enabled = True
+
+    @classmethod
+    def disable(cls):
+        cls.enabled = False
+
+    @classmethod
+    def for_connector(cls, connector_name: str) -> "OrderLatencyTracer":
+        tracer = cls._tracers.get(connector_name)
+        if tracer is None:
+            tracer = cls(connector_name)
+            cls._tracers[connector_name] = tracer
+        return tracer
+
+    @classmethod
+    def all_tracers(cls) -> Dict[str, "OrderLatencyTracer"]:
+        return dict(cls._tracers)
+
+    @classmethod
+    def reset_all(cls):
+        for tracer in cls._tracers.values():
+            tracer.reset()
+
+    @classmethod
+    def report_all(cls) -> Dict[str, Dict[str, Any]]:
+        return {name: tracer.report() for name, tracer in cls._tracers.items() if tracer.has_samples}
+
+    @staticmethod
+    def current_trace() -> Optional[OrderLatencyTrace]:
+        return _current_trace.get()
+
+    @staticmethod
+    def set_current_trace(trace: Optional[OrderLatencyTrace]):
+        return _current_trace.set(trace)
+
+    @staticmethod
+    def reset_current_trace(token):
+        _current_trace.reset(token)
+
+    @classmethod
+    def stamp_current(cls, stage: str):
+        """
+        Stamps the stage in the trace of the order being created by the current task, if any.
+        Used by the web assistants, that do not know which order a request belongs to.
+        """
+        if cls.enabled:
+            trace = _current_trace.get()
+            if trace is not None:
+                trace.stamp(stage)
+
+    def __init__(self, connector_name: str):
+        self._connector_name = connector_name
+        self._pending_decisions: Dict[str, float] = {}
+        self._histograms: Dict[str, LatencyHistogram] = {
+            stage: LatencyHistogram() for stage in ORDER_LATENCY_STAGES[1:] + (TOTAL,)}
+
+    @property
+    def connector_name(self) -> str:
+        return self._connector_name
+
+    @property
+    def histograms(self) -> Dict[str, LatencyHistogram]:
+        return self._histograms
+
+    @property
+    def has_samples(self) -> bool:
+        return any(histogram.count > 0 for histogram in self._histograms.values())
+
+    def record_decision(self, client_order_id: str):
+        """
+        Registers the moment the strategy requested the creation of the order
+        """
+        self._pending_decisions[client_order_id] = time.perf_counter()
+
+    def start_trace(self, order: "InFlightOrder"):
+        """
+        Attaches a trace to an order that has just started being tracked
+        """
+        trace = OrderLatencyTrace(tracer=self)
+        trace.decision = self._pending_decisions.pop(order.client_order_id, None)
+        trace.stamp(TRACKING_START)
+        order.latency_trace = trace
+
+    def discard_decision(self, client_order_id: str):
+        self._pending_decisions.pop(client_order_id, None)
+
+    def record_stage(self, trace: OrderLatencyTrace, stage: str, timestamp: float):
+        previous_timestamp = trace.previous_stage_timestamp(stage)
+        if previous_timestamp is not None:
+            self._histograms[stage].add((timestamp - previous_timestamp) * 1e3)
+        if stage == EXCHANGE_CONFIRMATION:
+            first_timestamp = trace.first_stage_timestamp()
+            if first_timestamp is not None and first_timestamp < timestamp:
+                self._histograms[TOTAL].add((timestamp - first_timestamp) * 1e3)
+
+    def reset(self):
+        self._pending_decisions.clear()
+        for histogram in self._histograms.values():
+            histogram.reset()
+
+    def report(self) -> Dict[str, Any]:
+        return {stage: histogram.to_json() for stage, histogram in self._histograms.items()}
@@ -1,12 +1,13 @@
+import asyncio
 import logging
-from typing import Any, Awaitable, Callable, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
 
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.client.settings import AllConnectorSettings, ConnectorSetting
 from hummingbot.logger import HummingbotLogger
 
 from ...client.config.security import Security
-from .async_utils import safe_ensure_future
+from .async_utils import safe_ensure_future, safe_gather
 
 
 class TradingPairFetcher:
@@ -27,42 +28,102 @@ class TradingPairFetcher:
         return cls._sf_shared_instance
 
     def __init__(self, client_config_map: ClientConfigAdapter):
-        self.ready = False
         self.trading_pairs: Dict[str, Any] = {}
         self.fetch_pairs_from_all_exchanges = client_config_map.fetch_pairs_from_all_exchanges
-        self._fetch_task = safe_ensure_future(self.fetch_all(client_config_map))
+        self._fetch_tasks: Dict[str, asyncio.Task] = {}
+        # The connectors for which a fetch of the trading pairs finished (even if no trading pairs were obtained)
+        self._fetched_connectors: Set[str] = set()
 
-    def _fetch_pairs_from_connector_setting(
+    @property
+    def ready(self) -> bool:
+        """
+        True when all the requested fetches of trading pairs are finished. The trading pairs are fetched lazily per
+        connector, see `is_ready` to know if the trading pairs of a connector can be used.
+        """
+        return all(task.done() for task in self._fetch_tasks.values())
+
+    def is_ready(self, connector_name: str) -> bool:
+        """
+        Returns True if the trading pairs of the connector were fetched. `trading_pairs` has no entry for the connector
+        if it is fetched but can't provide its trading pairs (e.g. an exchange without API keys, unless configured to
+        fetch the pairs of all exchanges).
+        :param connector_name: the name of the connector (as registered in the connector settings)
+        """
+        return connector_name in self._fetched_connectors
+
+    def request_trading_pairs(self, connector_name: str):
+        """
+        Starts fetching the trading pairs of the connector in the background, unless they have already been requested.
+        The trading pairs are available in `trading_pairs` once the fetch finishes. A connector that does not provide
+        its trading pairs (see `_fetches_trading_pairs`) is ready right away.
+        :param connector_name: the name of the connector (as registered in the connector settings)
+        """
+        if connector_name in self._fetched_connectors or connector_name in self._fetch_tasks:
+            return
+        conn_setting = self._all_connector_settings().get(connector_name)
+        if conn_setting is None or not self._fetches_trading_pairs(conn_setting):
+            self._fetched_connectors.add(connector_name)
+        else:
+            self._fetch_tasks[connector_name] = safe_ensure_future(self.fetch_trading_pairs(connector_name))
+
+    async def fetch_trading_pairs(self, connector_name: str):
+        """
+        Fetches the trading pairs of one connector. The connectors use the exchange info cache when it is enabled,
+        so this does not require a request to the exchange if the connector information was recently stored.
+        :param connector_name: the name of the connector (as registered in the connector settings)
+        """
+        await Security.wait_til_decryption_done()
+        connector_settings = self._all_connector_settings()
+        conn_setting = connector_settings.get(connector_name)
+        if conn_setting is not None:
+            await self._fetch_pairs_for_connector_setting(conn_setting, connector_settings)
+        self._fetched_connectors.add(connector_name)
+
+    async def fetch_all(self, client_config_map: ClientConfigAdapter):
+        """
+        Fetches the trading pairs of all the connectors at once (only the connected ones, unless configured to fetch
+        the pairs of all exchanges)
+        """
+        await Security.wait_til_decryption_done()
+        connector_settings = self._all_connector_settings()
+        await safe_gather(*[self._fetch_pairs_for_connector_setting(conn_setting, connector_settings)
+                            for conn_setting in connector_settings.values()])
+        self._fetched_connectors.update(connector_settings.keys())
+
+    async def _fetch_pairs_for_connector_setting(
+            self,
+            conn_setting: ConnectorSetting,
+            connector_settings: Dict[str, ConnectorSetting]):
+        # XXX(martin_kou): Some connectors, e.g. uniswap v3, aren't completed yet. Ignore if you can't find the
+        # data source module for them.
+        try:
+            if conn_setting.base_name().endswith("paper_trade"):
+                await self._fetch_pairs_from_connector_setting(
+                    connector_setting=connector_settings[conn_setting.parent_name],
+                    connector_name=conn_setting.name
+                )
+            elif self._fetches_trading_pairs(conn_setting):
+                await self._fetch_pairs_from_connector_setting(connector_setting=conn_setting)
+        except ModuleNotFoundError:
+            pass
+        except Exception:
+            self.logger().exception(f"An error occurred when fetching trading pairs for {conn_setting.name}."
+                                    "Please check the logs")
+
+    def _fetches_trading_pairs(self, conn_setting: ConnectorSetting) -> bool:
+        # The pairs of paper trade connectors are fetched from their parent exchange. The other exchanges need API keys,
+        # unless configured to fetch the pairs of all exchanges.
+        return (conn_setting.base_name().endswith("paper_trade")
+                or self.fetch_pairs_from_all_exchanges
+                or conn_setting.connector_connected())
+
+    async def _fetch_pairs_from_connector_setting(
             self,
             connector_setting: ConnectorSetting,
             connector_name: Optional[str] = None):
         connector_name = connector_name or connector_setting.name
         connector = connector_setting.non_trading_connector_instance_with_default_configuration()
-        safe_ensure_future(self.call_fetch_pairs(connector.all_trading_pairs(), connector_name))
-
-    async def fetch_all(self, client_config_map: ClientConfigAdapter):
-        await Security.wait_til_decryption_done()
-        connector_settings = self._all_connector_settings()
-        for conn_setting in connector_settings.values():
-            # XXX(martin_kou): Some connectors, e.g. uniswap v3, aren't completed yet. Ignore if you can't find the
-            # data source module for them.
-            try:
-                if conn_setting.base_name().endswith("paper_trade"):
-                    self._fetch_pairs_from_connector_setting(
-                        connector_setting=connector_settings[conn_setting.parent_name],
-                        connector_name=conn_setting.name
-                    )
-                elif not self.fetch_pairs_from_all_exchanges:
-                    if conn_setting.connector_connected():
-                        self._fetch_pairs_from_connector_setting(connector_setting=conn_setting)
-                else:
-                    self._fetch_pairs_from_connector_setting(connector_setting=conn_setting)
-            except ModuleNotFoundError:
-                continue
-            except Exception:
-                self.logger().exception(f"An error occurred when fetching trading pairs for {conn_setting.name}."
-                                        "Please check the logs")
-        self.ready = True
+        await self.call_fetch_pairs(connector.all_trading_pairs(), connector_name)
 
     async def call_fetch_pairs(self, fetch_fn: Callable[[], Awaitable[List[str]]], exchange_name: str):
         try:
@@ -4,6 +4,12 @@ from copy import deepcopy
 from typing import Any, Dict, List, Optional, Union
 
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.utils.order_latency_tracer import (
+    REQUEST_SENT,
+    RESPONSE_RECEIVED,
+    THROTTLER_ACQUIRED,
+    OrderLatencyTracer,
+)
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
@@ -91,6 +97,8 @@ class RESTAssistant:
         )
 
         async with self._throttler.execute_task(limit_id=throttler_limit_id):
+            if OrderLatencyTracer.enabled:
+                OrderLatencyTracer.stamp_current(THROTTLER_ACQUIRED)
             response = await self.call(request=request, timeout=timeout)
 
             if 400 <= response.status:
@@ -105,7 +113,11 @@ class RESTAssistant:
         request = deepcopy(request)
         request = await self._pre_process_request(request)
         request = await self._authenticate(request)
+        if OrderLatencyTracer.enabled:
+            OrderLatencyTracer.stamp_current(REQUEST_SENT)
         resp = await wait_for(self._connection.call(request), timeout)
+        if OrderLatencyTracer.enabled:
+            OrderLatencyTracer.stamp_current(RESPONSE_RECEIVED)
         resp = await self._post_process_response(resp)
         return resp
 
@@ -0,0 +1,123 @@
+from typing import Iterable, Iterator, List
+
+import numpy as np
+import pandas as pd
+
+
+class CandlesRingBuffer:
+    """
+    Stores the candles of a feed in preallocated NumPy column arrays used as a ring buffer.
+
+    It implements the subset of the `deque` interface used by the candles feeds (`append`, `appendleft`, `extendleft`,
+    `pop`, `clear`, `maxlen`, `len` and indexing), with the same semantics as a deque with a maximum length: appending to
+    one side of a full buffer drops the candle at the other side. Each candle is a row of values, one per column.
+
+    The buffer keeps a version number, incremented every time the candles change, and the DataFrame built from the
+    candles is reused until the next change.
+    """
+
+    def __init__(self, columns: List[str], maxlen: int):
+        self._columns = list(columns)
+        self._maxlen = maxlen
+        self._data = np.zeros((len(columns), maxlen), dtype=float)
+        self._start = 0
+        self._size = 0
+        self._version = 0
+        self._df_version = -1
+        self._df = None
+
+    @property
+    def maxlen(self) -> int:
+        return self._maxlen
+
+    @property
+    def version(self) -> int:
+        """
+        Incremented every time a candle is added, removed or updated
+        """
+        return self._version
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        """
+        Returns a copy of the candle at the index (negative indexes count from the end)
+        """
+        return self._data[:, self._physical_index(index)].copy()
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        for index in range(self._size):
+            yield self[index]
+
+    def append(self, candle: Iterable[float]):
+        if self._maxlen == 0:
+            return
+        if self._size == self._maxlen:
+            self._data[:, self._start] = candle
+            self._start = (self._start + 1) % self._maxlen
+        else:
+            self._data[:, (self._start + self._size) % self._maxlen] = candle
+            self._size += 1
+        self._version += 1
+
+    def appendleft(self, candle: Iterable[float]):
+        if self._maxlen == 0:
+            return
+        self._start = (self._start - 1) % self._maxlen
+        self._data[:, self._start] = candle
+        if self._size < self._maxlen:
+            self._size += 1
+        self._version += 1
+
+    def extendleft(self, candles: Iterable[Iterable[float]]):
+        for candle in candles:
+            self.appendleft(candle)
+
+    def pop(self) -> np.ndarray:
+        if self._size == 0:
+            raise IndexError("pop from an empty candles buffer")
+        candle = self[-1]
+        self._size -= 1
+        self._version += 1
+        return candle
+
+    def clear(self):
+        self._start = 0
+        self._size = 0
+        self._version += 1
+
+    def get_columns_segments(self) -> List[np.ndarray]:
+        """
+        Returns the candles as one or two read-only views of the column arrays (two when the candles wrap around the
+        end of the buffer), in chronological order
+        """
+        end = self._start + self._size
+        if end <= self._maxlen:
+            segments = [self._data[:, self._start:end]]
+        else:
+            segments = [self._data[:, self._start:], self._data[:, :end - self._maxlen]]
+        views = []
+        for segment in segments:
+            view = segment.view()
+            view.flags.writeable = False
+            views.append(view)
+        return views
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Returns the candles as a DataFrame. The DataFrame is built only if the candles changed since the last call, so
+        it is shared between the callers and must not be modified in place.
+        """
+        if self._df_version != self._version:
+            values = np.concatenate(self.get_columns_segments(), axis=1)
+            self._df = pd.DataFrame(values.T, columns=self._columns, copy=False)
+            self._df_version = self._version
+        return self._df
+
+    def _physical_index(self, index: int) -> int:
+        if index < 0:
+            index += self._size
+        if index < 0 or index >= self._size:
+            raise IndexError("candles buffer index out of range")
+        return (self._start + index) % self._maxlen
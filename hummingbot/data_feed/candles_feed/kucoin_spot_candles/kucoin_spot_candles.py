@@ -63,7 +63,7 @@ class KucoinSpotCandles(CandlesBase):
 
     @property
     def candles_df(self) -> pd.DataFrame:
-        df = pd.DataFrame(self._candles, columns=self.columns, dtype=float)
+        df = self._candles.to_dataframe().copy(deep=False)
         return df.sort_values(by="timestamp", ascending=True)
 
     async def check_network(self) -> NetworkStatus:
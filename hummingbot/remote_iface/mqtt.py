@@ -2,6 +2,7 @@
 
 import asyncio
 import functools
+import json
 import logging
 import threading
 import time
@@ -26,9 +27,11 @@ from commlib.transports.mqtt import ConnectionParameters as MQTTConnectionParame
 
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, DeductedFromReturnsTradeFee
 from hummingbot.core.event import events
-from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.event.side_channel_event_bus import SideChannelEventForwarder
 from hummingbot.core.pubsub import PubSub
 from hummingbot.core.utils.async_utils import call_sync, safe_ensure_future
+from hummingbot.core.utils.clock_instrumentation import ClockInstrumentation
+from hummingbot.core.utils.order_latency_tracer import OrderLatencyTracer
 from hummingbot.notifier.notifier_base import NotifierBase
 from hummingbot.remote_iface.messages import (
     MQTT_STATUS_CODE,
@@ -386,8 +389,10 @@ class MQTTMarketEventForwarder:
         )
         self._topic = f'{topic_prefix}{TopicSpecs.INTERNAL_EVENTS}'
 
-        self._mqtt_fowarder: SourceInfoEventForwarder = \
-            SourceInfoEventForwarder(self._send_mqtt_event)
+        # The events are published outside of the connectors event dispatch, and dropped if the publication can not
+        # keep up with them
+        self._mqtt_fowarder: SideChannelEventForwarder = SideChannelEventForwarder(
+            self._send_mqtt_event, name="MQTTMarketEventForwarder", drop_on_overflow=True)
         self._market_event_pairs: List[Tuple[int, EventListener]] = [
             (events.MarketEvent.BuyOrderCreated, self._mqtt_fowarder),
             (events.MarketEvent.BuyOrderCompleted, self._mqtt_fowarder),
@@ -578,6 +583,7 @@ class MQTTGateway(Node):
     _INTERVAL_HEALTH_CHECK = 1.0
     _INTERVAL_RESTART_SHORT = 5.0
     _INTERVAL_RESTART_LONG = 10.0
+    _INTERVAL_PERFORMANCE_REPORTS = 10.0
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -841,6 +847,29 @@ class MQTTGateway(Node):
     def _stop_health_monitoring_loop(self):
         self._stop_event_async.set()
 
+    def _start_performance_reports_loop(self):
+        if threading.current_thread() != threading.main_thread():  # pragma: no cover
+            self._ev_loop.call_soon_threadsafe(self._start_performance_reports_loop)
+            return
+        safe_ensure_future(self._performance_reports_loop(),
+                           loop=self._ev_loop)
+
+    async def _performance_reports_loop(self):
+        while not self._stop_event_async.is_set():
+            await asyncio.sleep(self._INTERVAL_PERFORMANCE_REPORTS)
+            if self.health:
+                self.broadcast_performance_reports()
+
+    def broadcast_performance_reports(self):
+        if OrderLatencyTracer.enabled:
+            latency_report = OrderLatencyTracer.report_all()
+            if latency_report:
+                self.broadcast_status_update(json.dumps(latency_report), msg_type="order_latency")
+        if ClockInstrumentation.enabled:
+            clock_instrumentation = ClockInstrumentation.get_instance()
+            if clock_instrumentation.has_samples:
+                self.broadcast_status_update(json.dumps(clock_instrumentation.report()), msg_type="clock_stats")
+
     def start(self, with_health: bool = True) -> None:
         self._init_logger()
         self._init_notifier()
@@ -850,6 +879,7 @@ class MQTTGateway(Node):
 
         if with_health:
             self._start_health_monitoring_loop()
+            self._start_performance_reports_loop()
 
         self.run()
         self.broadcast_status_update("online", msg_type="availability")
@@ -1,11 +1,21 @@
 import numpy as np
 import logging
 cimport numpy as np
+from libc.math cimport isfinite, sqrt
 
 
 pmm_logger = None
 
 cdef class RingBuffer:
+    """
+    Fixed length buffer of the last values added.
+
+    The sum and the sum of squares of the values (shifted by a reference value close to them, to avoid the
+    catastrophic cancellation of the naive sum of squares) are updated when a value is added and when one is
+    overwritten, so the mean, variance and standard deviation are read in O(1). The sum of the squared differences
+    between consecutive values is tracked too if `track_squared_diffs` is set. The accumulators are recomputed from
+    the values every time the buffer wraps around, to not accumulate rounding errors.
+    """
     @classmethod
     def logger(cls):
         global pmm_logger
@@ -13,24 +23,67 @@ cdef class RingBuffer:
             pmm_logger = logging.getLogger(__name__)
         return pmm_logger
 
-    def __cinit__(self, int length):
+    def __cinit__(self, int length, bint track_squared_diffs=False):
         self._length = length
         self._buffer = np.zeros(length, dtype=np.float64)
         self._delimiter = 0
         self._is_full = False
+        self._track_squared_diffs = track_squared_diffs
+        self.c_reset_accumulators()
 
     def __dealloc__(self):
         self._buffer = None
 
     cdef void c_add_value(self, float val):
-        self._buffer[self._delimiter] = val
+        cdef:
+            double value = val
+            double oldest_value = 0
+            double shifted_value
+            bint overwrites_finite_value = True
+
+        if self._is_full:
+            oldest_value = self._buffer[self._delimiter]
+            overwrites_finite_value = isfinite(oldest_value)
+            shifted_value = oldest_value - self._shift
+            self._shifted_sum -= shifted_value
+            self._shifted_sum_of_squares -= shifted_value * shifted_value
+            if self._track_squared_diffs:
+                self._squared_diffs_sum -= (self._buffer[(self._delimiter + 1) % self._length] - oldest_value) ** 2
+        elif self._delimiter == 0:
+            self._shift = value
+        if self._track_squared_diffs and not self.c_is_empty():
+            self._squared_diffs_sum += (value - self.c_get_last_value()) ** 2
+        shifted_value = value - self._shift
+        self._shifted_sum += shifted_value
+        self._shifted_sum_of_squares += shifted_value * shifted_value
+
+        self._buffer[self._delimiter] = value
         self.c_increment_delimiter()
+        if not overwrites_finite_value or (self._is_full and self._delimiter == 0):
+            self.c_reset_accumulators()
 
     cdef void c_increment_delimiter(self):
         self._delimiter = (self._delimiter + 1) % self._length
         if not self._is_full and self._delimiter == 0:
             self._is_full = True
 
+    cdef void c_reset_accumulators(self):
+        cdef np.ndarray[np.double_t, ndim=1] values = self.c_get_as_numpy_array()
+        cdef np.ndarray[np.double_t, ndim=1] shifted_values
+
+        if values.size == 0:
+            self._shift = 0
+            self._shifted_sum = 0
+            self._shifted_sum_of_squares = 0
+            self._squared_diffs_sum = 0
+            return
+        self._shift = values[values.size - 1]
+        shifted_values = values - self._shift
+        self._shifted_sum = np.sum(shifted_values)
+        self._shifted_sum_of_squares = np.dot(shifted_values, shifted_values)
+        if self._track_squared_diffs:
+            self._squared_diffs_sum = np.sum(np.square(np.diff(values)))
+
     cdef bint c_is_empty(self):
         return (not self._is_full) and (0==self._delimiter)
 
@@ -42,39 +95,63 @@ cdef class RingBuffer:
     cdef bint c_is_full(self):
         return self._is_full
 
+    cdef int64_t c_size(self):
+        return self._length if self._is_full else self._delimiter
+
+    cdef double c_sum(self):
+        return self._shift * self.c_size() + self._shifted_sum
+
+    cdef double c_squared_diffs_sum(self):
+        if not self._track_squared_diffs:
+            return np.nan
+        return self._squared_diffs_sum
+
     cdef double c_mean_value(self):
         result = np.nan
         if self._is_full:
-            result=np.mean(self.c_get_as_numpy_array())
+            result = self._shift + self._shifted_sum / self._length
         return result
 
     cdef double c_variance(self):
+        cdef double shifted_mean
         result = np.nan
         if self._is_full:
-            result = np.var(self.c_get_as_numpy_array())
+            shifted_mean = self._shifted_sum / self._length
+            result = max(self._shifted_sum_of_squares / self._length - shifted_mean * shifted_mean, 0)
         return result
 
     cdef double c_std_dev(self):
         result = np.nan
         if self._is_full:
-            result = np.std(self.c_get_as_numpy_array())
+            result = sqrt(self.c_variance())
         return result
 
-    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
-        cdef np.ndarray[np.int16_t, ndim=1] indexes
+    cdef tuple c_get_segments(self):
+        cdef:
+            np.ndarray[np.double_t, ndim=1] oldest_values
+            np.ndarray[np.double_t, ndim=1] newest_values
 
-        if not self._is_full:
-            indexes = np.arange(0, stop=self._delimiter, dtype=np.int16)
+        buffer = np.asarray(self._buffer)
+        if self._is_full:
+            oldest_values = buffer[self._delimiter:]
+            newest_values = buffer[:self._delimiter]
         else:
-            indexes = np.arange(self._delimiter, stop=self._delimiter + self._length,
-                                dtype=np.int16) % self._length
-        return np.asarray(self._buffer)[indexes]
+            oldest_values = buffer[:self._delimiter]
+            newest_values = buffer[:0]
+        oldest_values.flags.writeable = False
+        newest_values.flags.writeable = False
+        return oldest_values, newest_values
 
-    def __init__(self, length):
+    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
+        return np.concatenate(self.c_get_segments())
+
+    def __init__(self, length, track_squared_diffs=False):
         self._length = length
         self._buffer = np.zeros(length, dtype=np.double)
         self._delimiter = 0
         self._is_full = False
+        self._track_squared_diffs = track_squared_diffs
+        self.c_reset_accumulators()
 
     def add_value(self, val):
         self.c_add_value(val)
@@ -82,6 +159,13 @@ cdef class RingBuffer:
     def get_as_numpy_array(self):
         return self.c_get_as_numpy_array()
 
+    def get_segments(self):
+        """
+        Returns the values of the buffer, from the oldest to the newest, as two read-only views of the underlying
+        array (no copy): the second one holds the values added after the buffer wrapped around.
+        """
+        return self.c_get_segments()
+
     def get_last_value(self):
         return self.c_get_last_value()
 
@@ -89,6 +173,21 @@ cdef class RingBuffer:
     def is_full(self):
         return self.c_is_full()
 
+    @property
+    def size(self) -> int:
+        return self.c_size()
+
+    @property
+    def sum(self) -> float:
+        return self.c_sum()
+
+    @property
+    def squared_diffs_sum(self) -> float:
+        """
+        The sum of the squared differences between consecutive values (NaN when they are not tracked)
+        """
+        return self.c_squared_diffs_sum()
+
     @property
     def mean_value(self):
         return self.c_mean_value()
@@ -113,6 +212,7 @@ cdef class RingBuffer:
         self._buffer = np.zeros(value, dtype=np.float64)
         self._delimiter = 0
         self._is_full = False
+        self.c_reset_accumulators()
 
         for val in data[-value:]:
             self.add_value(val)
@@ -9,6 +9,9 @@ pmm_logger = None
 
 
 class BaseTrailingIndicator(ABC):
+    # Whether the sampling buffer tracks the sum of the squared differences between consecutive samples
+    TRACK_SAMPLES_SQUARED_DIFFS = False
+
     @classmethod
     def logger(cls):
         global pmm_logger
@@ -17,7 +20,7 @@ class BaseTrailingIndicator(ABC):
         return pmm_logger
 
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
-        self._sampling_buffer = RingBuffer(sampling_length)
+        self._sampling_buffer = RingBuffer(sampling_length, track_squared_diffs=self.TRACK_SAMPLES_SQUARED_DIFFS)
         self._processing_buffer = RingBuffer(processing_length)
         self._samples_length = 0
 
@@ -35,7 +38,8 @@ class BaseTrailingIndicator(ABC):
         Processing of the processing buffer to return final value.
         Default behavior is buffer average
         """
-        return np.mean(self._processing_buffer.get_as_numpy_array())
+        size = self._processing_buffer.size
+        return self._processing_buffer.sum / size if size > 0 else np.nan
 
     @property
     def current_value(self) -> float:
@@ -51,7 +55,7 @@ class BaseTrailingIndicator(ABC):
 
     @property
     def is_sampling_buffer_changed(self) -> bool:
-        buffer_len = len(self._sampling_buffer.get_as_numpy_array())
+        buffer_len = self._sampling_buffer.size
         is_changed = self._samples_length != buffer_len
         self._samples_length = buffer_len
         return is_changed
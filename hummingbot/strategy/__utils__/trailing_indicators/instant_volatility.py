@@ -3,6 +3,8 @@ import numpy as np
 
 
 class InstantVolatilityIndicator(BaseTrailingIndicator):
+    TRACK_SAMPLES_SQUARED_DIFFS = True
+
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
         super().__init__(sampling_length, processing_length)
 
@@ -10,8 +12,7 @@ class InstantVolatilityIndicator(BaseTrailingIndicator):
         # The standard deviation should be calculated between ticks and not with a mean of the whole buffer
         # Otherwise if the asset is trending, changing the length of the buffer would result in a greater volatility as more ticks would be further away from the mean
         # which is a nonsense result. If volatility of the underlying doesn't change in fact, changing the length of the buffer shouldn't change the result.
-        np_sampling_buffer = self._sampling_buffer.get_as_numpy_array()
-        vol = np.sqrt(np.sum(np.square(np.diff(np_sampling_buffer))) / np_sampling_buffer.size)
+        vol = np.sqrt(self._sampling_buffer.squared_diffs_sum / self._sampling_buffer.size)
         return vol
 
     def _processing_calculation(self) -> float:
@@ -17,12 +17,22 @@ cdef class TradingIntensityIndicator:
         object _trades_forwarder
         OrderBook _order_book
         object _price_delegate
-        list _last_quotes
+        list _quote_timestamps
+        list _quote_prices
         int _sampling_length
         int _samples_length
+        dict _level_slots
+        list _free_level_slots
+        object _level_prices
+        object _level_amounts
+        object _level_trades_counts
+        int _used_level_slots
+        bint _samples_updated
 
     cdef c_calculate(self, timestamp)
     cdef c_register_trade(self, object trade)
+    cdef c_add_price_level_amount(self, double price_level, double amount)
+    cdef c_remove_price_level_amount(self, double price_level, double amount)
     cdef c_estimate_intensity(self)
 
 cdef class TradesForwarder(EventListener):
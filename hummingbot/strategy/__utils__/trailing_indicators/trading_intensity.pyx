@@ -2,6 +2,7 @@
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
 import warnings
+from bisect import bisect_left
 from decimal import Decimal
 from typing import Tuple
 
@@ -17,6 +18,36 @@ from hummingbot.core.event.event_listener cimport EventListener
 from hummingbot.core.event.events import OrderBookEvent
 from hummingbot.strategy.asset_price_delegate import AssetPriceDelegate
 
+# Initial number of price levels the arrays of arrival amounts can hold (they grow when needed)
+INITIAL_PRICE_LEVELS_CAPACITY = 64
+# Relative residual of the closed form fit above which it is refined with a non linear least squares fit
+FIT_REFINEMENT_TOLERANCE = 0.05
+
+
+def fit_exponential_decay(price_levels: np.ndarray, lambdas: np.ndarray) -> Tuple[float, float]:
+    """
+    Fits lambda = a * exp(-b * price_level) in closed form, with a least squares fit of log(lambda), weighted by
+    lambda^2 to approximate the least squares fit of lambda. b is bounded to be positive.
+    :return: a, b
+    """
+    log_lambdas = np.log(lambdas)
+    weights = lambdas * lambdas
+    weights_sum = weights.sum()
+    mean_level = (weights * price_levels).sum() / weights_sum
+    mean_log_lambda = (weights * log_lambdas).sum() / weights_sum
+    levels_variance = (weights * (price_levels - mean_level) ** 2).sum()
+    if levels_variance > 0:
+        slope = (weights * (price_levels - mean_level) * (log_lambdas - mean_log_lambda)).sum() / levels_variance
+    else:
+        slope = 0.0
+    if slope > 0:
+        # The intensity can't grow with the distance to the mid price
+        slope = 0.0
+        mean_log_lambda = np.log((weights * lambdas).sum() / weights_sum)
+        mean_level = 0.0
+    return float(np.exp(mean_log_lambda - slope * mean_level)), float(-slope)
+
+
 cdef class TradesForwarder(EventListener):
     def __init__(self, indicator: 'TradingIntensityIndicator'):
         self._indicator = indicator
@@ -26,6 +57,16 @@ cdef class TradesForwarder(EventListener):
 
 
 cdef class TradingIntensityIndicator:
+    """
+    Estimates the trading intensity parameters (alpha, kappa) of the Avellaneda-Stoikov model, fitting
+    lambda = alpha * exp(-kappa * price_level), where lambda is the amount traded at a distance price_level from the
+    mid price, over the last `sampling_length` samples.
+
+    The amounts traded at each price level are kept up to date incrementally in NumPy arrays when trades are
+    registered and when samples leave the window. The curve is fitted in closed form (weighted log-linear least
+    squares), and refined with a non linear least squares fit warm-started from the closed form solution only when
+    the closed form fit is off by more than FIT_REFINEMENT_TOLERANCE. The fit only runs when the samples changed.
+    """
 
     def __init__(self, order_book: OrderBook, price_delegate: AssetPriceDelegate, sampling_length: int = 30):
         self._alpha = 0
@@ -38,7 +79,15 @@ cdef class TradingIntensityIndicator:
         self._price_delegate = price_delegate
         self._sampling_length = sampling_length
         self._samples_length = 0
-        self._last_quotes = []
+        self._quote_timestamps = []
+        self._quote_prices = []
+        self._level_slots = {}
+        self._free_level_slots = []
+        self._level_prices = np.zeros(INITIAL_PRICE_LEVELS_CAPACITY, dtype=np.float64)
+        self._level_amounts = np.zeros(INITIAL_PRICE_LEVELS_CAPACITY, dtype=np.float64)
+        self._level_trades_counts = np.zeros(INITIAL_PRICE_LEVELS_CAPACITY, dtype=np.int64)
+        self._used_level_slots = 0
+        self._samples_updated = False
 
         warnings.simplefilter("ignore", OptimizeWarning)
 
@@ -67,54 +116,70 @@ cdef class TradingIntensityIndicator:
     @property
     def last_quotes(self) -> list:
         """A helper method to be used in unit tests"""
-        return self._last_quotes
+        # Descending order of price-timestamp quotes
+        return [{"timestamp": timestamp, "price": price}
+                for timestamp, price in zip(reversed(self._quote_timestamps), reversed(self._quote_prices))]
 
     @last_quotes.setter
     def last_quotes(self, value):
         """A helper method to be used in unit tests"""
-        self._last_quotes = value
+        self._quote_timestamps = [quote["timestamp"] for quote in reversed(value)]
+        self._quote_prices = [quote["price"] for quote in reversed(value)]
+
+    @property
+    def price_levels_amounts(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the price levels traded in the samples window and the amount traded at each of them
+        """
+        active_slots = self._level_trades_counts[:self._used_level_slots] > 0
+        return (self._level_prices[:self._used_level_slots][active_slots],
+                self._level_amounts[:self._used_level_slots][active_slots])
 
     def calculate(self, timestamp):
         """A helper method to be used in unit tests"""
         self.c_calculate(timestamp)
 
     cdef c_calculate(self, timestamp):
+        cdef:
+            int quote_index
+            int latest_processed_quote_idx = -1
+
         price = self._price_delegate.get_price_by_type(PriceType.MidPrice)
-        # Descending order of price-timestamp quotes
-        self._last_quotes = [{'timestamp': timestamp, 'price': price}] + self._last_quotes
+        # Ascending order of price-timestamp quotes
+        self._quote_timestamps.append(timestamp)
+        self._quote_prices.append(price)
 
-        latest_processed_quote_idx = None
         for trade in self._current_trade_sample:
-            for i, quote in enumerate(self._last_quotes):
-                if quote["timestamp"] < trade.timestamp:
-                    if latest_processed_quote_idx is None or i < latest_processed_quote_idx:
-                        latest_processed_quote_idx = i
-                    trade = {"price_level": abs(trade.price - float(quote["price"])), "amount": trade.amount}
-
-                    if quote["timestamp"] + 1 not in self._trade_samples.keys():
-                        self._trade_samples[quote["timestamp"] + 1] = []
-
-                    self._trade_samples[quote["timestamp"] + 1] += [trade]
-                    break
+            # The latest quote before the trade
+            quote_index = bisect_left(self._quote_timestamps, trade.timestamp) - 1
+            if quote_index < 0:
+                continue
+            latest_processed_quote_idx = max(latest_processed_quote_idx, quote_index)
+            sample_timestamp = self._quote_timestamps[quote_index] + 1
+            price_level = abs(trade.price - float(self._quote_prices[quote_index]))
+            if sample_timestamp not in self._trade_samples:
+                self._trade_samples[sample_timestamp] = []
+            self._trade_samples[sample_timestamp].append((price_level, trade.amount))
+            self.c_add_price_level_amount(price_level, trade.amount)
+            self._samples_updated = True
 
         # THere are no trades left to process
         self._current_trade_sample = []
         # Store quotes that happened after the latest trade + one before
-        if latest_processed_quote_idx is not None:
-            self._last_quotes = self._last_quotes[0:latest_processed_quote_idx + 1]
-
-        if len(self._trade_samples.keys()) > self._sampling_length:
-            timestamps = list(self._trade_samples.keys())
-            timestamps.sort()
-            timestamps = timestamps[-self._sampling_length:]
-
-            trade_samples = {}
-            for timestamp in timestamps:
-                trade_samples[timestamp] = self._trade_samples[timestamp]
-            self._trade_samples = trade_samples
-
-        if self.is_sampling_buffer_full:
+        if latest_processed_quote_idx > 0:
+            del self._quote_timestamps[:latest_processed_quote_idx]
+            del self._quote_prices[:latest_processed_quote_idx]
+
+        if len(self._trade_samples) > self._sampling_length:
+            timestamps = sorted(self._trade_samples.keys())
+            for sample_timestamp in timestamps[:len(timestamps) - self._sampling_length]:
+                for price_level, amount in self._trade_samples.pop(sample_timestamp):
+                    self.c_remove_price_level_amount(price_level, amount)
+            self._samples_updated = True
+
+        if self.is_sampling_buffer_full and self._samples_updated:
             self.c_estimate_intensity()
+            self._samples_updated = False
 
     def register_trade(self, trade):
         """A helper method to be used in unit tests"""
@@ -123,44 +188,62 @@ cdef class TradingIntensityIndicator:
     cdef c_register_trade(self, object trade):
         self._current_trade_sample.append(trade)
 
-    cdef c_estimate_intensity(self):
-        cdef:
-            dict trades_consolidated
-            list lambdas
-            list price_levels
-
-        # Calculate lambdas / trading intensities
-        lambdas = []
-
-        trades_consolidated = {}
-        price_levels = []
-        for timestamp in self._trade_samples.keys():
-            tick = self._trade_samples[timestamp]
-            for trade in tick:
-                if trade['price_level'] not in trades_consolidated.keys():
-                    trades_consolidated[trade['price_level']] = 0
-                    price_levels += [trade['price_level']]
-
-                trades_consolidated[trade['price_level']] += trade['amount']
+    cdef c_add_price_level_amount(self, double price_level, double amount):
+        cdef int slot
+
+        slot = self._level_slots.get(price_level, -1)
+        if slot < 0:
+            if len(self._free_level_slots) > 0:
+                slot = self._free_level_slots.pop()
+            else:
+                if self._used_level_slots == len(self._level_prices):
+                    self._level_prices = np.concatenate((self._level_prices, np.zeros_like(self._level_prices)))
+                    self._level_amounts = np.concatenate((self._level_amounts, np.zeros_like(self._level_amounts)))
+                    self._level_trades_counts = np.concatenate(
+                        (self._level_trades_counts, np.zeros_like(self._level_trades_counts)))
+                slot = self._used_level_slots
+                self._used_level_slots += 1
+            self._level_slots[price_level] = slot
+            self._level_prices[slot] = price_level
+        self._level_amounts[slot] += amount
+        self._level_trades_counts[slot] += 1
+
+    cdef c_remove_price_level_amount(self, double price_level, double amount):
+        cdef int slot = self._level_slots[price_level]
+
+        self._level_trades_counts[slot] -= 1
+        if self._level_trades_counts[slot] == 0:
+            # Reset the amount instead of subtracting, to not accumulate rounding errors
+            self._level_amounts[slot] = 0
+            del self._level_slots[price_level]
+            self._free_level_slots.append(slot)
+        else:
+            self._level_amounts[slot] -= amount
 
-        price_levels = sorted(price_levels, reverse=True)
-
-        for price_level in price_levels:
-            lambdas += [trades_consolidated[price_level]]
+    cdef c_estimate_intensity(self):
+        price_levels, lambdas = self.price_levels_amounts
+        if len(price_levels) < 2:
+            # Two parameters can't be estimated from a single price level
+            return
 
         # Adjust to be able to calculate log
-        lambdas_adj = [10**-10 if x==0 else x for x in lambdas]
-
-        # Fit the probability density function; reuse previously calculated parameters as initial values
-        try:
-            params = curve_fit(lambda t, a, b: a*np.exp(-b*t),
-                               price_levels,
-                               lambdas_adj,
-                               p0=(self._alpha, self._kappa),
-                               method='dogbox',
-                               bounds=([0, 0], [np.inf, np.inf]))
-
-            self._kappa = Decimal(str(params[0][1]))
-            self._alpha = Decimal(str(params[0][0]))
-        except (RuntimeError, ValueError) as e:
-            pass
+        lambdas = np.where(lambdas <= 0, 10**-10, lambdas)
+
+        alpha, kappa = fit_exponential_decay(price_levels, lambdas)
+        residual = np.sqrt(((lambdas - alpha * np.exp(-kappa * price_levels)) ** 2).sum() / (lambdas ** 2).sum())
+
+        if residual > FIT_REFINEMENT_TOLERANCE:
+            # Refine the fit of the probability density function, starting from the closed form solution
+            try:
+                params = curve_fit(lambda t, a, b: a*np.exp(-b*t),
+                                   price_levels,
+                                   lambdas,
+                                   p0=(alpha, kappa),
+                                   method='dogbox',
+                                   bounds=([0, 0], [np.inf, np.inf]))
+                alpha, kappa = params[0]
+            except (RuntimeError, ValueError) as e:
+                pass
+
+        self._kappa = Decimal(str(kappa))
+        self._alpha = Decimal(str(alpha))
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from collections import defaultdict, deque
 from decimal import Decimal
@@ -25,7 +26,7 @@ from hummingbot.core.event.events import (
     SellOrderCompletedEvent,
 )
 from hummingbot.core.network_iterator import NetworkStatus
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.strategy.cross_exchange_market_making.cross_exchange_market_making_config_map_pydantic import (
     CrossExchangeMarketMakingConfigMap,
     PassiveOrderRefreshMode,
@@ -119,6 +120,12 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
         self._last_taker_buy_price = None
         self._last_taker_sell_price = None
 
+        # Gateway taker quotes requested during the current tick, by market, trading pair, side and amount
+        self._taker_quotes: Dict[Tuple[ExchangeBase, str, bool, Decimal], asyncio.Future] = {}
+        self._taker_quotes_timestamp = None
+        # Serializes the sizing and placement of new maker orders between the market pairs processed concurrently
+        self._order_creation_lock = asyncio.Lock()
+
         self._main_task = None
         self._gateway_quotes_task = None
         self._cancel_outdated_orders_task = None
@@ -439,9 +446,12 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                         limit_order.client_order_id in self._maker_to_taker_order_ids.keys():
                     market_pair_to_active_orders[market_pair].append(limit_order)
 
-            # Process each market pair independently.
-            for market_pair in self._market_pairs.values():
-                await self.process_market_pair(timestamp, market_pair, market_pair_to_active_orders[market_pair])
+            # Process each market pair independently, concurrently to not wait for the taker quotes of one pair
+            # before processing the next one.
+            await safe_gather(*[
+                self.process_market_pair(timestamp, market_pair, market_pair_to_active_orders[market_pair])
+                for market_pair in self._market_pairs.values()
+            ])
 
             # log conversion rates every 5 minutes
             if self._last_conv_rates_logged + (60. * 5) < timestamp:
@@ -455,19 +465,60 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
             if self.is_gateway_market(market_pair.taker):
                 _, _, quote_rate, _, _, base_rate, _, _, _ = self.get_conversion_rates(market_pair)
                 order_amount = self._config_map.order_amount * base_rate
-                order_price = await market_pair.taker.market.get_order_price(
-                    market_pair.taker.trading_pair,
-                    True,
-                    order_amount
-                )
+                order_price = await self.get_taker_order_price(market_pair, True, order_amount)
                 self._last_taker_buy_price = order_price
-                order_price = await market_pair.taker.market.get_order_price(
-                    market_pair.taker.trading_pair,
-                    False,
-                    order_amount
-                )
+                order_price = await self.get_taker_order_price(market_pair, False, order_amount)
                 self._last_taker_sell_price = order_price
 
+    async def get_taker_order_price(self, market_pair: MakerTakerMarketPair, is_buy: bool, amount: Decimal):
+        """
+        Returns the price quoted by a gateway taker market for an order, memoized for the current tick.
+
+        The amount is quantized to the taker order size quantum, and the quote is requested for the quantized amount.
+        The quotes requested during a tick for the same market, trading pair, side and quantized amount share a single
+        request, concurrent requests included. Amounts smaller than the quantum are quoted as requested, without
+        memoization. The quotes used to hedge filled orders are not taken from here, they are always requested.
+
+        :param market_pair: cross exchange market pair
+        :param is_buy: whether the taker order would be a buy
+        :param amount: the taker order amount
+        :return: the quoted price, or None if the quote could not be obtained
+        """
+        taker_market = market_pair.taker.market
+        taker_trading_pair = market_pair.taker.trading_pair
+        if self._taker_quotes_timestamp != self.current_timestamp:
+            self._taker_quotes.clear()
+            self._taker_quotes_timestamp = self.current_timestamp
+
+        quantized_amount = taker_market.quantize_order_amount(taker_trading_pair, Decimal(amount))
+        if quantized_amount == s_decimal_zero:
+            return await taker_market.get_order_price(taker_trading_pair, is_buy, amount)
+
+        key = (taker_market, taker_trading_pair, is_buy, quantized_amount)
+        quote = self._taker_quotes.get(key)
+        if quote is not None:
+            if quote.done():
+                return quote.result()
+            # The quote is shared, cancelling one of the callers must not cancel it for the others
+            return await asyncio.shield(quote)
+
+        # The first caller requests the quote, the callers arriving while it is requested wait for its result
+        quote = asyncio.get_event_loop().create_future()
+        self._taker_quotes[key] = quote
+        try:
+            price = await taker_market.get_order_price(taker_trading_pair, is_buy, quantized_amount)
+        except BaseException as exception:
+            self._taker_quotes.pop(key, None)
+            if isinstance(exception, Exception):
+                quote.set_exception(exception)
+                # Retrieve the exception to not log it as never retrieved when no other caller is waiting
+                quote.exception()
+            else:
+                quote.cancel()
+            raise
+        quote.set_result(price)
+        return price
+
     def ready_for_new_trades(self) -> bool:
         """
         Returns True if there is no outstanding unfilled order.
@@ -519,8 +570,6 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
         need_adjust_order = False
         anti_hysteresis_timer = self._anti_hysteresis_timers.get(market_pair, 0)
 
-        global s_decimal_zero
-
         self.take_suggested_price_sample(timestamp, market_pair)
 
         for active_order in active_orders:
@@ -859,8 +908,6 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
         buy_fill_quantity = sum([fill_event.amount for _, fill_event in buy_fill_records])
         sell_fill_quantity = sum([fill_event.amount for _, fill_event in sell_fill_records])
 
-        global s_decimal_zero
-
         taker_trading_pair = market_pair.taker.trading_pair
         taker_market = market_pair.taker.market
 
@@ -1086,9 +1133,7 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                 self.order_size_taker_balance_factor
 
             if self.is_gateway_market(market_pair.taker):
-                taker_price = await taker_market.get_order_price(taker_trading_pair,
-                                                                 False,
-                                                                 taker_size)
+                taker_price = await self.get_taker_order_price(market_pair, False, taker_size)
                 if taker_price is None:
                     self.logger().warning("Gateway: failed to obtain order price."
                                           "No market making order will be submitted.")
@@ -1121,9 +1166,7 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                 self.order_size_taker_balance_factor
 
             if self.is_gateway_market(market_pair.taker):
-                taker_price = await taker_market.get_order_price(taker_trading_pair,
-                                                                 True,
-                                                                 size)
+                taker_price = await self.get_taker_order_price(market_pair, True, size)
                 if taker_price is None:
                     self.logger().warning("Gateway: failed to obtain order price."
                                           "No market making order will be submitted.")
@@ -1188,9 +1231,7 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                 price_above_bid = (ceil(top_bid_price / price_quantum) + 1) * price_quantum
 
             if self.is_gateway_market(market_pair.taker):
-                taker_price = await taker_market.get_order_price(taker_trading_pair,
-                                                                 False,
-                                                                 size)
+                taker_price = await self.get_taker_order_price(market_pair, False, size)
                 if taker_price is None:
                     self.logger().warning("Gateway: failed to obtain order price."
                                           "No market making order will be submitted.")
@@ -1237,9 +1278,7 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                 next_price_below_top_ask = (floor(top_ask_price / price_quantum) - 1) * price_quantum
 
             if self.is_gateway_market(market_pair.taker):
-                taker_price = await taker_market.get_order_price(taker_trading_pair,
-                                                                 True,
-                                                                 size)
+                taker_price = await self.get_taker_order_price(market_pair, True, size)
                 if taker_price is None:
                     self.logger().warning("Gateway: failed to obtain order price."
                                           "No market making order will be submitted.")
@@ -1294,9 +1333,7 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
             # Maker buy
             # Taker sell
             if self.is_gateway_market(market_pair.taker):
-                taker_price = await taker_market.get_order_price(taker_trading_pair,
-                                                                 False,
-                                                                 size)
+                taker_price = await self.get_taker_order_price(market_pair, False, size)
                 if taker_price is None:
                     self.logger().warning("Gateway: failed to obtain order price."
                                           "Failed to calculate effective hedging price.")
@@ -1315,9 +1352,7 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
             # Maker sell
             # Taker buy
             if self.is_gateway_market(market_pair.taker):
-                taker_price = await taker_market.get_order_price(taker_trading_pair,
-                                                                 True,
-                                                                 size)
+                taker_price = await self.get_taker_order_price(market_pair, True, size)
                 if taker_price is None:
                     self.logger().warning("Gateway: failed to obtain order price."
                                           "Failed to calculate effective hedging price.")
@@ -1486,11 +1521,7 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                 else:
                     # Maker sell
                     # Taker buy
-                    taker_price = await market_pair.taker.market.get_order_price(
-                        market_pair.taker.trading_pair,
-                        True,
-                        quantity_remaining * base_rate
-                    )
+                    taker_price = await self.get_taker_order_price(market_pair, True, quantity_remaining * base_rate)
                     hedged_order_quantity = min(
                         quantity_remaining * base_rate,
                         market_pair.taker.market.get_available_balance(market_pair.taker.quote_asset) /
@@ -1565,9 +1596,7 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
             quote_asset_amount = taker_market.get_balance(market_pair.taker.quote_asset)
 
             if self.is_gateway_market(market_pair.taker):
-                taker_price = await taker_market.get_order_price(taker_trading_pair,
-                                                                 True,
-                                                                 size)
+                taker_price = await self.get_taker_order_price(market_pair, True, size)
                 if taker_price is None:
                     self.logger().warning("Gateway: failed to obtain order price."
                                           "Failed to determine sufficient balance.")
@@ -1622,84 +1651,87 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
         :param has_active_ask: True if there's already an active ask on the maker side, False otherwise
         """
 
-        # if there is no active bid, place bid again
-        if not has_active_bid:
-            bid_size = await self.get_market_making_size(market_pair, True)
-
-            if bid_size > s_decimal_zero:
-                bid_price = await self.get_market_making_price(market_pair, True, bid_size)
-                if not Decimal.is_nan(bid_price):
-                    effective_hedging_price = await self.calculate_effective_hedging_price(
-                        market_pair,
-                        True,
-                        bid_size
-                    )
-                    effective_hedging_price_adjusted = effective_hedging_price / \
-                        self.markettaker_to_maker_base_conversion_rate(market_pair)
-                    if LogOption.CREATE_ORDER in self.logging_options:
-                        self.log_with_clock(
-                            logging.INFO,
-                            f"({market_pair.maker.trading_pair}) Creating limit bid order for "
-                            f"{bid_size} {market_pair.maker.base_asset} at "
-                            f"{bid_price} {market_pair.maker.quote_asset}. "
-                            f"Current hedging price: {effective_hedging_price:.8f} {market_pair.maker.quote_asset} "
-                            f"(Rate adjusted: {effective_hedging_price_adjusted:.8f} {market_pair.taker.quote_asset})."
+        # The maker orders of the market pairs sharing a maker market are sized from its available balance. The orders
+        # are sized and placed for one market pair at a time, for the balance to account for the orders of the others.
+        async with self._order_creation_lock:
+            # if there is no active bid, place bid again
+            if not has_active_bid:
+                bid_size = await self.get_market_making_size(market_pair, True)
+
+                if bid_size > s_decimal_zero:
+                    bid_price = await self.get_market_making_price(market_pair, True, bid_size)
+                    if not Decimal.is_nan(bid_price):
+                        effective_hedging_price = await self.calculate_effective_hedging_price(
+                            market_pair,
+                            True,
+                            bid_size
                         )
-                    self.place_order(market_pair, True, True, bid_size, bid_price)
+                        effective_hedging_price_adjusted = effective_hedging_price / \
+                            self.markettaker_to_maker_base_conversion_rate(market_pair)
+                        if LogOption.CREATE_ORDER in self.logging_options:
+                            self.log_with_clock(
+                                logging.INFO,
+                                f"({market_pair.maker.trading_pair}) Creating limit bid order for "
+                                f"{bid_size} {market_pair.maker.base_asset} at "
+                                f"{bid_price} {market_pair.maker.quote_asset}. "
+                                f"Current hedging price: {effective_hedging_price:.8f} {market_pair.maker.quote_asset} "
+                                f"(Rate adjusted: {effective_hedging_price_adjusted:.8f} {market_pair.taker.quote_asset})."
+                            )
+                        self.place_order(market_pair, True, True, bid_size, bid_price)
+                    else:
+                        if LogOption.NULL_ORDER_SIZE in self.logging_options:
+                            self.log_with_clock(
+                                logging.WARNING,
+                                f"({market_pair.maker.trading_pair})"
+                                f"Order book on taker is too thin to place order for size: {bid_size}"
+                                f"Reduce order_size_portfolio_ratio_limit"
+                            )
                 else:
                     if LogOption.NULL_ORDER_SIZE in self.logging_options:
                         self.log_with_clock(
                             logging.WARNING,
-                            f"({market_pair.maker.trading_pair})"
-                            f"Order book on taker is too thin to place order for size: {bid_size}"
-                            f"Reduce order_size_portfolio_ratio_limit"
+                            f"({market_pair.maker.trading_pair}) Attempting to place a limit bid but the "
+                            f"bid size is 0. Skipping. Check available balance."
                         )
-            else:
-                if LogOption.NULL_ORDER_SIZE in self.logging_options:
-                    self.log_with_clock(
-                        logging.WARNING,
-                        f"({market_pair.maker.trading_pair}) Attempting to place a limit bid but the "
-                        f"bid size is 0. Skipping. Check available balance."
-                    )
-        # if there is no active ask, place ask again
-        if not has_active_ask:
-            ask_size = await self.get_market_making_size(market_pair, False)
-
-            if ask_size > s_decimal_zero:
-                ask_price = await self.get_market_making_price(market_pair, False, ask_size)
-                if not Decimal.is_nan(ask_price):
-                    effective_hedging_price = await self.calculate_effective_hedging_price(
-                        market_pair,
-                        False,
-                        ask_size
-                    )
-                    effective_hedging_price_adjusted = effective_hedging_price / \
-                        self.markettaker_to_maker_base_conversion_rate(market_pair)
-                    if LogOption.CREATE_ORDER in self.logging_options:
-                        self.log_with_clock(
-                            logging.INFO,
-                            f"({market_pair.maker.trading_pair}) Creating limit ask order for "
-                            f"{ask_size} {market_pair.maker.base_asset} at "
-                            f"{ask_price} {market_pair.maker.quote_asset}. "
-                            f"Current hedging price: {effective_hedging_price:.8f} {market_pair.maker.quote_asset} "
-                            f"(Rate adjusted: {effective_hedging_price_adjusted:.8f} {market_pair.taker.quote_asset})."
+            # if there is no active ask, place ask again
+            if not has_active_ask:
+                ask_size = await self.get_market_making_size(market_pair, False)
+
+                if ask_size > s_decimal_zero:
+                    ask_price = await self.get_market_making_price(market_pair, False, ask_size)
+                    if not Decimal.is_nan(ask_price):
+                        effective_hedging_price = await self.calculate_effective_hedging_price(
+                            market_pair,
+                            False,
+                            ask_size
                         )
-                    self.place_order(market_pair, False, True, ask_size, ask_price)
+                        effective_hedging_price_adjusted = effective_hedging_price / \
+                            self.markettaker_to_maker_base_conversion_rate(market_pair)
+                        if LogOption.CREATE_ORDER in self.logging_options:
+                            self.log_with_clock(
+                                logging.INFO,
+                                f"({market_pair.maker.trading_pair}) Creating limit ask order for "
+                                f"{ask_size} {market_pair.maker.base_asset} at "
+                                f"{ask_price} {market_pair.maker.quote_asset}. "
+                                f"Current hedging price: {effective_hedging_price:.8f} {market_pair.maker.quote_asset} "
+                                f"(Rate adjusted: {effective_hedging_price_adjusted:.8f} {market_pair.taker.quote_asset})."
+                            )
+                        self.place_order(market_pair, False, True, ask_size, ask_price)
+                    else:
+                        if LogOption.NULL_ORDER_SIZE in self.logging_options:
+                            self.log_with_clock(
+                                logging.WARNING,
+                                f"({market_pair.maker.trading_pair})"
+                                f"Order book on taker is too thin to place order for size: {ask_size}"
+                                f"Reduce order_size_portfolio_ratio_limit"
+                            )
                 else:
                     if LogOption.NULL_ORDER_SIZE in self.logging_options:
                         self.log_with_clock(
                             logging.WARNING,
-                            f"({market_pair.maker.trading_pair})"
-                            f"Order book on taker is too thin to place order for size: {ask_size}"
-                            f"Reduce order_size_portfolio_ratio_limit"
+                            f"({market_pair.maker.trading_pair}) Attempting to place a limit ask but the "
+                            f"ask size is 0. Skipping. Check available balance."
                         )
-            else:
-                if LogOption.NULL_ORDER_SIZE in self.logging_options:
-                    self.log_with_clock(
-                        logging.WARNING,
-                        f"({market_pair.maker.trading_pair}) Attempting to place a limit ask but the "
-                        f"ask size is 0. Skipping. Check available balance."
-                    )
 
     def place_order(
         self,
@@ -42,6 +42,14 @@ class CreatedPairOfOrders:
 
 
 class HangingOrdersTracker:
+    """
+    Keeps track of the hanging orders of a strategy.
+
+    The sets of orders are indexed by order id (`_original_orders_by_id`, `_current_hanging_orders_by_id`,
+    `_completed_hanging_order_ids` and `_orders_being_renewed_by_id`), so the order events and the checks done by the
+    strategy on every tick don't scan all the hanging orders. The hanging orders themselves are hashed by trading pair,
+    side, price and amount. The sets and their indexes must only be updated through the tracker methods.
+    """
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -64,6 +72,11 @@ class HangingOrdersTracker:
         self.original_orders: Set[LimitOrder] = orders or set()
         self.strategy_current_hanging_orders: Set[HangingOrder] = set()
         self.completed_hanging_orders: Set[HangingOrder] = set()
+        self._original_orders_by_id: Dict[str, LimitOrder] = {
+            order.client_order_id: order for order in self.original_orders}
+        self._current_hanging_orders_by_id: Dict[str, HangingOrder] = {}
+        self._completed_hanging_order_ids: Set[str] = set()
+        self._orders_being_renewed_by_id: Dict[str, HangingOrder] = {}
 
         self._cancel_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_cancel_order)
         self._complete_buy_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(
@@ -103,14 +116,12 @@ class HangingOrdersTracker:
         self._process_cancel_as_part_of_renew(event)
 
         self.orders_being_cancelled.discard(event.order_id)
-        order_to_be_removed = next((order for order in self.strategy_current_hanging_orders
-                                    if order.order_id == event.order_id), None)
+        order_to_be_removed = self._current_hanging_orders_by_id.get(event.order_id)
         if order_to_be_removed:
-            self.strategy_current_hanging_orders.remove(order_to_be_removed)
+            self._remove_strategy_hanging_order(order_to_be_removed)
             self.logger().notify(f"({self.trading_pair}) Hanging order {event.order_id} canceled.")
 
-        limit_order_to_be_removed = next((order for order in self.original_orders
-                                          if order.client_order_id == event.order_id), None)
+        limit_order_to_be_removed = self._original_orders_by_id.get(event.order_id)
         if limit_order_to_be_removed:
             self.remove_order(limit_order_to_be_removed)
 
@@ -129,8 +140,7 @@ class HangingOrdersTracker:
     def _did_complete_order(self,
                             event: Union[BuyOrderCompletedEvent, SellOrderCompletedEvent],
                             is_buy: bool):
-        hanging_order = next((hanging_order for hanging_order in self.strategy_current_hanging_orders
-                              if hanging_order.order_id == event.order_id), None)
+        hanging_order = self._current_hanging_orders_by_id.get(event.order_id)
 
         if hanging_order:
             self._did_complete_hanging_order(hanging_order)
@@ -145,15 +155,15 @@ class HangingOrdersTracker:
         if order:
             order_side = "BUY" if order.is_buy else "SELL"
             self.completed_hanging_orders.add(order)
-            self.strategy_current_hanging_orders.remove(order)
+            self._completed_hanging_order_ids.add(order.order_id)
+            self._remove_strategy_hanging_order(order)
             self.logger().notify(
                 f"({self.trading_pair}) Hanging maker {order_side} order {order.order_id} "
                 f"({order.trading_pair} {order.amount} @ "
                 f"{order.price}) has been completely filled."
             )
 
-            limit_order_to_be_removed = next((original_order for original_order in self.original_orders
-                                              if original_order.client_order_id == order.order_id), None)
+            limit_order_to_be_removed = self._original_orders_by_id.get(order.order_id)
             if limit_order_to_be_removed:
                 self.remove_order(limit_order_to_be_removed)
 
@@ -170,12 +180,12 @@ class HangingOrdersTracker:
         self.renew_hanging_orders_past_max_order_age()
 
     def _process_cancel_as_part_of_renew(self, event: OrderCancelledEvent):
-        renewing_order = next((order for order in self.orders_being_renewed if order.order_id == event.order_id), None)
+        renewing_order = self._orders_being_renewed_by_id.pop(event.order_id, None)
         if renewing_order:
             self.logger().info(f"({self.trading_pair}) Hanging order {event.order_id} "
                                f"has been canceled as part of the renew process. "
                                f"Now the replacing order will be created.")
-            self.strategy_current_hanging_orders.remove(renewing_order)
+            self._remove_strategy_hanging_order(renewing_order)
             self.orders_being_renewed.remove(renewing_order)
             order_to_be_created = HangingOrder(None,
                                                renewing_order.trading_pair,
@@ -185,26 +195,31 @@ class HangingOrdersTracker:
                                                self.strategy.current_timestamp)
 
             executed_orders = self._execute_orders_in_strategy([order_to_be_created])
-            self.strategy_current_hanging_orders = self.strategy_current_hanging_orders.union(executed_orders)
-            for new_hanging_order in executed_orders:
-                limit_order_from_hanging_order = next((o for o in self.strategy.active_orders
-                                                       if o.client_order_id == new_hanging_order.order_id), None)
-                if limit_order_from_hanging_order:
-                    self.add_order(limit_order_from_hanging_order)
+            self._add_strategy_hanging_orders(executed_orders)
+            if executed_orders:
+                active_orders_by_id = {o.client_order_id: o for o in self.strategy.active_orders}
+                for new_hanging_order in executed_orders:
+                    limit_order_from_hanging_order = active_orders_by_id.get(new_hanging_order.order_id)
+                    if limit_order_from_hanging_order:
+                        self.add_order(limit_order_from_hanging_order)
 
     def add_order(self, order: LimitOrder):
         self.original_orders.add(order)
+        self._original_orders_by_id[order.client_order_id] = order
 
     def add_as_hanging_order(self, order: LimitOrder):
-        self.strategy_current_hanging_orders.add(self._get_hanging_order_from_limit_order(order))
+        self._add_strategy_hanging_orders([self._get_hanging_order_from_limit_order(order)])
         self.add_order(order)
 
     def remove_order(self, order: LimitOrder):
         if order in self.original_orders:
             self.original_orders.remove(order)
+            if self._original_orders_by_id.get(order.client_order_id) is order:
+                del self._original_orders_by_id[order.client_order_id]
 
     def remove_all_orders(self):
         self.original_orders.clear()
+        self._original_orders_by_id.clear()
 
     def remove_all_buys(self):
         to_be_removed = []
@@ -212,7 +227,7 @@ class HangingOrdersTracker:
             if order.is_buy:
                 to_be_removed.append(order)
         for order in to_be_removed:
-            self.original_orders.remove(order)
+            self.remove_order(order)
 
     def remove_all_sells(self):
         to_be_removed = []
@@ -220,7 +235,20 @@ class HangingOrdersTracker:
             if not order.is_buy:
                 to_be_removed.append(order)
         for order in to_be_removed:
-            self.original_orders.remove(order)
+            self.remove_order(order)
+
+    def _add_strategy_hanging_orders(self, orders):
+        for order in orders:
+            # Hanging orders are compared by trading pair, side, price and amount: an equivalent order is not added
+            if order not in self.strategy_current_hanging_orders:
+                self.strategy_current_hanging_orders.add(order)
+                if order.order_id is not None:
+                    self._current_hanging_orders_by_id[order.order_id] = order
+
+    def _remove_strategy_hanging_order(self, order: HangingOrder):
+        self.strategy_current_hanging_orders.remove(order)
+        if self._current_hanging_orders_by_id.get(order.order_id) is order:
+            del self._current_hanging_orders_by_id[order.order_id]
 
     def hanging_order_age(self, hanging_order: HangingOrder) -> float:
         """
@@ -240,7 +268,10 @@ class HangingOrdersTracker:
                     to_be_cancelled.add(order)
 
             self._cancel_multiple_orders_in_strategy([o.order_id for o in to_be_cancelled if o.order_id])
-            self.orders_being_renewed = self.orders_being_renewed.union(to_be_cancelled)
+            for order in to_be_cancelled:
+                self.orders_being_renewed.add(order)
+                if order.order_id is not None:
+                    self._orders_being_renewed_by_id[order.order_id] = order
 
     def remove_orders_far_from_price(self):
         current_price = self.strategy.get_price()
@@ -265,16 +296,16 @@ class HangingOrdersTracker:
         return self._get_equivalent_orders()
 
     def is_order_id_in_hanging_orders(self, order_id: str) -> bool:
-        return any((o.order_id == order_id for o in self.strategy_current_hanging_orders))
+        return order_id in self._current_hanging_orders_by_id
 
     def is_order_id_in_completed_hanging_orders(self, order_id: str) -> bool:
-        return any((o.order_id == order_id for o in self.completed_hanging_orders))
+        return order_id in self._completed_hanging_order_ids
 
     def is_hanging_order_in_strategy_active_orders(self, order: HangingOrder) -> bool:
-        return any(all(order.trading_pair == o.trading_pair,
-                       order.is_buy == o.is_buy,
-                       order.price == o.price,
-                       order.amount == o.quantity) for o in self.strategy.active_orders)
+        return any(order.trading_pair == o.trading_pair
+                   and order.is_buy == o.is_buy
+                   and order.price == o.price
+                   and order.amount == o.quantity for o in self.strategy.active_orders)
 
     def is_potential_hanging_order(self, order: LimitOrder) -> bool:
         """Checks if the order is registered as a hanging order."""
@@ -304,7 +335,7 @@ class HangingOrdersTracker:
             self.logger().info(f"Need to cancel: {orders_to_cancel}")
 
         executed_orders = self._execute_orders_in_strategy(orders_to_create)
-        self.strategy_current_hanging_orders = self.strategy_current_hanging_orders.union(executed_orders)
+        self._add_strategy_hanging_orders(executed_orders)
 
     def _execute_orders_in_strategy(self, candidate_orders: Set[HangingOrder]):
         new_hanging_orders = set()
@@ -343,8 +374,11 @@ class HangingOrdersTracker:
         return new_hanging_orders
 
     def _cancel_multiple_orders_in_strategy(self, order_ids: List[str]):
+        if not order_ids:
+            return
+        active_order_ids = {o.client_order_id for o in self.strategy.active_orders}
         for order_id in order_ids:
-            if any(o.client_order_id == order_id for o in self.strategy.active_orders):
+            if order_id in active_order_ids:
                 self.strategy.cancel_order(order_id)
                 self.orders_being_cancelled.add(order_id)
 
@@ -370,10 +404,13 @@ class HangingOrdersTracker:
 
     def candidate_hanging_orders_from_pairs(self):
         candidate_orders = []
+        active_orders = None
         for pair in self.current_created_pairs_of_orders:
             if pair.partially_filled():
                 unfilled_order = pair.get_unfilled_order()
+                if active_orders is None:
+                    active_orders = set(self.strategy.active_orders)
                 # Check if the unfilled order is in active_orders because it might have failed before being created
-                if unfilled_order in self.strategy.active_orders:
+                if unfilled_order in active_orders:
                     candidate_orders.append(unfilled_order)
         return candidate_orders
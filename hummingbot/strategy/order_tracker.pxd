@@ -1,5 +1,7 @@
 # distutils: language=c++
 
+from libc.stdint cimport int64_t
+
 from hummingbot.core.data_type.limit_order cimport LimitOrder
 from hummingbot.core.time_iterator cimport TimeIterator
 
@@ -14,7 +16,19 @@ cdef class OrderTracker(TimeIterator):
         object _shadow_gc_requests
         object _in_flight_cancels
         object _in_flight_pending_created
+        int64_t _version
+        int64_t _views_version
+        double _views_timestamp
+        double _views_valid_until
+        list _active_limit_orders_view
+        list _shadow_limit_orders_view
+        dict _market_pair_to_active_orders_view
+        list _active_bids_view
+        list _active_asks_view
+        list _tracked_limit_orders_view
+        list _tracked_market_orders_view
 
+    cdef c_update_views(self)
     cdef dict c_get_limit_orders(self)
     cdef dict c_get_market_orders(self)
     cdef dict c_get_shadow_limit_orders(self)
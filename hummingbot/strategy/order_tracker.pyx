@@ -3,6 +3,7 @@ from collections import (
     OrderedDict
 )
 from decimal import Decimal
+from libc.math cimport isnan
 from typing import (
     Dict,
     List,
@@ -18,14 +19,27 @@ from hummingbot.core.data_type.market_order import MarketOrder
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 
 NaN = float("nan")
+Inf = float("inf")
 
 cdef class OrderTracker(TimeIterator):
+    """
+    Tracks the orders placed by a strategy.
+
+    The lists and dictionaries returned by the order views (`active_limit_orders`, `market_pair_to_active_orders`,
+    `active_bids`, `active_asks`, `shadow_limit_orders`, `tracked_limit_orders` and `tracked_market_orders`) are
+    built once and reused until the tracked orders change, so reading them several times per tick costs nothing.
+    They are shared and must not be modified by the callers. `version` is incremented on every change of the tracked
+    orders, for a cheap change detection.
+    """
     # ETH confirmation requirement of Binance has shortened to 12 blocks as of 7/15/2019.
     # 12 * 15 / 60 = 3 minutes
     SHADOW_MAKER_ORDER_KEEP_ALIVE_DURATION = 60.0 * 3
 
     CANCEL_EXPIRY_DURATION = 60.0
 
+    # Whether the orders with an in flight cancel are excluded from the active and shadow orders
+    EXCLUDE_IN_FLIGHT_CANCELS = True
+
     def __init__(self):
         super().__init__()
         self._tracked_limit_orders = {}
@@ -36,53 +50,47 @@ cdef class OrderTracker(TimeIterator):
         self._shadow_gc_requests = deque()
         self._in_flight_pending_created = set()
         self._in_flight_cancels = OrderedDict()
+        self._version = 0
+        self._views_version = -1
+        self._views_timestamp = NaN
+        self._views_valid_until = NaN
+
+    @property
+    def version(self) -> int:
+        """
+        Incremented every time the tracked orders (or the in flight cancels) change
+        """
+        return self._version
 
     @property
     def active_limit_orders(self) -> List[Tuple[ConnectorBase, LimitOrder]]:
-        limit_orders = []
-        for market_pair, orders_map in self._tracked_limit_orders.items():
-            for limit_order in orders_map.values():
-                if self.c_has_in_flight_cancel(limit_order.client_order_id):
-                    continue
-                limit_orders.append((market_pair.market, limit_order))
-        return limit_orders
+        self.c_update_views()
+        return self._active_limit_orders_view
 
     @property
     def shadow_limit_orders(self) -> List[Tuple[ConnectorBase, LimitOrder]]:
-        limit_orders = []
-        for market_pair, orders_map in self._shadow_tracked_limit_orders.items():
-            for limit_order in orders_map.values():
-                if self.c_has_in_flight_cancel(limit_order.client_order_id):
-                    continue
-                limit_orders.append((market_pair.market, limit_order))
-        return limit_orders
+        self.c_update_views()
+        return self._shadow_limit_orders_view
 
     @property
     def market_pair_to_active_orders(self) -> Dict[MarketTradingPairTuple, List[LimitOrder]]:
-        market_pair_to_orders = {}
-        market_pairs = self._tracked_limit_orders.keys()
-        for market_pair in market_pairs:
-            limit_orders = []
-            for limit_order in self._tracked_limit_orders[market_pair].values():
-                if self.c_has_in_flight_cancel(limit_order.client_order_id):
-                    continue
-                limit_orders.append(limit_order)
-            market_pair_to_orders[market_pair] = limit_orders
-        return market_pair_to_orders
+        self.c_update_views()
+        return self._market_pair_to_active_orders_view
 
     @property
     def active_bids(self) -> List[Tuple[ConnectorBase, LimitOrder]]:
-        return [(market, limit_order) for market, limit_order in self.active_limit_orders if limit_order.is_buy]
+        self.c_update_views()
+        return self._active_bids_view
 
     @property
     def active_asks(self) -> List[Tuple[ConnectorBase, LimitOrder]]:
-        return [(market, limit_order) for market, limit_order in self.active_limit_orders if not limit_order.is_buy]
+        self.c_update_views()
+        return self._active_asks_view
 
     @property
     def tracked_limit_orders(self) -> List[Tuple[ConnectorBase, LimitOrder]]:
-        return [(market_trading_pair_tuple[0], order) for market_trading_pair_tuple, order_map in
-                self._tracked_limit_orders.items()
-                for order in order_map.values()]
+        self.c_update_views()
+        return self._tracked_limit_orders_view
 
     @property
     def tracked_limit_orders_map(self) -> Dict[ConnectorBase, Dict[str, LimitOrder]]:
@@ -102,8 +110,8 @@ cdef class OrderTracker(TimeIterator):
 
     @property
     def tracked_market_orders(self) -> List[Tuple[ConnectorBase, MarketOrder]]:
-        return [(market_trading_pair_tuple[0], order) for market_trading_pair_tuple, order_map
-                in self._tracked_market_orders.items() for order in order_map.values()]
+        self.c_update_views()
+        return self._tracked_market_orders_view
 
     @property
     def tracked_market_orders_data_frame(self) -> List[pd.DataFrame]:
@@ -127,6 +135,62 @@ cdef class OrderTracker(TimeIterator):
         TimeIterator.c_tick(self, timestamp)
         self.c_check_and_cleanup_shadow_records()
 
+    cdef c_update_views(self):
+        """
+        Rebuilds the order views if the tracked orders changed since they were built, or if the in flight cancel of
+        one of the orders excluded from them expired.
+        """
+        cdef:
+            double current_timestamp = self._current_timestamp
+            double valid_until = Inf
+            bint exclude_in_flight_cancels = self.EXCLUDE_IN_FLIGHT_CANCELS
+            double cancel_expiry_duration = self.CANCEL_EXPIRY_DURATION
+            list active_limit_orders = []
+            list shadow_limit_orders = []
+            dict market_pair_to_active_orders = {}
+            list active_orders
+            LimitOrder limit_order
+
+        if self._views_version == self._version:
+            if isnan(current_timestamp) or isnan(self._views_timestamp):
+                if isnan(current_timestamp) and isnan(self._views_timestamp):
+                    return
+            elif self._views_timestamp <= current_timestamp < self._views_valid_until:
+                return
+
+        for market_pair, orders_map in self._tracked_limit_orders.items():
+            active_orders = []
+            for limit_order in orders_map.values():
+                if exclude_in_flight_cancels and self.c_has_in_flight_cancel(limit_order.client_order_id):
+                    valid_until = min(valid_until,
+                                      self._in_flight_cancels[limit_order.client_order_id] + cancel_expiry_duration)
+                    continue
+                active_orders.append(limit_order)
+                active_limit_orders.append((market_pair.market, limit_order))
+            market_pair_to_active_orders[market_pair] = active_orders
+        for market_pair, orders_map in self._shadow_tracked_limit_orders.items():
+            for limit_order in orders_map.values():
+                if exclude_in_flight_cancels and self.c_has_in_flight_cancel(limit_order.client_order_id):
+                    valid_until = min(valid_until,
+                                      self._in_flight_cancels[limit_order.client_order_id] + cancel_expiry_duration)
+                    continue
+                shadow_limit_orders.append((market_pair.market, limit_order))
+
+        self._active_limit_orders_view = active_limit_orders
+        self._shadow_limit_orders_view = shadow_limit_orders
+        self._market_pair_to_active_orders_view = market_pair_to_active_orders
+        self._active_bids_view = [(market, order) for market, order in active_limit_orders if order.is_buy]
+        self._active_asks_view = [(market, order) for market, order in active_limit_orders if not order.is_buy]
+        self._tracked_limit_orders_view = [(market_pair.market, order)
+                                           for market_pair, orders_map in self._tracked_limit_orders.items()
+                                           for order in orders_map.values()]
+        self._tracked_market_orders_view = [(market_pair.market, order)
+                                            for market_pair, orders_map in self._tracked_market_orders.items()
+                                            for order in orders_map.values()]
+        self._views_version = self._version
+        self._views_timestamp = current_timestamp
+        self._views_valid_until = valid_until
+
     cdef dict c_get_limit_orders(self):
         return self._tracked_limit_orders
 
@@ -174,6 +238,7 @@ cdef class OrderTracker(TimeIterator):
 
         # Track the cancel.
         self._in_flight_cancels[order_id] = self._current_timestamp
+        self._version += 1
         return True
 
     def check_and_track_cancel(self, order_id: str) -> bool:
@@ -232,6 +297,7 @@ cdef class OrderTracker(TimeIterator):
         self._shadow_tracked_limit_orders[market_pair][order_id] = limit_order
         self._order_id_to_market_pair[order_id] = market_pair
         self._shadow_order_id_to_market_pair[order_id] = market_pair
+        self._version += 1
 
     def start_tracking_limit_order(self, market_pair: MarketTradingPairTuple, order_id: str, is_buy: bool, price: Decimal,
                                    quantity: Decimal):
@@ -252,6 +318,7 @@ cdef class OrderTracker(TimeIterator):
             del self._order_id_to_market_pair[order_id]
         if order_id in self._in_flight_cancels:
             del self._in_flight_cancels[order_id]
+        self._version += 1
 
     def stop_tracking_limit_order(self, market_pair: MarketTradingPairTuple, order_id: str):
         return self.c_stop_tracking_limit_order(market_pair, order_id)
@@ -269,6 +336,7 @@ cdef class OrderTracker(TimeIterator):
             self._current_timestamp
         )
         self._order_id_to_market_pair[order_id] = market_pair
+        self._version += 1
 
     def start_tracking_market_order(self, market_pair: MarketTradingPairTuple, order_id: str, is_buy: bool, quantity: Decimal):
         return self.c_start_tracking_market_order(market_pair, order_id, is_buy, quantity)
@@ -278,6 +346,7 @@ cdef class OrderTracker(TimeIterator):
             del self._tracked_market_orders[market_pair][order_id]
             if len(self._tracked_market_orders[market_pair]) < 1:
                 del self._tracked_market_orders[market_pair]
+            self._version += 1
         if order_id in self._order_id_to_market_pair:
             del self._order_id_to_market_pair[order_id]
 
@@ -295,6 +364,7 @@ cdef class OrderTracker(TimeIterator):
                 del self._shadow_tracked_limit_orders[market_pair][order_id]
                 if len(self._shadow_tracked_limit_orders[market_pair]) < 1:
                     del self._shadow_tracked_limit_orders[market_pair]
+                self._version += 1
             if order_id in self._shadow_order_id_to_market_pair:
                 del self._shadow_order_id_to_market_pair[order_id]
 
@@ -58,8 +58,15 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         bint _should_wait_order_cancel_confirmation
 
         object _moving_price_band
+        int64_t _config_version
+        list _proposal_stage_keys
+        list _proposal_stage_results
+        int64_t _proposal_stage_computations
 
     cdef object c_get_mid_price(self)
+    cdef object c_create_proposal(self)
+    cdef list c_get_proposal_stage_keys(self)
+    cdef tuple c_get_reference_prices(self)
     cdef object c_create_base_proposal(self)
     cdef tuple c_get_adjusted_available_balance(self, list orders)
     cdef c_apply_order_levels_modifiers(self, object proposal)
@@ -71,6 +78,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     cdef c_apply_budget_constraint(self, object proposal)
 
     cdef c_filter_out_takers(self, object proposal)
+    cdef tuple c_get_order_optimization_top_prices(self)
     cdef c_apply_order_optimization(self, object proposal)
     cdef c_apply_add_transaction_costs(self, object proposal)
     cdef bint c_is_within_tolerance(self, list current_prices, list proposal_prices)
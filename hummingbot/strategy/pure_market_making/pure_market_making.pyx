@@ -32,9 +32,16 @@ from .moving_price_band import MovingPriceBand
 NaN = float("nan")
 s_decimal_zero = Decimal(0)
 s_decimal_neg_one = Decimal(-1)
+# The stages of the proposal pipeline, see PureMarketMakingStrategy.c_create_proposal
+PROPOSAL_STAGES_COUNT = 4
 pmm_logger = None
 
 
+def _copy_proposal(proposal: Proposal) -> Proposal:
+    return Proposal([PriceSize(buy.price, buy.size) for buy in proposal.buys],
+                    [PriceSize(sell.price, sell.size) for sell in proposal.sells])
+
+
 cdef class PureMarketMakingStrategy(StrategyBase):
     OPTION_LOG_CREATE_ORDER = 1 << 3
     OPTION_LOG_MAKER_ORDER_FILLED = 1 << 4
@@ -144,6 +151,10 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         self._last_own_trade_price = Decimal('nan')
         self._should_wait_order_cancel_confirmation = should_wait_order_cancel_confirmation
         self._moving_price_band = moving_price_band
+        self._config_version = 0
+        self._proposal_stage_keys = [None] * PROPOSAL_STAGES_COUNT
+        self._proposal_stage_results = [None] * PROPOSAL_STAGES_COUNT
+        self._proposal_stage_computations = 0
         self.c_add_markets([market_info.market])
 
     def all_markets_ready(self):
@@ -192,6 +203,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     @order_amount.setter
     def order_amount(self, value: Decimal):
         self._order_amount = value
+        self._config_version += 1
 
     @property
     def order_levels(self) -> int:
@@ -202,6 +214,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         self._order_levels = value
         self._buy_levels = value
         self._sell_levels = value
+        self._config_version += 1
 
     @property
     def buy_levels(self) -> int:
@@ -210,6 +223,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     @buy_levels.setter
     def buy_levels(self, value: int):
         self._buy_levels = value
+        self._config_version += 1
 
     @property
     def sell_levels(self) -> int:
@@ -218,6 +232,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     @sell_levels.setter
     def sell_levels(self, value: int):
         self._sell_levels = value
+        self._config_version += 1
 
     @property
     def order_level_amount(self) -> Decimal:
@@ -226,6 +241,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     @order_level_amount.setter
     def order_level_amount(self, value: Decimal):
         self._order_level_amount = value
+        self._config_version += 1
 
     @property
     def order_level_spread(self) -> Decimal:
@@ -234,6 +250,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     @order_level_spread.setter
     def order_level_spread(self, value: Decimal):
         self._order_level_spread = value
+        self._config_version += 1
 
     @property
     def inventory_skew_enabled(self) -> bool:
@@ -242,6 +259,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     @inventory_skew_enabled.setter
     def inventory_skew_enabled(self, value: bool):
         self._inventory_skew_enabled = value
+        self._config_version += 1
 
     @property
     def inventory_target_base_pct(self) -> Decimal:
@@ -250,6 +268,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     @inventory_target_base_pct.setter
     def inventory_target_base_pct(self, value: Decimal):
         self._inventory_target_base_pct = value
+        self._config_version += 1
 
     @property
     def inventory_range_multiplier(self) -> Decimal:
@@ -258,6 +277,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     @inventory_range_multiplier.setter
     def inventory_range_multiplier(self, value: Decimal):
         self._inventory_range_multiplier = value
+        self._config_version += 1
 
     @property
     def hanging_orders_enabled(self) -> bool:
@@ -266,6 +286,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     @hanging_orders_enabled.setter
     def hanging_orders_enabled(self, value: bool):
         self._hanging_orders_enabled = value
+        self._config_version += 1
 
     @property
     def hanging_orders_cancel_pct(self) -> Decimal:
@@ -282,6 +303,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     @bid_spread.setter
     def bid_spread(self, value: Decimal):
         self._bid_spread = value
+        self._config_version += 1
 
     @property
     def ask_spread(self) -> Decimal:
@@ -290,6 +312,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     @ask_spread.setter
     def ask_spread(self, value: Decimal):
         self._ask_spread = value
+        self._config_version += 1
 
     @property
     def order_optimization_enabled(self) -> bool:
@@ -298,6 +321,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     @order_optimization_enabled.setter
     def order_optimization_enabled(self, value: bool):
         self._order_optimization_enabled = value
+        self._config_version += 1
 
     @property
     def order_refresh_time(self) -> float:
@@ -322,6 +346,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     @add_transaction_costs_to_orders.setter
     def add_transaction_costs_to_orders(self, value: bool):
         self._add_transaction_costs_to_orders = value
+        self._config_version += 1
 
     @property
     def price_ceiling(self) -> Decimal:
@@ -330,6 +355,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     @price_ceiling.setter
     def price_ceiling(self, value: Decimal):
         self._price_ceiling = value
+        self._config_version += 1
 
     @property
     def price_floor(self) -> Decimal:
@@ -338,6 +364,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     @price_floor.setter
     def price_floor(self, value: Decimal):
         self._price_floor = value
+        self._config_version += 1
 
     @property
     def base_asset(self):
@@ -370,6 +397,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     @order_override.setter
     def order_override(self, value: Dict[str, List[str]]):
         self._order_override = value
+        self._config_version += 1
 
     @property
     def moving_price_band_enabled(self) -> bool:
@@ -378,6 +406,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     @moving_price_band_enabled.setter
     def moving_price_band_enabled(self, value: bool):
         self._moving_price_band.switch(value)
+        self._config_version += 1
 
     @property
     def price_ceiling_pct(self) -> Decimal:
@@ -387,6 +416,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     def price_ceiling_pct(self, value: Decimal):
         self._moving_price_band.price_ceiling_pct = value
         self._moving_price_band.update(self._current_timestamp, self.get_price())
+        self._config_version += 1
 
     @property
     def price_floor_pct(self) -> Decimal:
@@ -396,6 +426,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     def price_floor_pct(self, value: Decimal):
         self._moving_price_band.price_floor_pct = value
         self._moving_price_band.update(self._current_timestamp, self.get_price())
+        self._config_version += 1
 
     @property
     def price_band_refresh_time(self) -> float:
@@ -405,6 +436,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     def price_band_refresh_time(self, value: Decimal):
         self._moving_price_band.price_band_refresh_time = value
         self._moving_price_band.update(self._current_timestamp, self.get_price())
+        self._config_version += 1
 
     @property
     def moving_price_band(self) -> MovingPriceBand:
@@ -483,6 +515,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     @asset_price_delegate.setter
     def asset_price_delegate(self, value):
         self._asset_price_delegate = value
+        self._config_version += 1
 
     @property
     def inventory_cost_price_delegate(self) -> AssetPriceDelegate:
@@ -491,6 +524,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     @inventory_cost_price_delegate.setter
     def inventory_cost_price_delegate(self, value):
         self._inventory_cost_price_delegate = value
+        self._config_version += 1
 
     def inventory_skew_stats_data_frame(self) -> Optional[pd.DataFrame]:
         cdef:
@@ -577,7 +611,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         active_orders = self.active_orders
         no_sells = len([o for o in active_orders if not o.is_buy and o.client_order_id and
                         not self._hanging_orders_tracker.is_order_id_in_hanging_orders(o.client_order_id)])
-        active_orders.sort(key=lambda x: x.price, reverse=True)
+        active_orders = sorted(active_orders, key=lambda x: x.price, reverse=True)
         columns = ["Level", "Type", "Price", "Spread", "Amount (Orig)", "Amount (Adj)", "Age"]
         data = []
         lvl_buy, lvl_sell = 0, 0
@@ -738,19 +772,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
             proposal = None
             if self._create_timestamp <= self._current_timestamp:
-                # 1. Create base order proposals
-                proposal = self.c_create_base_proposal()
-                # 2. Apply functions that limit numbers of buys and sells proposal
-                self.c_apply_order_levels_modifiers(proposal)
-                # 3. Apply functions that modify orders price
-                self.c_apply_order_price_modifiers(proposal)
-                # 4. Apply functions that modify orders size
-                self.c_apply_order_size_modifiers(proposal)
-                # 5. Apply budget constraint, i.e. can't buy/sell more than what you have.
-                self.c_apply_budget_constraint(proposal)
-
-                if not self._take_if_crossed:
-                    self.c_filter_out_takers(proposal)
+                proposal = self.c_create_proposal()
 
             self._hanging_orders_tracker.process_tick()
 
@@ -762,11 +784,105 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         finally:
             self._last_timestamp = timestamp
 
-    cdef object c_create_base_proposal(self):
+    def create_proposal(self) -> Proposal:
+        return self.c_create_proposal()
+
+    @property
+    def proposal_stage_computations(self) -> int:
+        """
+        The number of proposal pipeline stages computed since the strategy was created (the stages reused from the
+        previous ticks are not counted)
+        """
+        return self._proposal_stage_computations
+
+    def invalidate_proposal_cache(self):
+        """
+        Makes the next proposal be computed from scratch, e.g. after changing an input that is not fingerprinted
+        """
+        self._proposal_stage_keys = [None] * PROPOSAL_STAGES_COUNT
+
+    cdef object c_create_proposal(self):
+        """
+        Creates the orders proposal, running the pipeline stages:
+        1. create the base proposal and apply the functions that limit the number of buys and sells
+        2. apply the functions that modify the orders price
+        3. apply the functions that modify the orders size and the budget constraint (can't buy/sell more than what
+           you have)
+        4. filter out the orders that would be takers
+
+        The inputs of each stage (reference prices, order book prices, balances, active orders, configuration
+        version...) are fingerprinted. The result of each stage is kept until the next tick, and only the stages
+        whose inputs changed (and the following ones) are computed again.
+        """
+        cdef:
+            list stage_keys = self.c_get_proposal_stage_keys()
+            int first_changed_stage = 0
+            int stage
+            object proposal = None
+
+        while (first_changed_stage < PROPOSAL_STAGES_COUNT
+               and self._proposal_stage_keys[first_changed_stage] == stage_keys[first_changed_stage]):
+            first_changed_stage += 1
+        if first_changed_stage == PROPOSAL_STAGES_COUNT:
+            return _copy_proposal(self._proposal_stage_results[PROPOSAL_STAGES_COUNT - 1])
+        if first_changed_stage > 0:
+            proposal = _copy_proposal(self._proposal_stage_results[first_changed_stage - 1])
+
+        for stage in range(first_changed_stage, PROPOSAL_STAGES_COUNT):
+            # The keys are invalidated first, so a stage failing is computed again on the next tick
+            self._proposal_stage_keys[stage] = None
+        for stage in range(first_changed_stage, PROPOSAL_STAGES_COUNT):
+            if stage == 0:
+                proposal = self.c_create_base_proposal()
+                self.c_apply_order_levels_modifiers(proposal)
+            elif stage == 1:
+                self.c_apply_order_price_modifiers(proposal)
+            elif stage == 2:
+                self.c_apply_order_size_modifiers(proposal)
+                self.c_apply_budget_constraint(proposal)
+            elif not self._take_if_crossed:
+                self.c_filter_out_takers(proposal)
+            self._proposal_stage_computations += 1
+            self._proposal_stage_keys[stage] = stage_keys[stage]
+            self._proposal_stage_results[stage] = _copy_proposal(proposal)
+        return proposal
+
+    cdef list c_get_proposal_stage_keys(self):
+        cdef:
+            ExchangeBase market = self._market_info.market
+            object price = self.get_price()
+            object top_prices = None
+            object balances = None
+            object top_of_book = None
+
+        buy_reference_price, sell_reference_price = self.c_get_reference_prices()
+        if self.moving_price_band_enabled:
+            # Refreshes the band if it is time to, even if the proposal is not computed again
+            self._moving_price_band.check_and_update_price_band(self.current_timestamp, price)
+        levels_key = (self._config_version,
+                      buy_reference_price,
+                      sell_reference_price,
+                      price,
+                      self._filled_buys_balance,
+                      self._filled_sells_balance,
+                      self._moving_price_band.price_floor,
+                      self._moving_price_band.price_ceiling)
+        if self._order_optimization_enabled:
+            top_prices = self.c_get_order_optimization_top_prices()
+        if self._inventory_skew_enabled:
+            balances = self.c_get_adjusted_available_balance(self.active_orders)
+        if not self._take_if_crossed:
+            top_of_book = (market.c_get_price(self.trading_pair, True), market.c_get_price(self.trading_pair, False))
+        return [
+            levels_key,
+            top_prices,
+            (balances, self.adjusted_available_balance_for_orders_budget_constrain()),
+            top_of_book,
+        ]
+
+    cdef tuple c_get_reference_prices(self):
         cdef:
             ExchangeBase market = self._market_info.market
-            list buys = []
-            list sells = []
 
         buy_reference_price = sell_reference_price = self.get_price()
 
@@ -779,6 +895,15 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                 base_balance = float(market.get_balance(self._market_info.base_asset))
                 if base_balance > 0:
                     raise RuntimeError("Initial inventory price is not set while inventory_cost feature is active.")
+        return buy_reference_price, sell_reference_price
+
+    cdef object c_create_base_proposal(self):
+        cdef:
+            ExchangeBase market = self._market_info.market
+            list buys = []
+            list sells = []
+
+        buy_reference_price, sell_reference_price = self.c_get_reference_prices()
 
         # First to check if a customized order override is configured, otherwise the proposal will be created according
         # to order spread, amount, and levels setting.
@@ -980,10 +1105,11 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         if not top_bid.is_nan():
             proposal.sells = [sell for sell in proposal.sells if sell.price > top_bid]
 
-    # Compare the market price with the top bid and top ask price
-    cdef c_apply_order_optimization(self, object proposal):
+    cdef tuple c_get_order_optimization_top_prices(self):
+        """
+        Returns the top bid and top ask prices in the market using the order optimization depth and your orders volume
+        """
         cdef:
-            ExchangeBase market = self._market_info.market
             object own_buy_size = s_decimal_zero
             object own_sell_size = s_decimal_zero
 
@@ -993,10 +1119,20 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             else:
                 own_sell_size = order.quantity
 
+        top_bid_price = self._market_info.get_price_for_volume(
+            False, self._bid_order_optimization_depth + own_buy_size).result_price
+        top_ask_price = self._market_info.get_price_for_volume(
+            True, self._ask_order_optimization_depth + own_sell_size).result_price
+        return top_bid_price, top_ask_price
+
+    # Compare the market price with the top bid and top ask price
+    cdef c_apply_order_optimization(self, object proposal):
+        cdef:
+            ExchangeBase market = self._market_info.market
+
+        top_bid_price, top_ask_price = self.c_get_order_optimization_top_prices()
+
         if len(proposal.buys) > 0:
-            # Get the top bid price in the market using order_optimization_depth and your buy order volume
-            top_bid_price = self._market_info.get_price_for_volume(
-                False, self._bid_order_optimization_depth + own_buy_size).result_price
             price_quantum = market.c_get_order_price_quantum(
                 self.trading_pair,
                 top_bid_price
@@ -1017,9 +1153,6 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                 proposal.buys[i].price = market.c_quantize_order_price(self.trading_pair, lower_buy_price) * (1 - self.order_level_spread * i)
 
         if len(proposal.sells) > 0:
-            # Get the top ask price in the market using order_optimization_depth and your sell order volume
-            top_ask_price = self._market_info.get_price_for_volume(
-                True, self._ask_order_optimization_depth + own_sell_size).result_price
             price_quantum = market.c_get_order_price_quantum(
                 self.trading_pair,
                 top_ask_price
@@ -1,3 +1,4 @@
+import time
 from decimal import Decimal
 from functools import lru_cache
 from typing import Dict, List, Optional, Tuple, Union
@@ -7,11 +8,9 @@ from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.core.data_type.common import OrderType, PositionAction, PriceType, TradeType
 from hummingbot.core.data_type.order_candidate import OrderCandidate
-from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
     BuyOrderCreatedEvent,
-    MarketEvent,
     MarketOrderFailureEvent,
     OrderCancelledEvent,
     OrderFilledEvent,
@@ -20,6 +19,7 @@ from hummingbot.core.event.events import (
 )
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 from hummingbot.strategy_v2.executors.data_types import ExecutorConfigBase
+from hummingbot.strategy_v2.executors.order_event_router import OrderEventRouter
 from hummingbot.strategy_v2.models.base import RunnableStatus
 from hummingbot.strategy_v2.models.executors import CloseType
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
@@ -30,6 +30,12 @@ class ExecutorBase(RunnableBase):
     """
     Base class for all executors. Executors are responsible for executing orders based on the strategy.
     """
+    # Whether the control task runs right after the executor processes an order event, when the executor is run by a
+    # scheduler (see `ExecutorScheduler`)
+    WAKE_UP_ON_ORDER_EVENTS = False
+    # Maximum age of the executor info snapshot, in seconds, after which it is built again to refresh the values that
+    # depend on the market prices even if the PnL and the filled amount did not change
+    EXECUTOR_INFO_REFRESH_INTERVAL = 5.0
 
     def __init__(self, strategy: ScriptStrategyBase, connectors: List[str], config: ExecutorConfigBase, update_interval: float = 0.5):
         """
@@ -46,26 +52,10 @@ class ExecutorBase(RunnableBase):
         self._strategy: ScriptStrategyBase = strategy
         self.connectors = {connector_name: connector for connector_name, connector in strategy.connectors.items() if
                            connector_name in connectors}
-
-        # Event forwarders for different order events
-        self._create_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_created_event)
-        self._create_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_created_event)
-        self._fill_order_forwarder = SourceInfoEventForwarder(self.process_order_filled_event)
-        self._complete_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_completed_event)
-        self._complete_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_completed_event)
-        self._cancel_order_forwarder = SourceInfoEventForwarder(self.process_order_canceled_event)
-        self._failed_order_forwarder = SourceInfoEventForwarder(self.process_order_failed_event)
-
-        # Pairs of market events and their corresponding event forwarders
-        self._event_pairs: List[Tuple[MarketEvent, SourceInfoEventForwarder]] = [
-            (MarketEvent.OrderCancelled, self._cancel_order_forwarder),
-            (MarketEvent.BuyOrderCreated, self._create_buy_order_forwarder),
-            (MarketEvent.SellOrderCreated, self._create_sell_order_forwarder),
-            (MarketEvent.OrderFilled, self._fill_order_forwarder),
-            (MarketEvent.BuyOrderCompleted, self._complete_buy_order_forwarder),
-            (MarketEvent.SellOrderCompleted, self._complete_sell_order_forwarder),
-            (MarketEvent.OrderFailure, self._failed_order_forwarder),
-        ]
+        self._executor_info_snapshot: Optional[ExecutorInfo] = None
+        self._executor_info_snapshot_state: Optional[Tuple] = None
+        self._executor_info_snapshot_time = 0.0
+        self._executor_info_dirty = True
 
     @property
     def status(self):
@@ -105,9 +95,43 @@ class ExecutorBase(RunnableBase):
     @property
     def executor_info(self) -> ExecutorInfo:
         """
-        Returns the executor info.
+        Returns a snapshot of the executor info. The snapshot is only built again after a change of the executor state:
+        status or close type change, order event, or change of the PnL or the filled amount after a run of the control
+        task. The other values depending on the market prices are refreshed every EXECUTOR_INFO_REFRESH_INTERVAL
+        seconds. The snapshot is shared, it must not be modified.
+        """
+        snapshot_state = (self._status, self.close_type, self.close_timestamp)
+        if self._executor_info_dirty or snapshot_state != self._executor_info_snapshot_state:
+            self._executor_info_snapshot = self.build_executor_info()
+            self._executor_info_snapshot_state = snapshot_state
+            self._executor_info_snapshot_time = time.monotonic()
+            self._executor_info_dirty = False
+        return self._executor_info_snapshot
+
+    def mark_executor_info_dirty(self):
+        """
+        Signals a change of the executor state, so the next access to `executor_info` builds a new snapshot.
+        """
+        self._executor_info_dirty = True
+
+    def on_control_task_done(self):
+        """
+        Called after each run of the control task. Marks the executor info snapshot as outdated if the PnL or the
+        filled amount changed since it was built, or if it is older than EXECUTOR_INFO_REFRESH_INTERVAL.
+        """
+        snapshot = self._executor_info_snapshot
+        if (snapshot is not None
+                and not self._executor_info_dirty
+                and (time.monotonic() - self._executor_info_snapshot_time >= self.EXECUTOR_INFO_REFRESH_INTERVAL
+                     or snapshot.net_pnl_quote != self.net_pnl_quote
+                     or snapshot.filled_amount_quote != self.filled_amount_quote)):
+            self.mark_executor_info_dirty()
+
+    def build_executor_info(self) -> ExecutorInfo:
+        """
+        Builds a new executor info. The values come from the executor, so the model is built without validation.
         """
-        return ExecutorInfo(
+        return ExecutorInfo.construct(
             id=self.config.id,
             timestamp=self.config.timestamp,
             type=self.config.type,
@@ -240,19 +264,18 @@ class ExecutorBase(RunnableBase):
 
     def register_events(self):
         """
-        Registers the events with the connectors.
+        Subscribes the executor to the order event routers of the connectors. The events of the orders placed with
+        `place_order` are then delivered only to this executor.
         """
         for connector in self.connectors.values():
-            for event_pair in self._event_pairs:
-                connector.add_listener(event_pair[0], event_pair[1])
+            OrderEventRouter.get_router(connector).subscribe(self)
 
     def unregister_events(self):
         """
-        Unregisters the events from the connectors.
+        Unsubscribes the executor from the order event routers of the connectors.
         """
         for connector in self.connectors.values():
-            for event_pair in self._event_pairs:
-                connector.remove_listener(event_pair[0], event_pair[1])
+            OrderEventRouter.get_router(connector).unsubscribe(self)
 
     def adjust_order_candidates(self, exchange: str, order_candidates: List[OrderCandidate]) -> List[OrderCandidate]:
         """
@@ -282,9 +305,12 @@ class ExecutorBase(RunnableBase):
         :return: The result of the order placement.
         """
         if side == TradeType.BUY:
-            return self._strategy.buy(connector_name, trading_pair, amount, order_type, price, position_action)
+            order_id = self._strategy.buy(connector_name, trading_pair, amount, order_type, price, position_action)
         else:
-            return self._strategy.sell(connector_name, trading_pair, amount, order_type, price, position_action)
+            order_id = self._strategy.sell(connector_name, trading_pair, amount, order_type, price, position_action)
+        if connector_name in self.connectors:
+            OrderEventRouter.get_router(self.connectors[connector_name]).register_order(order_id, self)
+        return order_id
 
     def get_price(self, connector_name: str, trading_pair: str, price_type: PriceType = PriceType.MidPrice):
         """
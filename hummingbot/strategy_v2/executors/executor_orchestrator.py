@@ -1,6 +1,6 @@
 import logging
 from decimal import Decimal
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.core.data_type.common import TradeType
@@ -10,6 +10,7 @@ from hummingbot.strategy_v2.executors.arbitrage_executor.arbitrage_executor impo
 from hummingbot.strategy_v2.executors.arbitrage_executor.data_types import ArbitrageExecutorConfig
 from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig
 from hummingbot.strategy_v2.executors.dca_executor.dca_executor import DCAExecutor
+from hummingbot.strategy_v2.executors.executor_scheduler import ExecutorScheduler
 from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
 from hummingbot.strategy_v2.executors.position_executor.position_executor import PositionExecutor
 from hummingbot.strategy_v2.executors.twap_executor.data_types import TWAPExecutorConfig
@@ -26,9 +27,44 @@ from hummingbot.strategy_v2.models.executors import CloseType
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo, PerformanceReport
 
 
+class StoredExecutorsPerformance:
+    """
+    Running aggregates of the performance of the executors of a controller that are stored and no longer in memory
+    """
+
+    def __init__(self):
+        self.realized_pnl_quote = Decimal(0)
+        self.volume_traded = Decimal(0)
+        self.close_type_counts: Dict[CloseType, int] = {}
+        # Executors stored while still active, their performance depends on their state
+        self.active_executors: List[ExecutorInfo] = []
+
+    def add_closed_executors(self, close_type: Optional[CloseType], net_pnl_quote: Decimal,
+                             filled_amount_quote: Decimal, count: int):
+        if close_type == CloseType.FAILED:
+            return
+        if close_type is not None:
+            self.close_type_counts[close_type] = self.close_type_counts.get(close_type, 0) + count
+        self.realized_pnl_quote += net_pnl_quote
+        self.volume_traded += filled_amount_quote
+
+    def add_executor(self, executor_info: ExecutorInfo):
+        if executor_info.is_active:
+            self.active_executors.append(executor_info)
+        else:
+            self.add_closed_executors(executor_info.close_type, executor_info.net_pnl_quote,
+                                      executor_info.filled_amount_quote, 1)
+
+
 class ExecutorOrchestrator:
     """
     Orchestrator for various executors.
+
+    The control tasks of the executors are run by a single scheduler (see `ExecutorScheduler`), instead of one control
+    loop task per executor.
+
+    The performance of the executors already stored is aggregated once in the database, and then updated every time
+    the orchestrator stores an executor, so the performance reports only iterate over the executors in memory.
     """
     _logger = None
 
@@ -42,6 +78,8 @@ class ExecutorOrchestrator:
         self.strategy = strategy
         self.executors_update_interval = executors_update_interval
         self.executors = {}
+        self.executors_scheduler = ExecutorScheduler()
+        self._stored_executors_performance: Optional[Dict[str, StoredExecutorsPerformance]] = None
 
     def stop(self):
         """
@@ -52,7 +90,10 @@ class ExecutorOrchestrator:
             for executor in executors_list:
                 if not executor.is_closed:
                     executor.early_stop()
-        # then we store all executors
+        # then we store all executors. The executors stored are kept in memory, so the performance of the executors
+        # stored before is aggregated first, to not count them twice.
+        if self._stored_executors_performance is None:
+            self._stored_executors_performance = self._load_stored_executors_performance()
         for controller_id, executors_list in self.executors.items():
             for executor in executors_list:
                 MarketsRecorder.get_instance().store_or_update_executor(executor)
@@ -103,6 +144,7 @@ class ExecutorOrchestrator:
         else:
             raise ValueError("Unsupported executor config type")
 
+        executor.set_scheduler(self.executors_scheduler)
         executor.start()
         self.executors[controller_id].append(executor)
         self.logger().debug(f"Created {type(executor).__name__} for controller {controller_id}")
@@ -136,8 +178,10 @@ class ExecutorOrchestrator:
         if executor.is_active:
             self.logger().error(f"Executor ID {executor_id} is still active.")
             return
+        stored_executors_performance = self._get_stored_executors_performance(controller_id)
         MarketsRecorder.get_instance().store_or_update_executor(executor)
         self.executors[controller_id].remove(executor)
+        stored_executors_performance.add_executor(executor.executor_info)
 
     def get_executors_report(self) -> Dict[str, List[ExecutorInfo]]:
         """
@@ -148,21 +192,48 @@ class ExecutorOrchestrator:
             report[controller_id] = [executor.executor_info for executor in executors_list if executor]
         return report
 
+    def _load_stored_executors_performance(self) -> Dict[str, StoredExecutorsPerformance]:
+        """
+        Aggregates the performance of the executors stored in the database, by controller
+        """
+        markets_recorder = MarketsRecorder.get_instance()
+        stored_executors_performance = {}
+        for controller_id, close_type, net_pnl_quote, filled_amount_quote, count in \
+                markets_recorder.get_closed_executors_performance():
+            performance = stored_executors_performance.setdefault(controller_id, StoredExecutorsPerformance())
+            performance.add_closed_executors(close_type=CloseType(close_type) if close_type else None,
+                                             net_pnl_quote=Decimal(net_pnl_quote or 0),
+                                             filled_amount_quote=Decimal(filled_amount_quote or 0),
+                                             count=count)
+        for executor_info in markets_recorder.get_active_executors():
+            performance = stored_executors_performance.setdefault(executor_info.controller_id,
+                                                                  StoredExecutorsPerformance())
+            performance.add_executor(executor_info)
+        return stored_executors_performance
+
+    def _get_stored_executors_performance(self, controller_id: str) -> StoredExecutorsPerformance:
+        if self._stored_executors_performance is None:
+            self._stored_executors_performance = self._load_stored_executors_performance()
+        if controller_id not in self._stored_executors_performance:
+            self._stored_executors_performance[controller_id] = StoredExecutorsPerformance()
+        return self._stored_executors_performance[controller_id]
+
     def generate_performance_report(self, controller_id: str) -> PerformanceReport:
-        # Fetch executors from database and active in-memory executors
-        db_executors = MarketsRecorder.get_instance().get_executors_by_controller(controller_id)
-        active_executor_ids = [executor.executor_info.id for executor in self.executors.get(controller_id, [])]
-        filtered_db_executors = [executor for executor in db_executors if executor.id not in active_executor_ids]
+        # Start from the aggregated performance of the stored executors, and add the executors in memory
+        stored_executors_performance = self._get_stored_executors_performance(controller_id)
         active_executors = [executor.executor_info for executor in self.executors.get(controller_id, [])]
-        combined_executors = active_executors + filtered_db_executors
+        active_executor_ids = {executor.id for executor in active_executors}
+        stored_active_executors = [executor for executor in stored_executors_performance.active_executors
+                                   if executor.id not in active_executor_ids]
+        combined_executors = active_executors + stored_active_executors
 
         # Initialize performance metrics
-        realized_pnl_quote = Decimal(0)
+        realized_pnl_quote = stored_executors_performance.realized_pnl_quote
         unrealized_pnl_quote = Decimal(0)
-        volume_traded = Decimal(0)
+        volume_traded = stored_executors_performance.volume_traded
         open_order_volume = Decimal(0)
         inventory_imbalance = Decimal(0)
-        close_type_counts = {}
+        close_type_counts = dict(stored_executors_performance.close_type_counts)
 
         for executor in combined_executors:
             close_type = executor.close_type
@@ -0,0 +1,310 @@
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Deque, Dict, List, Optional, Set, Tuple
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:  # avoid circular import problems
+    from hummingbot.strategy_v2.runnable_base import RunnableBase
+
+
+class ExecutorScheduler:
+    """
+    Runs the control task of many executors from a single driver task and a fixed pool of worker tasks, instead of one
+    control loop task per executor.
+
+    The executors waiting for their next control task are stored in a timer wheel: a ring of `wheel_size` slots, each
+    one covering `tick_size` seconds. Every cycle the driver only visits the slots elapsed since the previous cycle, and
+    moves the executors that are due to a FIFO queue. `batch_size` long-lived worker tasks take the executors from the
+    queue and run their control tasks, so at most `batch_size` control tasks run concurrently and no task is created
+    per control task. Once a cycle started `batch_size` control tasks and used its `cycle_time_budget`, the executors
+    left in the queue run first in the next cycle, after letting the other tasks of the event loop run.
+    Once its control task is done, an executor is scheduled again `update_interval` seconds later, and its worker
+    takes the next executor in the queue, so a slow control task (e.g. waiting for a gateway request) does not delay
+    the control tasks of the other executors.
+
+    Executors can also be woken up before their next scheduled run (see `wake_up`), to react to events as soon as
+    possible. The driver and worker tasks only run while there are executors scheduled, and the driver sleeps until
+    the next slot of the wheel, so the scheduling cost depends on the number of executors due, not on the number of
+    executors running.
+    """
+    DEFAULT_TICK_SIZE = 0.1
+    DEFAULT_WHEEL_SIZE = 512
+    DEFAULT_BATCH_SIZE = 50
+    DEFAULT_CYCLE_TIME_BUDGET = 0.05
+
+    _logger = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 tick_size: float = DEFAULT_TICK_SIZE,
+                 wheel_size: int = DEFAULT_WHEEL_SIZE,
+                 batch_size: int = DEFAULT_BATCH_SIZE,
+                 cycle_time_budget: float = DEFAULT_CYCLE_TIME_BUDGET):
+        """
+        :param tick_size: the duration covered by each slot of the timer wheel, in seconds
+        :param wheel_size: the number of slots of the timer wheel
+        :param batch_size: the number of worker tasks, i.e. the maximum number of control tasks running concurrently
+        :param cycle_time_budget: the time after which a cycle stops starting new control tasks, once it started
+            `batch_size` of them, in seconds
+        """
+        self._tick_size = tick_size
+        self._wheel_size = wheel_size
+        self._batch_size = batch_size
+        self._cycle_time_budget = cycle_time_budget
+        self._wheel: List[List[Tuple[int, "RunnableBase"]]] = [[] for _ in range(wheel_size)]
+        # The tick at which each executor in the wheel is due. Wheel entries not matching it are outdated.
+        self._due_ticks: Dict["RunnableBase", int] = {}
+        self._last_tick: Optional[int] = None
+        self._ready: Deque["RunnableBase"] = deque()
+        self._ready_executors: Set["RunnableBase"] = set()
+        # The worker task running the control task of each running executor
+        self._control_tasks: Dict["RunnableBase", asyncio.Task] = {}
+        self._started_executors: Set["RunnableBase"] = set()
+        self._executors_to_start: Set["RunnableBase"] = set()
+        self._wake_up_requested: Set["RunnableBase"] = set()
+        # Wakes up the driver task
+        self._wake_up_event: Optional[asyncio.Event] = None
+        # Wakes up the worker tasks waiting for executors in the queue
+        self._ready_event: Optional[asyncio.Event] = None
+        self._driver_task: Optional[asyncio.Task] = None
+        self._worker_tasks: List[asyncio.Task] = []
+        self._cycle_start = 0.0
+        self._cycle_control_tasks_count = 0
+        # The time until which the driver sleeps, None while it waits for a control task to finish
+        self._driver_sleep_deadline: Optional[float] = None
+        self._over_budget_cycles_count = 0
+
+    @property
+    def executors_count(self) -> int:
+        """
+        The number of executors handled by the scheduler (waiting, due or running)
+        """
+        return len(self._due_ticks) + len(self._ready_executors) + len(self._control_tasks)
+
+    @property
+    def ready_executors_count(self) -> int:
+        """
+        The number of executors due, waiting for their control task to run
+        """
+        return len(self._ready)
+
+    @property
+    def over_budget_cycles_count(self) -> int:
+        """
+        The number of cycles that could not run all the executors due within the time budget
+        """
+        return self._over_budget_cycles_count
+
+    @property
+    def running(self) -> bool:
+        return self._driver_task is not None
+
+    def add(self, executor: "RunnableBase"):
+        """
+        Starts running the control task of the executor. The first control task runs in the next cycle.
+        """
+        if executor in self._started_executors:
+            return
+        self._started_executors.add(executor)
+        self._executors_to_start.add(executor)
+        self._make_ready(executor)
+
+    def wake_up(self, executor: "RunnableBase"):
+        """
+        Runs the control task of the executor in the next cycle, instead of waiting for its update interval. If the
+        control task is already running, it will run again as soon as it is done.
+        """
+        if executor not in self._started_executors:
+            return
+        if executor in self._control_tasks:
+            self._wake_up_requested.add(executor)
+            return
+        self._due_ticks.pop(executor, None)
+        self._make_ready(executor)
+
+    def stop(self):
+        """
+        Stops the driver task and cancels the running control tasks. The executors are not stopped, but their control
+        tasks stop running.
+        """
+        if self._driver_task is not None:
+            self._driver_task.cancel()
+            self._driver_task = None
+        self._stop_workers()
+        self._control_tasks.clear()
+        self._wheel = [[] for _ in range(self._wheel_size)]
+        self._due_ticks.clear()
+        self._ready.clear()
+        self._ready_executors.clear()
+        self._started_executors.clear()
+        self._executors_to_start.clear()
+        self._wake_up_requested.clear()
+
+    def _make_ready(self, executor: "RunnableBase"):
+        if executor not in self._ready_executors:
+            self._ready_executors.add(executor)
+            self._ready.append(executor)
+        self._ensure_driver_running()
+        self._wake_up_event.set()
+
+    def _ensure_driver_running(self):
+        if self._driver_task is None:
+            self._wake_up_event = asyncio.Event()
+            self._ready_event = asyncio.Event()
+            self._driver_task = safe_ensure_future(self._driver_loop())
+            self._worker_tasks = [safe_ensure_future(self._worker_loop()) for _ in range(self._batch_size)]
+
+    def _stop_workers(self):
+        for worker_task in self._worker_tasks:
+            worker_task.cancel()
+        self._worker_tasks = []
+
+    def _schedule(self, executor: "RunnableBase", due_time: float):
+        due_tick = math.ceil(due_time / self._tick_size)
+        if self._last_tick is not None:
+            # The slots up to the last tick were already visited
+            due_tick = max(due_tick, self._last_tick + 1)
+        self._due_ticks[executor] = due_tick
+        self._wheel[due_tick % self._wheel_size].append((due_tick, executor))
+
+    def _collect_due_executors(self, now: float):
+        current_tick = math.floor(now / self._tick_size)
+        if self._last_tick is None:
+            self._last_tick = current_tick - 1
+        # A full turn of the wheel visits all the slots, even if the cycle is late by more than one turn
+        first_tick = max(self._last_tick + 1, current_tick - self._wheel_size + 1)
+        for tick in range(first_tick, current_tick + 1):
+            slot_index = tick % self._wheel_size
+            slot = self._wheel[slot_index]
+            if len(slot) == 0:
+                continue
+            pending_entries = []
+            for due_tick, executor in slot:
+                if self._due_ticks.get(executor) != due_tick:
+                    continue
+                if due_tick > current_tick:
+                    pending_entries.append((due_tick, executor))
+                    continue
+                del self._due_ticks[executor]
+                self._ready_executors.add(executor)
+                self._ready.append(executor)
+            self._wheel[slot_index] = pending_entries
+        self._last_tick = max(self._last_tick, current_tick)
+
+    async def _driver_loop(self):
+        while self.executors_count > 0:
+            self._cycle_start = time.monotonic()
+            self._cycle_control_tasks_count = 0
+            self._collect_due_executors(self._cycle_start)
+            self._wake_up_event.clear()
+            if len(self._ready) > 0:
+                self._ready_event.set()
+                # Lets the workers start the control tasks, until they wait or the cycle used its time budget
+                await asyncio.sleep(0)
+
+            if not self._is_cycle_out_of_budget() and self.executors_count > 0:
+                # Sleeps until the next slot of the wheel, or until a control task finishes if no executor is waiting
+                # in the wheel. The workers also wake the driver up when the cycle runs out of time budget.
+                timer_handle = None
+                self._driver_sleep_deadline = None
+                if len(self._due_ticks) > 0:
+                    self._driver_sleep_deadline = (self._last_tick + 1) * self._tick_size
+                    timer_handle = asyncio.get_running_loop().call_later(
+                        max(self._driver_sleep_deadline - time.monotonic(), 0), self._wake_up_event.set)
+                try:
+                    await self._wake_up_event.wait()
+                finally:
+                    if timer_handle is not None:
+                        timer_handle.cancel()
+            if self._is_cycle_out_of_budget():
+                # The executors left in the queue run first in the next cycle
+                self._over_budget_cycles_count += 1
+                await asyncio.sleep(0)
+        self._stop_workers()
+        self._driver_task = None
+
+    async def _worker_loop(self):
+        while True:
+            if not self._can_start_control_task():
+                if self._is_cycle_out_of_budget():
+                    self._wake_up_event.set()
+                self._ready_event.clear()
+                await self._ready_event.wait()
+                continue
+            executor = self._ready.popleft()
+            self._ready_executors.remove(executor)
+            self._cycle_control_tasks_count += 1
+            self._control_tasks[executor] = asyncio.current_task()
+            await self._run_control_task(executor)
+
+    def _can_start_control_task(self) -> bool:
+        return len(self._ready) > 0 and not self._is_cycle_budget_used()
+
+    def _is_cycle_budget_used(self) -> bool:
+        # At least `batch_size` control tasks start every cycle, even if the time budget is exceeded
+        return (self._cycle_control_tasks_count >= self._batch_size
+                and time.monotonic() - self._cycle_start >= self._cycle_time_budget)
+
+    def _is_cycle_out_of_budget(self) -> bool:
+        return len(self._ready) > 0 and self._is_cycle_budget_used()
+
+    async def _run_control_task(self, executor: "RunnableBase"):
+        """
+        Runs one iteration of the control loop of the executor (see `RunnableBase.control_loop`)
+        """
+        try:
+            if executor in self._executors_to_start:
+                self._executors_to_start.remove(executor)
+                executor.on_start()
+            if executor.terminated.is_set():
+                executor.on_stop()
+                self._remove(executor)
+                return
+            try:
+                await executor.control_task()
+            except Exception as e:
+                executor.logger().error(e, exc_info=True)
+            executor.on_control_task_done()
+            if executor.terminated.is_set():
+                executor.on_stop()
+                self._remove(executor)
+                return
+        except Exception:
+            self.logger().error(f"Unexpected error running the control task of {executor}. "
+                                f"The executor is no longer scheduled.", exc_info=True)
+            self._remove(executor)
+            return
+        finally:
+            self._on_control_task_done(executor)
+
+        if executor in self._wake_up_requested:
+            self._wake_up_requested.remove(executor)
+            self._make_ready(executor)
+        else:
+            self._schedule(executor, time.monotonic() + executor.update_interval)
+
+    def _on_control_task_done(self, executor: "RunnableBase"):
+        # The control task might belong to a previous run of the scheduler, stopped while it was running
+        if self._control_tasks.get(executor) is not asyncio.current_task():
+            return
+        del self._control_tasks[executor]
+        if self._driver_sleep_deadline is None:
+            # The driver waits for a control task to finish (to schedule the executor again, or end if there are no
+            # more executors)
+            self._wake_up_event.set()
+
+    def _remove(self, executor: "RunnableBase"):
+        self._started_executors.discard(executor)
+        self._executors_to_start.discard(executor)
+        self._wake_up_requested.discard(executor)
+        self._due_ticks.pop(executor, None)
@@ -0,0 +1,116 @@
+import weakref
+from typing import TYPE_CHECKING, Dict, Set
+
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.event.events import MarketEvent
+
+if TYPE_CHECKING:  # avoid circular import problems
+    from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
+
+
+class OrderEventRouter:
+    """
+    Delivers the order events of a connector only to the executor that placed each order.
+
+    There is one router per connector, listening once to the order events of the connector. The executors subscribe
+    to the router when they start and register the id of every order they place, so each event is dispatched to a
+    single executor with a dictionary lookup, instead of being dispatched to all the executors and filtered by each
+    of them. The cost of dispatching an event does not depend on the number of executors running.
+
+    After processing an event, the executor info snapshot of the executor is marked as outdated. The executors opting
+    into it (`WAKE_UP_ON_ORDER_EVENTS`) are also woken up, so their control task runs without waiting for their update
+    interval.
+    """
+    # Maps the order events to the name of the executor method processing them
+    EVENT_HANDLERS: Dict[MarketEvent, str] = {
+        MarketEvent.BuyOrderCreated: "process_order_created_event",
+        MarketEvent.SellOrderCreated: "process_order_created_event",
+        MarketEvent.OrderFilled: "process_order_filled_event",
+        MarketEvent.BuyOrderCompleted: "process_order_completed_event",
+        MarketEvent.SellOrderCompleted: "process_order_completed_event",
+        MarketEvent.OrderCancelled: "process_order_canceled_event",
+        MarketEvent.OrderFailure: "process_order_failed_event",
+    }
+    _HANDLERS_BY_TAG: Dict[int, str] = {event.value: handler for event, handler in EVENT_HANDLERS.items()}
+
+    _routers: "weakref.WeakKeyDictionary[ConnectorBase, OrderEventRouter]" = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def get_router(cls, connector: ConnectorBase) -> "OrderEventRouter":
+        """
+        Returns the router of the connector, creating it the first time
+        """
+        router = cls._routers.get(connector)
+        if router is None:
+            router = cls(connector)
+            cls._routers[connector] = router
+        return router
+
+    def __init__(self, connector: ConnectorBase):
+        # The router is stored in a dictionary weakly keyed by the connector, so it must not keep the connector alive
+        self._connector_ref = weakref.ref(connector)
+        self._event_forwarder = SourceInfoEventForwarder(self._route_event)
+        self._executors: Set["ExecutorBase"] = set()
+        self._order_owners: Dict[str, "ExecutorBase"] = {}
+        self._executor_orders: Dict["ExecutorBase", Set[str]] = {}
+
+    @property
+    def executors_count(self) -> int:
+        return len(self._executors)
+
+    @property
+    def order_owners(self) -> Dict[str, "ExecutorBase"]:
+        return self._order_owners
+
+    def subscribe(self, executor: "ExecutorBase"):
+        """
+        Starts routing the events of the orders placed by the executor. The router starts listening to the connector
+        events when the first executor subscribes.
+        """
+        if executor in self._executors:
+            return
+        if len(self._executors) == 0:
+            self._set_listening(True)
+        self._executors.add(executor)
+        self._executor_orders[executor] = set()
+
+    def unsubscribe(self, executor: "ExecutorBase"):
+        """
+        Stops routing the events of the orders placed by the executor. The router stops listening to the connector
+        events when the last executor unsubscribes.
+        """
+        if executor not in self._executors:
+            return
+        self._executors.remove(executor)
+        for order_id in self._executor_orders.pop(executor):
+            self._order_owners.pop(order_id, None)
+        if len(self._executors) == 0:
+            self._set_listening(False)
+
+    def register_order(self, order_id: str, executor: "ExecutorBase"):
+        """
+        Associates an order with the executor that placed it. The executor has to be subscribed.
+        """
+        if executor not in self._executors:
+            return
+        self._order_owners[order_id] = executor
+        self._executor_orders[executor].add(order_id)
+
+    def _set_listening(self, listening: bool):
+        connector = self._connector_ref()
+        if connector is None:
+            return
+        for event in self.EVENT_HANDLERS:
+            if listening:
+                connector.add_listener(event, self._event_forwarder)
+            else:
+                connector.remove_listener(event, self._event_forwarder)
+
+    def _route_event(self, event_tag: int, market: ConnectorBase, event):
+        executor = self._order_owners.get(getattr(event, "order_id", None))
+        if executor is not None:
+            getattr(executor, self._HANDLERS_BY_TAG[event_tag])(event_tag, market, event)
+            executor.mark_executor_info_dirty()
+            if executor.WAKE_UP_ON_ORDER_EVENTS:
+                executor.request_wake_up()
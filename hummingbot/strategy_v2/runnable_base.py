@@ -1,11 +1,15 @@
 import asyncio
 import logging
 from abc import ABC
+from typing import TYPE_CHECKING, Optional
 
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
 from hummingbot.strategy_v2.models.base import RunnableStatus
 
+if TYPE_CHECKING:  # avoid circular import problems
+    from hummingbot.strategy_v2.executors.executor_scheduler import ExecutorScheduler
+
 
 class RunnableBase(ABC):
     """
@@ -29,6 +33,7 @@ class RunnableBase(ABC):
         self.update_interval = update_interval
         self._status: RunnableStatus = RunnableStatus.NOT_STARTED
         self.terminated = asyncio.Event()
+        self._scheduler: Optional["ExecutorScheduler"] = None
 
     @property
     def status(self):
@@ -39,6 +44,19 @@ class RunnableBase(ABC):
         """
         return self._status
 
+    @property
+    def scheduler(self) -> Optional["ExecutorScheduler"]:
+        return self._scheduler
+
+    def set_scheduler(self, scheduler: Optional["ExecutorScheduler"]):
+        """
+        Sets the scheduler running the control task of the smart component, instead of its own control loop task.
+        Has to be called before starting the component.
+
+        :param scheduler: The scheduler, or None to run the control loop in its own task.
+        """
+        self._scheduler = scheduler
+
     def start(self):
         """
         Start the control loop of the smart component.
@@ -47,7 +65,10 @@ class RunnableBase(ABC):
         if self._status == RunnableStatus.NOT_STARTED:
             self.terminated.clear()
             self._status = RunnableStatus.RUNNING
-            safe_ensure_future(self.control_loop())
+            if self._scheduler is not None:
+                self._scheduler.add(self)
+            else:
+                safe_ensure_future(self.control_loop())
 
     def stop(self):
         """
@@ -57,6 +78,16 @@ class RunnableBase(ABC):
         if self._status != RunnableStatus.TERMINATED:
             self._status = RunnableStatus.TERMINATED
             self.terminated.set()
+            if self._scheduler is not None:
+                self._scheduler.wake_up(self)
+
+    def request_wake_up(self):
+        """
+        Asks the scheduler to run the control task as soon as possible, instead of waiting for the update interval.
+        Has no effect when the component runs its own control loop.
+        """
+        if self._scheduler is not None:
+            self._scheduler.wake_up(self)
 
     async def control_loop(self):
         """
@@ -70,6 +101,7 @@ class RunnableBase(ABC):
             except Exception as e:
                 self.logger().error(e, exc_info=True)
             finally:
+                self.on_control_task_done()
                 await asyncio.sleep(self.update_interval)
         self.on_stop()
 
@@ -87,6 +119,13 @@ class RunnableBase(ABC):
         """
         pass
 
+    def on_control_task_done(self):
+        """
+        Method to be executed after each run of the control task, even if it failed.
+        This method should be overridden in subclasses to provide specific behavior.
+        """
+        pass
+
     async def control_task(self):
         """
         The main task to be executed in the control loop.
@@ -16,6 +16,7 @@ from hummingbot.client.config.config_helpers import ClientConfigAdapter, read_sy
 from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.client.config.strategy_config_data_types import BaseTradingStrategyConfigMap
 from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
 
 
 class ImportCommandTest(unittest.TestCase):
@@ -30,6 +31,10 @@ class ImportCommandTest(unittest.TestCase):
         self.cli_mock_assistant = CLIMockingAssistant(self.app.app)
         self.cli_mock_assistant.start()
 
+        get_trading_pair_fetcher_patcher = patch.object(TradingPairFetcher, "get_instance")
+        get_trading_pair_fetcher_patcher.start()
+        self.addCleanup(get_trading_pair_fetcher_patcher.stop)
+
     def tearDown(self) -> None:
         self.cli_mock_assistant.stop()
         super().tearDown()
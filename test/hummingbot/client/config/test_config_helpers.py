@@ -18,10 +18,12 @@ from hummingbot.client.config.config_helpers import (
     get_connector_config_yml_path,
     get_strategy_config_map,
     load_connector_config_map_from_file,
+    load_strategy_config_map_from_file,
     save_to_yml,
 )
 from hummingbot.client.config.security import Security
 from hummingbot.client.config.strategy_config_data_types import BaseStrategyConfigMap
+from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
 from hummingbot.strategy.avellaneda_market_making.avellaneda_market_making_config_map_pydantic import (
     AvellanedaMarketMakingConfigMap,
 )
@@ -167,6 +169,29 @@ strategy: pure_market_making
 
         self.assertEqual(secret_value, instance.sub_model.secret_attr.get_secret_value())
 
+    @patch.object(TradingPairFetcher, "get_instance")
+    @patch("hummingbot.client.config.config_helpers.get_strategy_pydantic_config_cls")
+    def test_load_strategy_config_map_from_file_requests_the_connectors_trading_pairs(
+            self, get_strategy_pydantic_config_cls_mock: MagicMock, get_trading_pair_fetcher_mock: MagicMock):
+        class DummyStrategy(BaseStrategyConfigMap):
+            class Config:
+                title = "pure_market_making"
+
+            strategy: str = "pure_market_making"
+            exchange: str = "binance"
+            market: str = "COINALPHA-HBOT"
+
+        get_strategy_pydantic_config_cls_mock.return_value = DummyStrategy
+        trading_pair_fetcher = get_trading_pair_fetcher_mock.return_value
+
+        with TemporaryDirectory() as d:
+            temp_file_name = Path(d) / "cm.yml"
+            save_to_yml(temp_file_name, ClientConfigAdapter(DummyStrategy()))
+            loaded_cm = self.async_run_with_timeout(load_strategy_config_map_from_file(temp_file_name))
+
+        trading_pair_fetcher.request_trading_pairs.assert_called_once_with("binance")
+        self.assertEqual("COINALPHA-HBOT", loaded_cm.market)
+
 
 class ReadOnlyClientAdapterTest(unittest.TestCase):
 
@@ -0,0 +1,229 @@
+import asyncio
+from decimal import Decimal
+from test.mock.mock_exchange import MockExchange
+from types import SimpleNamespace
+from typing import Awaitable
+from unittest import TestCase
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.balance_ledger import BalanceLedger
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, TradeUpdate
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, DeductedFromReturnsTradeFee, TokenAmount
+
+
+class BalanceLedgerTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.base_asset = "COINALPHA"
+        self.quote_asset = "HBOT"
+        self.trading_pair = f"{self.base_asset}-{self.quote_asset}"
+        self.connector = SimpleNamespace(
+            _account_balances={self.base_asset: Decimal("10"), self.quote_asset: Decimal("1000")},
+            _account_available_balances={self.base_asset: Decimal("10"), self.quote_asset: Decimal("1000")},
+        )
+        self.ledger = BalanceLedger(connector=self.connector, reconciliation_interval=60)
+        self.ledger.reconcile(timestamp=1000)
+
+    def _order(self, trade_type: TradeType, amount: Decimal, price: Decimal) -> InFlightOrder:
+        return InFlightOrder(
+            client_order_id="OID1",
+            exchange_order_id="EOID1",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=trade_type,
+            amount=amount,
+            price=price,
+            creation_timestamp=1000,
+            initial_state=OrderState.OPEN,
+        )
+
+    def _trade_update(self, base_amount: Decimal, price: Decimal, fee) -> TradeUpdate:
+        return TradeUpdate(
+            trade_id="T1",
+            client_order_id="OID1",
+            exchange_order_id="EOID1",
+            trading_pair=self.trading_pair,
+            fill_timestamp=1001,
+            fill_price=price,
+            fill_base_amount=base_amount,
+            fill_quote_amount=base_amount * price,
+            fee=fee,
+        )
+
+    def test_buy_order_locks_and_releases_quote(self):
+        order = self._order(TradeType.BUY, amount=Decimal("2"), price=Decimal("100"))
+
+        self.ledger.lock(order)
+
+        self.assertEqual(Decimal("800"), self.connector._account_available_balances[self.quote_asset])
+        self.assertEqual(Decimal("1000"), self.connector._account_balances[self.quote_asset])
+        self.assertEqual({self.quote_asset: Decimal("200")}, self.ledger.locked_balances)
+
+        self.ledger.release(order)
+
+        self.assertEqual(Decimal("1000"), self.connector._account_available_balances[self.quote_asset])
+        self.assertEqual({}, self.ledger.locked_balances)
+
+    def test_sell_order_locks_base(self):
+        order = self._order(TradeType.SELL, amount=Decimal("3"), price=Decimal("100"))
+
+        self.ledger.lock(order)
+
+        self.assertEqual(Decimal("7"), self.connector._account_available_balances[self.base_asset])
+
+    def test_buy_fill_with_fee_added_to_cost(self):
+        order = self._order(TradeType.BUY, amount=Decimal("2"), price=Decimal("100"))
+        self.ledger.lock(order)
+        trade_update = self._trade_update(
+            base_amount=Decimal("1"),
+            price=Decimal("99"),
+            fee=AddedToCostTradeFee(flat_fees=[TokenAmount(token=self.quote_asset, amount=Decimal("0.1"))]))
+        order.update_with_trade_update(trade_update)
+
+        self.ledger.apply_trade_update(order, trade_update)
+
+        self.assertEqual(Decimal("11"), self.connector._account_balances[self.base_asset])
+        self.assertEqual(Decimal("11"), self.connector._account_available_balances[self.base_asset])
+        self.assertEqual(Decimal("900.9"), self.connector._account_balances[self.quote_asset])
+        # 100 still locked for the remaining amount of the order
+        self.assertEqual(Decimal("800.9"), self.connector._account_available_balances[self.quote_asset])
+        self.assertFalse(self.ledger.drift_detected)
+
+        self.ledger.release(order)
+
+        self.assertEqual(Decimal("900.9"), self.connector._account_available_balances[self.quote_asset])
+
+    def test_sell_fill_with_percentual_fee_deducted_from_returns(self):
+        order = self._order(TradeType.SELL, amount=Decimal("2"), price=Decimal("100"))
+        self.ledger.lock(order)
+        trade_update = self._trade_update(
+            base_amount=Decimal("2"),
+            price=Decimal("100"),
+            fee=DeductedFromReturnsTradeFee(percent=Decimal("0.01")))
+        order.update_with_trade_update(trade_update)
+
+        self.ledger.apply_trade_update(order, trade_update)
+        self.ledger.release(order)
+
+        self.assertEqual(Decimal("8"), self.connector._account_balances[self.base_asset])
+        self.assertEqual(Decimal("8"), self.connector._account_available_balances[self.base_asset])
+        self.assertEqual(Decimal("1198"), self.connector._account_balances[self.quote_asset])
+        self.assertEqual(Decimal("1198"), self.connector._account_available_balances[self.quote_asset])
+
+    def test_fee_in_third_token_triggers_reconciliation(self):
+        order = self._order(TradeType.BUY, amount=Decimal("1"), price=Decimal("100"))
+        trade_update = self._trade_update(
+            base_amount=Decimal("1"),
+            price=Decimal("100"),
+            fee=AddedToCostTradeFee(percent=Decimal("0.001"), percent_token="BNB"))
+
+        self.ledger.apply_trade_update(order, trade_update)
+
+        self.assertTrue(self.ledger.drift_detected)
+        self.assertTrue(self.ledger.is_reconciliation_required(timestamp=1001))
+
+    def test_negative_balance_triggers_reconciliation(self):
+        order = self._order(TradeType.BUY, amount=Decimal("20"), price=Decimal("100"))
+
+        self.ledger.lock(order)
+
+        self.assertTrue(self.ledger.is_reconciliation_required(timestamp=1001))
+
+    def test_reconciliation_required_after_interval(self):
+        self.assertFalse(self.ledger.is_reconciliation_required(timestamp=1059))
+        self.assertTrue(self.ledger.is_reconciliation_required(timestamp=1060))
+
+    def test_changes_during_the_balances_request_are_applied_again_when_reconciling(self):
+        order = self._order(TradeType.BUY, amount=Decimal("2"), price=Decimal("100"))
+
+        self.ledger.start_balances_request()
+        self.ledger.lock(order)
+        # The exchange balances, requested before the order was created
+        self.connector._account_balances[self.quote_asset] = Decimal("1000")
+        self.connector._account_available_balances[self.quote_asset] = Decimal("1000")
+        self.ledger.reconcile(timestamp=1010)
+
+        self.assertEqual(Decimal("800"), self.connector._account_available_balances[self.quote_asset])
+        self.assertEqual(Decimal("1000"), self.connector._account_balances[self.quote_asset])
+        # The exchange response could include the order, so the next balance update reconciles again
+        self.assertTrue(self.ledger.is_reconciliation_required(timestamp=1011))
+
+        self.ledger.release(order)
+
+        self.assertEqual(Decimal("1000"), self.connector._account_available_balances[self.quote_asset])
+
+    def test_changes_before_the_balances_request_are_not_applied_again(self):
+        order = self._order(TradeType.BUY, amount=Decimal("2"), price=Decimal("100"))
+        self.ledger.lock(order)
+
+        self.ledger.start_balances_request()
+        self.connector._account_available_balances[self.quote_asset] = Decimal("800")
+        self.ledger.reconcile(timestamp=1010)
+
+        self.assertEqual(Decimal("800"), self.connector._account_available_balances[self.quote_asset])
+        self.assertFalse(self.ledger.is_reconciliation_required(timestamp=1011))
+
+
+class ExchangePyBaseBalanceLedgerTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.base_asset = "COINALPHA"
+        self.quote_asset = "HBOT"
+        self.trading_pair = f"{self.base_asset}-{self.quote_asset}"
+        self.exchange = MockExchange(
+            client_config_map=ClientConfigAdapter(ClientConfigMap()),
+            trading_pairs=[self.trading_pair],
+            use_balance_ledger=True)
+        self.exchange.exchange_balances = {
+            self.base_asset: (Decimal("10"), Decimal("10")),
+            self.quote_asset: (Decimal("2000"), Decimal("2000")),
+        }
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        return asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def _start_tracking_buy_order(self, order_id: str):
+        self.exchange.start_tracking_order(
+            order_id=order_id,
+            exchange_order_id=None,
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            price=Decimal("100"),
+            amount=Decimal("1"),
+        )
+
+    def test_balance_ledger_updates_the_balances_between_reconciliations(self):
+        self.exchange._set_current_timestamp(1640780000)
+        self.async_run_with_timeout(self.exchange._update_all_balances())
+
+        self._start_tracking_buy_order("OID1")
+        self.exchange._set_current_timestamp(1640780010)
+        self.async_run_with_timeout(self.exchange._update_all_balances())
+
+        # The balances are not requested again before the reconciliation interval
+        self.assertEqual(1, self.exchange.balance_requests_count)
+        self.assertEqual(Decimal("1900"), self.exchange.available_balances[self.quote_asset])
+        self.assertEqual(Decimal("2000"), self.exchange.get_all_balances()[self.quote_asset])
+
+    def test_orders_created_during_the_balances_request_keep_their_balance_locked(self):
+        update_balances = self.exchange._update_balances
+
+        async def update_balances_creating_an_order():
+            # The order is created while the request is in flight, the exchange response does not include it
+            self._start_tracking_buy_order("OID1")
+            await update_balances()
+
+        self.exchange._update_balances = update_balances_creating_an_order
+        self.exchange._set_current_timestamp(1640780000)
+        self.async_run_with_timeout(self.exchange._update_all_balances())
+
+        self.assertEqual(Decimal("1900"), self.exchange.available_balances[self.quote_asset])
+
+        self.exchange.stop_tracking_order("OID1")
+
+        self.assertEqual(Decimal("2000"), self.exchange.available_balances[self.quote_asset])
@@ -1,5 +1,6 @@
 import unittest
 from decimal import Decimal
+from unittest.mock import patch
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
@@ -10,6 +11,7 @@ from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.order_candidate import OrderCandidate
 from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeSchema
+from hummingbot.core.utils.estimate_fee import build_trade_fee
 
 
 class BudgetCheckerTest(unittest.TestCase):
@@ -580,3 +582,60 @@ class BudgetCheckerTest(unittest.TestCase):
 
         self.assertEqual(Decimal("7"), first_adjusted_candidate.amount)
         self.assertEqual(Decimal("5"), second_adjusted_candidate.amount)
+
+    def _multi_level_proposal(self, levels: int):
+        order_candidates = []
+        for level in range(levels):
+            for side, price in ((TradeType.BUY, Decimal("2") - level * Decimal("0.01")),
+                                (TradeType.SELL, Decimal("2") + level * Decimal("0.01"))):
+                order_candidates.append(OrderCandidate(
+                    trading_pair=self.trading_pair,
+                    is_maker=True,
+                    order_type=OrderType.LIMIT,
+                    order_side=side,
+                    amount=Decimal("1") + level * Decimal("0.25"),
+                    price=price,
+                ))
+        return order_candidates
+
+    def test_adjust_candidates_matches_sequential_adjustment(self):
+        trade_fee_schema = TradeFeeSchema(
+            maker_percent_fee_decimal=Decimal("0.01"),
+            taker_percent_fee_decimal=Decimal("0.02"),
+            maker_fixed_fees=[TokenAmount(self.quote_asset, Decimal("0.1"))],
+        )
+        exchange = MockPaperExchange(
+            client_config_map=ClientConfigAdapter(ClientConfigMap()),
+            trade_fee_schema=trade_fee_schema)
+        exchange.set_balance(self.base_asset, Decimal("40"))
+        exchange.set_balance(self.quote_asset, Decimal("70"))
+        budget_checker: BudgetChecker = exchange.budget_checker
+        order_candidates = self._multi_level_proposal(levels=20)
+
+        for all_or_none in (True, False):
+            budget_checker.reset_locked_collateral()
+            expected_candidates = [
+                budget_checker.adjust_candidate_and_lock_available_collateral(order_candidate, all_or_none)
+                for order_candidate in order_candidates
+            ]
+            budget_checker.reset_locked_collateral()
+
+            adjusted_candidates = budget_checker.adjust_candidates(order_candidates, all_or_none=all_or_none)
+
+            self.assertEqual(expected_candidates, adjusted_candidates)
+            self.assertTrue(any(candidate.amount == Decimal("0") for candidate in adjusted_candidates))
+
+    def test_adjust_candidates_builds_each_fee_once(self):
+        self.exchange.set_balance(self.base_asset, Decimal("1000"))
+        self.exchange.set_balance(self.quote_asset, Decimal("1000"))
+        order_candidates = self._multi_level_proposal(levels=20)
+
+        with patch("hummingbot.core.data_type.order_candidate.build_trade_fee",
+                   wraps=build_trade_fee) as build_trade_fee_mock:
+            adjusted_candidates = self.budget_checker.adjust_candidates(order_candidates)
+
+        self.assertEqual(40, len(adjusted_candidates))
+        self.assertTrue(all(candidate.amount > Decimal("0") for candidate in adjusted_candidates))
+        self.assertEqual(2, build_trade_fee_mock.call_count)
+        self.assertIsNone(self.budget_checker._batch_fees)
+        self.assertIsNone(self.budget_checker._batch_balances)
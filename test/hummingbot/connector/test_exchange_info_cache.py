@@ -0,0 +1,153 @@
+import asyncio
+import json
+import os
+import tempfile
+import threading
+from decimal import Decimal
+from unittest import TestCase
+from unittest.mock import AsyncMock, patch
+
+from bidict import bidict
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
+from hummingbot.connector.exchange_info_cache import ExchangeInfoCache
+from hummingbot.connector.trading_rule import TradingRule
+
+
+class ExchangeInfoCacheTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = ExchangeInfoCache(cache_dir=self.temp_dir.name, ttl=60)
+        self.trading_rule = TradingRule(
+            trading_pair="COINALPHA-HBOT",
+            min_order_size=Decimal("0.01"),
+            min_price_increment=Decimal("0.0001"),
+            min_base_amount_increment=Decimal("0.001"),
+            min_notional_size=Decimal("10"),
+            supports_market_orders=False,
+        )
+
+    def tearDown(self) -> None:
+        ExchangeInfoCache.disable()
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def test_load_returns_none_when_there_is_no_entry(self):
+        self.assertIsNone(self.cache.load(connector_name="binance", domain="com"))
+
+    def test_save_and_load_trading_rules_and_symbol_map(self):
+        self.cache.save(
+            connector_name="binance",
+            domain="com",
+            trading_rules=[self.trading_rule],
+            symbol_map=bidict({"COINALPHAHBOT": "COINALPHA-HBOT"}))
+
+        entry = self.cache.load(connector_name="binance", domain="com")
+
+        self.assertEqual({"COINALPHAHBOT": "COINALPHA-HBOT"}, entry.symbol_map)
+        self.assertEqual(1, len(entry.trading_rules))
+        self.assertEqual(repr(self.trading_rule), repr(entry.trading_rules[0]))
+        self.assertIsNone(self.cache.load(connector_name="binance", domain="us"))
+
+    def test_save_keeps_the_information_not_provided(self):
+        self.cache.save(connector_name="binance", domain="com", trading_rules=[self.trading_rule])
+        self.cache.save(connector_name="binance", domain="com", symbol_map={"COINALPHAHBOT": "COINALPHA-HBOT"})
+
+        entry = self.cache.load(connector_name="binance", domain="com")
+
+        self.assertEqual({"COINALPHAHBOT": "COINALPHA-HBOT"}, entry.symbol_map)
+        self.assertEqual("COINALPHA-HBOT", entry.trading_rules[0].trading_pair)
+
+    @patch("hummingbot.connector.exchange_info_cache.time.time")
+    def test_expired_entries_are_ignored(self, time_mock):
+        time_mock.return_value = 1000
+        self.cache.save(connector_name="binance", domain="com", symbol_map={"COINALPHAHBOT": "COINALPHA-HBOT"})
+
+        time_mock.return_value = 1060
+        self.assertIsNotNone(self.cache.load(connector_name="binance", domain="com"))
+        time_mock.return_value = 1061
+        self.assertIsNone(self.cache.load(connector_name="binance", domain="com"))
+
+    def test_invalid_file_is_ignored(self):
+        with open(os.path.join(self.temp_dir.name, "binance_com.json"), "w") as cache_file:
+            cache_file.write("{invalid")
+
+        self.assertIsNone(self.cache.load(connector_name="binance", domain="com"))
+
+    def test_save_async_writes_the_entry_in_a_thread(self):
+        symbol_map = {"COINALPHAHBOT": "COINALPHA-HBOT"}
+        main_thread = threading.current_thread()
+        save_threads = []
+        original_save = self.cache.save
+
+        def save(*args, **kwargs):
+            save_threads.append(threading.current_thread())
+            original_save(*args, **kwargs)
+
+        self.cache.save = save
+        asyncio.get_event_loop().run_until_complete(self.cache.save_async(
+            connector_name="binance", domain="com", trading_rules=[self.trading_rule], symbol_map=symbol_map))
+
+        self.assertEqual(1, len(save_threads))
+        self.assertIsNot(main_thread, save_threads[0])
+        entry = self.cache.load(connector_name="binance", domain="com")
+        self.assertEqual(symbol_map, entry.symbol_map)
+        self.assertEqual([repr(self.trading_rule)], [repr(rule) for rule in entry.trading_rules])
+
+    def test_invalidate_removes_the_entry(self):
+        self.cache.save(connector_name="binance", domain="com", symbol_map={"COINALPHAHBOT": "COINALPHA-HBOT"})
+
+        self.cache.invalidate(connector_name="binance", domain="com")
+        self.cache.invalidate(connector_name="binance", domain="com")
+
+        self.assertIsNone(self.cache.load(connector_name="binance", domain="com"))
+
+    def test_connector_initializes_symbol_map_from_cache_without_requests(self):
+        ExchangeInfoCache.enable(cache_dir=self.temp_dir.name)
+        ExchangeInfoCache.get_instance().save(
+            connector_name="binance",
+            domain="com",
+            trading_rules=[self.trading_rule],
+            symbol_map={"COINALPHAHBOT": "COINALPHA-HBOT"})
+        connector = BinanceExchange(
+            client_config_map=ClientConfigAdapter(ClientConfigMap()),
+            binance_api_key="testAPIKey",
+            binance_api_secret="testSecret",
+            trading_pairs=["COINALPHA-HBOT"],
+            trading_required=False,
+        )
+        connector._make_trading_pairs_request = AsyncMock()
+
+        symbol = asyncio.get_event_loop().run_until_complete(
+            connector.exchange_symbol_associated_to_pair("COINALPHA-HBOT"))
+
+        self.assertEqual("COINALPHAHBOT", symbol)
+        self.assertIn("COINALPHA-HBOT", connector.trading_rules)
+        connector._make_trading_pairs_request.assert_not_called()
+
+    def test_connector_stores_fetched_symbol_map_in_cache(self):
+        ExchangeInfoCache.enable(cache_dir=self.temp_dir.name)
+        connector = BinanceExchange(
+            client_config_map=ClientConfigAdapter(ClientConfigMap()),
+            binance_api_key="testAPIKey",
+            binance_api_secret="testSecret",
+            trading_pairs=["COINALPHA-HBOT"],
+            trading_required=False,
+        )
+        connector._make_trading_pairs_request = AsyncMock(return_value={"symbols": [{
+            "symbol": "COINALPHAHBOT",
+            "status": "TRADING",
+            "baseAsset": "COINALPHA",
+            "quoteAsset": "HBOT",
+            "permissionSets": [["SPOT"]],
+        }]})
+
+        asyncio.get_event_loop().run_until_complete(connector.trading_pair_symbol_map())
+
+        with open(os.path.join(self.temp_dir.name, "binance_com.json")) as cache_file:
+            stored = json.load(cache_file)
+        self.assertEqual({"COINALPHAHBOT": "COINALPHA-HBOT"}, stored["symbol_map"])
@@ -1,4 +1,5 @@
 import asyncio
+import json
 import time
 from decimal import Decimal
 from typing import Awaitable
@@ -22,11 +23,15 @@ from hummingbot.core.event.events import (
     SellOrderCreatedEvent,
 )
 from hummingbot.logger import HummingbotLogger
+from hummingbot.model.executors import Executors
 from hummingbot.model.market_data import MarketData
 from hummingbot.model.order import Order
 from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
 from hummingbot.model.trade_fill import TradeFill
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
+from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
+from hummingbot.strategy_v2.models.base import RunnableStatus
+from hummingbot.strategy_v2.models.executors import CloseType
 
 
 class MarketsRecorderTests(TestCase):
@@ -434,3 +439,44 @@ class MarketsRecorderTests(TestCase):
         self.assertEqual(market_data[0].best_ask, Decimal("101"))
         self.assertEqual(market_data[0].best_bid, Decimal("99"))
         self.assertEqual(market_data[0].mid_price, Decimal("100"))
+
+    def test_closed_executors_performance_is_aggregated_by_controller_and_close_type(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+        )
+        executors = [
+            ("E1", "controller_1", CloseType.TAKE_PROFIT, 10.0, 100.0, False),
+            ("E2", "controller_1", CloseType.TAKE_PROFIT, 5.0, 50.0, False),
+            ("E3", "controller_1", CloseType.STOP_LOSS, -3.0, 30.0, False),
+            ("E4", "controller_2", CloseType.TAKE_PROFIT, 1.0, 10.0, False),
+            ("E5", "controller_2", None, 2.0, 20.0, True),
+        ]
+        config = json.loads(PositionExecutorConfig(
+            timestamp=1234, trading_pair="ETH-USDT", connector_name="binance",
+            side=TradeType.BUY, amount=Decimal(10), entry_price=Decimal(100)).json())
+        with self.manager.get_new_session() as session:
+            for executor_id, controller_id, close_type, net_pnl_quote, filled_amount_quote, is_active in executors:
+                session.add(Executors(
+                    id=executor_id, timestamp=1234, type="position_executor",
+                    close_type=close_type.value if close_type else None, close_timestamp=None,
+                    status=(RunnableStatus.RUNNING if is_active else RunnableStatus.TERMINATED).value,
+                    config=config, net_pnl_pct=0, net_pnl_quote=net_pnl_quote, cum_fees_quote=0,
+                    filled_amount_quote=filled_amount_quote, is_active=is_active, is_trading=is_active,
+                    custom_info={}, controller_id=controller_id))
+            session.commit()
+
+        performance = sorted(recorder.get_closed_executors_performance())
+
+        self.assertEqual([("controller_1", CloseType.STOP_LOSS.value, -3.0, 30.0, 1),
+                          ("controller_1", CloseType.TAKE_PROFIT.value, 15.0, 150.0, 2),
+                          ("controller_2", CloseType.TAKE_PROFIT.value, 1.0, 10.0, 1)],
+                         performance)
+        self.assertEqual(["E5"], [executor.id for executor in recorder.get_active_executors()])
@@ -0,0 +1,226 @@
+import asyncio
+from decimal import Decimal
+from test.mock.mock_exchange import MockExchange
+from typing import Awaitable
+from unittest import TestCase
+from unittest.mock import AsyncMock
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
+from hummingbot.connector.startup_orchestrator import StartupOrchestrator, StartupStepStatus
+from hummingbot.core.data_type.common import OrderType, TradeType
+
+
+class StartupOrchestratorTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.execution_log = []
+        self.running_steps = 0
+        self.max_running_steps = 0
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        return asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def _step(self, name: str, delay: float = 0.01, error: bool = False):
+        async def function():
+            self.running_steps += 1
+            self.max_running_steps = max(self.max_running_steps, self.running_steps)
+            self.execution_log.append(f"{name} start")
+            try:
+                await asyncio.sleep(delay)
+                if error:
+                    raise IOError(f"{name} error")
+            finally:
+                self.running_steps -= 1
+                self.execution_log.append(f"{name} end")
+        return function
+
+    def test_independent_steps_run_concurrently(self):
+        orchestrator = StartupOrchestrator()
+        orchestrator.add_step("exchange_1", "trading_rules", self._step("1 trading_rules", delay=0.05))
+        orchestrator.add_step("exchange_1", "time_synchronizer", self._step("1 time_synchronizer", delay=0.05))
+        orchestrator.add_step("exchange_2", "trading_rules", self._step("2 trading_rules", delay=0.05))
+
+        self.async_run_with_timeout(orchestrator.run())
+
+        self.assertEqual(3, self.max_running_steps)
+        self.assertTrue(all(step.status == StartupStepStatus.DONE for step in orchestrator.steps))
+        self.assertLess(orchestrator.duration, 0.15)
+        self.assertTrue(all(step.duration >= 0.05 for step in orchestrator.steps))
+
+    def test_steps_wait_for_their_dependencies(self):
+        orchestrator = StartupOrchestrator()
+        orchestrator.add_step("exchange_1", "balances", self._step("balances"), dependencies=["time_synchronizer"])
+        orchestrator.add_step("exchange_1", "time_synchronizer", self._step("time_synchronizer"))
+
+        self.async_run_with_timeout(orchestrator.run())
+
+        self.assertEqual(
+            ["time_synchronizer start", "time_synchronizer end", "balances start", "balances end"],
+            self.execution_log)
+
+    def test_failed_step_skips_dependent_steps(self):
+        orchestrator = StartupOrchestrator()
+        orchestrator.add_step("exchange_1", "time_synchronizer", self._step("time_synchronizer", error=True))
+        orchestrator.add_step("exchange_1", "balances", self._step("balances"), dependencies=["time_synchronizer"])
+        orchestrator.add_step("exchange_1", "trading_rules", self._step("trading_rules"))
+
+        self.async_run_with_timeout(orchestrator.run())
+
+        statuses = {step.name: step.status for step in orchestrator.steps}
+        self.assertEqual(StartupStepStatus.FAILED, statuses["time_synchronizer"])
+        self.assertEqual(StartupStepStatus.SKIPPED, statuses["balances"])
+        self.assertEqual(StartupStepStatus.DONE, statuses["trading_rules"])
+        self.assertNotIn("balances start", self.execution_log)
+
+    def test_step_timeout(self):
+        orchestrator = StartupOrchestrator(step_timeout=0.01)
+        orchestrator.add_step("exchange_1", "trading_rules", self._step("trading_rules", delay=1))
+
+        self.async_run_with_timeout(orchestrator.run())
+
+        self.assertEqual(StartupStepStatus.FAILED, orchestrator.steps[0].status)
+        self.assertEqual("timeout", orchestrator.steps[0].error)
+
+    def test_non_critical_steps_timeout(self):
+        orchestrator = StartupOrchestrator(step_timeout=1, non_critical_step_timeout=0.01)
+        orchestrator.add_step("exchange_1", "trading_rules", self._step("trading_rules", delay=0.05))
+        orchestrator.add_step("exchange_1", "trading_fees", self._step("trading_fees", delay=0.05), critical=False)
+
+        self.async_run_with_timeout(orchestrator.run())
+
+        statuses = {step.name: step.status for step in orchestrator.steps}
+        self.assertEqual(StartupStepStatus.DONE, statuses["trading_rules"])
+        self.assertEqual(StartupStepStatus.FAILED, statuses["trading_fees"])
+
+    def test_max_concurrent_steps(self):
+        orchestrator = StartupOrchestrator(max_concurrent_steps=2)
+        for index in range(5):
+            orchestrator.add_step(f"exchange_{index}", "trading_rules", self._step(f"{index} trading_rules"))
+
+        self.async_run_with_timeout(orchestrator.run())
+
+        self.assertEqual(2, self.max_running_steps)
+
+    def test_invalid_dependencies_are_rejected(self):
+        orchestrator = StartupOrchestrator()
+        orchestrator.add_step("exchange_1", "balances", self._step("balances"), dependencies=["time_synchronizer"])
+
+        with self.assertRaises(ValueError):
+            self.async_run_with_timeout(orchestrator.run())
+
+        orchestrator = StartupOrchestrator()
+        orchestrator.add_step("exchange_1", "step_a", self._step("step_a"), dependencies=["step_b"])
+        orchestrator.add_step("exchange_1", "step_b", self._step("step_b"), dependencies=["step_a"])
+
+        with self.assertRaises(ValueError):
+            self.async_run_with_timeout(orchestrator.run())
+
+        with self.assertRaises(ValueError):
+            orchestrator.add_step("exchange_1", "step_a", self._step("step_a"))
+
+    def test_time_to_ready(self):
+        orchestrator = StartupOrchestrator()
+        self.assertIsNone(orchestrator.time_to_ready)
+
+        self.async_run_with_timeout(orchestrator.run())
+        orchestrator.record_ready()
+
+        self.assertGreaterEqual(orchestrator.time_to_ready, orchestrator.duration)
+
+    def test_add_connector_registers_connector_steps(self):
+        connector = BinanceExchange(
+            client_config_map=ClientConfigAdapter(ClientConfigMap()),
+            binance_api_key="testAPIKey",
+            binance_api_secret="testSecret",
+            trading_pairs=["COINALPHA-HBOT"],
+        )
+        orchestrator = StartupOrchestrator()
+
+        orchestrator.add_connector(connector)
+        orchestrator.add_connector(object())
+
+        steps = {step.name: step for step in orchestrator.steps}
+        self.assertEqual({"time_synchronizer", "trading_rules", "trading_fees", "balances"}, set(steps))
+        self.assertTrue(all(step.connector_name == "binance" for step in orchestrator.steps))
+        self.assertEqual(("time_synchronizer",), steps["balances"].dependencies)
+        self.assertFalse(steps["trading_fees"].critical)
+        self.assertTrue(all(steps[name].critical for name in ("time_synchronizer", "trading_rules", "balances")))
+
+    def test_polling_loops_skip_the_first_update_after_the_startup_steps(self):
+        connector = BinanceExchange(
+            client_config_map=ClientConfigAdapter(ClientConfigMap()),
+            binance_api_key="testAPIKey",
+            binance_api_secret="testSecret",
+            trading_pairs=["COINALPHA-HBOT"],
+        )
+        connector._update_time_synchronizer = AsyncMock()
+        connector._update_trading_rules = AsyncMock()
+        connector._update_balances = AsyncMock()
+        # Ends the polling loop after its first iteration
+        connector._sleep = AsyncMock(side_effect=asyncio.CancelledError)
+        orchestrator = StartupOrchestrator()
+        orchestrator.add_connector(connector)
+        self.async_run_with_timeout(orchestrator.run())
+
+        with self.assertRaises(asyncio.CancelledError):
+            self.async_run_with_timeout(connector._trading_rules_polling_loop())
+        self.async_run_with_timeout(connector._update_all_balances())
+
+        connector._update_trading_rules.assert_awaited_once()
+        connector._update_balances.assert_awaited_once()
+
+        with self.assertRaises(asyncio.CancelledError):
+            self.async_run_with_timeout(connector._trading_rules_polling_loop())
+        self.async_run_with_timeout(connector._update_all_balances())
+
+        self.assertEqual(2, connector._update_trading_rules.await_count)
+        self.assertEqual(2, connector._update_balances.await_count)
+
+    def _mock_exchange_with_an_open_order(self, use_balance_ledger: bool) -> MockExchange:
+        connector = MockExchange(
+            client_config_map=ClientConfigAdapter(ClientConfigMap()),
+            trading_pairs=["COINALPHA-HBOT"],
+            use_balance_ledger=use_balance_ledger)
+        connector.exchange_balances = {"HBOT": (Decimal("2000"), Decimal("1900"))}
+        connector.start_tracking_order(
+            order_id="OID1",
+            exchange_order_id="EOID1",
+            trading_pair="COINALPHA-HBOT",
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            price=Decimal("100"),
+            amount=Decimal("1"),
+        )
+        connector._set_current_timestamp(1640780000)
+        return connector
+
+    def test_balances_startup_step_reconciles_the_balance_ledger(self):
+        connector = self._mock_exchange_with_an_open_order(use_balance_ledger=True)
+        orchestrator = StartupOrchestrator()
+        orchestrator.add_connector(connector)
+
+        self.async_run_with_timeout(orchestrator.run())
+
+        self.assertEqual(1, connector.balance_requests_count)
+        self.assertEqual(Decimal("1900"), connector.available_balances["HBOT"])
+        self.assertFalse(connector._balance_ledger.is_reconciliation_required(connector.current_timestamp))
+
+        # The order is done, the ledger releases the amount the exchange locked when the balances were requested
+        connector.stop_tracking_order("OID1")
+
+        self.assertEqual(Decimal("2000"), connector.available_balances["HBOT"])
+
+    def test_balances_startup_step_takes_the_in_flight_orders_snapshot(self):
+        connector = self._mock_exchange_with_an_open_order(use_balance_ledger=False)
+        connector.real_time_balance_update = False
+        orchestrator = StartupOrchestrator()
+        orchestrator.add_connector(connector)
+
+        self.async_run_with_timeout(orchestrator.run())
+
+        self.assertEqual(1, connector.balance_requests_count)
+        self.assertIn("OID1", connector.in_flight_orders_snapshot)
+        self.assertEqual(connector.current_timestamp, connector._in_flight_orders_snapshot_timestamp)
@@ -0,0 +1,72 @@
+import time
+import unittest
+from decimal import Decimal
+
+from hummingbot.connector.trading_rule import TradingRule
+
+
+class TradingRuleTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.trading_rule = TradingRule(
+            trading_pair="COINALPHA-HBOT",
+            min_price_increment=Decimal("0.01"),
+            min_base_amount_increment=Decimal("0.001"),
+        )
+
+    def test_quantize_price_rounds_down_to_price_increment(self):
+        self.assertEqual(Decimal("1.23"), self.trading_rule.quantize_price(Decimal("1.23999")))
+        self.assertEqual(Decimal("-1.23"), self.trading_rule.quantize_price(Decimal("-1.23999")))
+        self.assertTrue(self.trading_rule.quantize_price(Decimal("NaN")).is_nan())
+
+    def test_quantize_amount_rounds_down_to_base_amount_increment(self):
+        self.assertEqual(Decimal("10.123"), self.trading_rule.quantize_amount(Decimal("10.12399")))
+
+    def test_quantize_with_increment_not_power_of_ten(self):
+        trading_rule = TradingRule(
+            trading_pair="COINALPHA-HBOT",
+            min_price_increment=Decimal("0.05"),
+            min_base_amount_increment=Decimal("2.5"),
+        )
+
+        self.assertEqual(Decimal("1.20"), trading_rule.quantize_price(Decimal("1.249")))
+        self.assertEqual(Decimal("7.5"), trading_rule.quantize_amount(Decimal("9.99")))
+
+    def test_quantization_matches_floor_division(self):
+        for price_increment in [Decimal("0.01"), Decimal("0.010"), Decimal("1E+2"), Decimal("0.25")]:
+            trading_rule = TradingRule(trading_pair="COINALPHA-HBOT", min_price_increment=price_increment)
+            for price in [Decimal("0"), Decimal("1.23456"), Decimal("-1.239"), Decimal("123456.789")]:
+                expected = (price // price_increment) * price_increment
+                quantized = trading_rule.quantize_price(price)
+                self.assertEqual(expected, quantized)
+                self.assertEqual(str(expected), str(quantized))
+
+    def test_quantization_table_updates_when_increment_changes(self):
+        self.assertEqual(Decimal("0.01"), self.trading_rule.price_quantum)
+
+        self.trading_rule.min_price_increment = Decimal("0.1")
+
+        self.assertEqual(Decimal("0.1"), self.trading_rule.price_quantum)
+        self.assertEqual(Decimal("1.2"), self.trading_rule.quantize_price(Decimal("1.23999")))
+
+    def test_quantize_many(self):
+        prices, amounts = self.trading_rule.quantize_many(
+            [Decimal("1.234"), Decimal("2.345")],
+            [Decimal("0.12345"), Decimal("1.00001")],
+        )
+
+        self.assertEqual([Decimal("1.23"), Decimal("2.34")], prices)
+        self.assertEqual([Decimal("0.123"), Decimal("1.000")], amounts)
+
+    def test_quantize_many_benchmark_for_one_hundred_levels(self):
+        prices = [Decimal("100") + Decimal("0.0137") * i for i in range(100)]
+        amounts = [Decimal("1") + Decimal("0.00071") * i for i in range(100)]
+
+        best_duration = float("inf")
+        for _ in range(10):
+            start = time.perf_counter()
+            self.trading_rule.quantize_many(prices, amounts)
+            best_duration = min(best_duration, time.perf_counter() - start)
+
+        self.assertLess(best_duration, 0.001)
@@ -724,3 +724,125 @@ class InFlightOrderPyUnitTests(unittest.TestCase):
         self.assertTrue(order.update_with_trade_update(trade_update))
         self.assertIsNone(order.exchange_order_id)
         self.assertFalse(order.exchange_order_id_update_event.is_set())
+
+    def test_in_flight_order_has_no_instance_dict(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id=self.client_order_id,
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+
+        self.assertFalse(hasattr(order, "__dict__"))
+        self.assertIsNone(order._order_fills)
+        self.assertIsNone(order._completely_filled_event)
+        self.assertIsNone(order._processed_by_exchange_event)
+
+    def test_lazy_events_reflect_state_reached_before_creation(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id=self.client_order_id,
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+            exchange_order_id=self.exchange_order_id,
+            initial_state=OrderState.OPEN,
+        )
+        order.executed_amount_base = order.amount
+        order.check_filled_condition()
+
+        self.assertTrue(order.exchange_order_id_update_event.is_set())
+        self.assertTrue(order.processed_by_exchange_event.is_set())
+        self.assertTrue(order.completely_filled_event.is_set())
+
+    def test_copy_on_write_snapshot_keeps_state_previous_to_updates(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id=self.client_order_id,
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+            exchange_order_id=self.exchange_order_id,
+            initial_state=OrderState.OPEN,
+        )
+        orders = {order.client_order_id: order}
+
+        snapshot = InFlightOrder.copy_on_write_snapshot(orders)
+
+        self.assertIs(order, snapshot[order.client_order_id])
+
+        trade_update: TradeUpdate = TradeUpdate(
+            trade_id="someTradeId",
+            client_order_id=self.client_order_id,
+            exchange_order_id=self.exchange_order_id,
+            trading_pair=self.trading_pair,
+            fill_price=Decimal("1.0"),
+            fill_base_amount=Decimal("500.0"),
+            fill_quote_amount=Decimal("500.0"),
+            fee=AddedToCostTradeFee(
+                flat_fees=[TokenAmount(token=self.quote_asset, amount=self.trade_fee_percent * Decimal("500.0"))]),
+            fill_timestamp=1,
+        )
+        order.update_with_trade_update(trade_update)
+
+        snapshot_order = snapshot[order.client_order_id]
+        self.assertIsNot(order, snapshot_order)
+        self.assertEqual(Decimal("0"), snapshot_order.executed_amount_base)
+        self.assertEqual(Decimal("500"), order.executed_amount_base)
+        self.assertIs(order, orders[order.client_order_id])
+
+    def test_to_limit_order_is_cached_until_the_order_changes(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id=self.client_order_id,
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+            exchange_order_id=self.exchange_order_id,
+            initial_state=OrderState.OPEN,
+        )
+
+        limit_order = order.to_limit_order()
+        self.assertIs(limit_order, order.to_limit_order())
+
+        trade_update: TradeUpdate = TradeUpdate(
+            trade_id="someTradeId",
+            client_order_id=self.client_order_id,
+            exchange_order_id=self.exchange_order_id,
+            trading_pair=self.trading_pair,
+            fill_price=Decimal("1.0"),
+            fill_base_amount=Decimal("500.0"),
+            fill_quote_amount=Decimal("500.0"),
+            fee=AddedToCostTradeFee(
+                flat_fees=[TokenAmount(token=self.quote_asset, amount=self.trade_fee_percent * Decimal("500.0"))]),
+            fill_timestamp=1,
+        )
+        order.update_with_trade_update(trade_update)
+
+        filled_limit_order = order.to_limit_order()
+        self.assertIsNot(limit_order, filled_limit_order)
+        self.assertEqual(Decimal("500"), filled_limit_order.filled_quantity)
+        self.assertIs(filled_limit_order, order.to_limit_order())
+
+        order.price = Decimal("1.1")
+
+        self.assertEqual(Decimal("1.1"), order.to_limit_order().price)
+
+        order.update_with_order_update(OrderUpdate(
+            trading_pair=self.trading_pair,
+            update_timestamp=2,
+            new_state=OrderState.CANCELED,
+            client_order_id=self.client_order_id,
+        ))
+        canceled_limit_order = order.to_limit_order()
+
+        self.assertIsNot(filled_limit_order, canceled_limit_order)
@@ -7,7 +7,39 @@ from hummingbot.core.clock import (
     Clock,
     ClockMode
 )
+from hummingbot.core.py_time_iterator import PyTimeIterator
 from hummingbot.core.time_iterator import TimeIterator
+from hummingbot.core.utils.clock_instrumentation import ClockInstrumentation
+
+
+class TickRecorder(PyTimeIterator):
+
+    def __init__(self, name: str, ticks_log: list, on_tick=None):
+        super().__init__()
+        self._name = name
+        self._ticks_log = ticks_log
+        self._on_tick = on_tick
+
+    def tick(self, timestamp: float):
+        self._ticks_log.append((timestamp, self._name))
+        if self._on_tick is not None:
+            self._on_tick(timestamp)
+
+
+class ReplayDataSource(TickRecorder):
+
+    def __init__(self, name: str, ticks_log: list, event_timestamps: list):
+        super().__init__(name, ticks_log)
+        self._pending_events = list(event_timestamps)
+        self.processed_events = []
+
+    def next_event_timestamp(self) -> float:
+        return self._pending_events[0] if len(self._pending_events) > 0 else float("nan")
+
+    def tick(self, timestamp: float):
+        super().tick(timestamp)
+        while len(self._pending_events) > 0 and self._pending_events[0] <= timestamp:
+            self.processed_events.append((timestamp, self._pending_events.pop(0)))
 
 
 class ClockUnitTest(unittest.TestCase):
@@ -124,3 +156,180 @@ class ClockUnitTest(unittest.TestCase):
         self.clock_backtest.backtest_til(self.backtest_start_timestamp + self.tick_size)
         self.assertGreater(self.clock_backtest.current_timestamp, self.clock_backtest.start_time)
         self.assertLess(self.clock_backtest.current_timestamp, self.backtest_end_timestamp)
+
+    def test_backtest_ticks_iterators_at_their_own_period_and_phase(self):
+        ticks_log = []
+        clock = Clock(ClockMode.BACKTEST, 0.5, self.backtest_start_timestamp, self.backtest_end_timestamp)
+        fast_iterator = TickRecorder("fast", ticks_log)
+        slow_iterator = TickRecorder("slow", ticks_log)
+        slow_iterator.set_tick_period(2.0, phase=1.0)
+        clock.add_iterator(slow_iterator)
+        clock.add_iterator(fast_iterator)
+
+        clock.backtest_til(self.backtest_start_timestamp + 5)
+
+        start = self.backtest_start_timestamp
+        self.assertEqual([start + 0.5 * index for index in range(1, 11)],
+                         [timestamp for timestamp, name in ticks_log if name == "fast"])
+        self.assertEqual([start + 1, start + 3, start + 5],
+                         [timestamp for timestamp, name in ticks_log if name == "slow"])
+        # Iterators due on the same tick are ticked in the order they were added
+        self.assertEqual([(start + 1, "slow"), (start + 1, "fast")],
+                         [entry for entry in ticks_log if entry[0] == start + 1])
+        self.assertEqual(start + 7, clock.next_tick_time(slow_iterator))
+
+    def test_tick_period_is_rounded_to_the_tick_size(self):
+        ticks_log = []
+        iterator = TickRecorder("iterator", ticks_log)
+        iterator.set_tick_period(2.4)
+        self.clock_backtest.add_iterator(iterator)
+
+        self.clock_backtest.backtest_til(self.backtest_start_timestamp + 6)
+
+        start = self.backtest_start_timestamp
+        self.assertEqual([start + 2, start + 4, start + 6], [timestamp for timestamp, _ in ticks_log])
+
+    def test_removed_iterator_is_not_ticked(self):
+        ticks_log = []
+        first_iterator = TickRecorder("first", ticks_log)
+        second_iterator = TickRecorder("second", ticks_log)
+        self.clock_backtest.add_iterator(first_iterator)
+        self.clock_backtest.add_iterator(second_iterator)
+
+        self.clock_backtest.backtest_til(self.backtest_start_timestamp + 1)
+        self.clock_backtest.remove_iterator(first_iterator)
+        self.clock_backtest.backtest_til(self.backtest_start_timestamp + 2)
+
+        start = self.backtest_start_timestamp
+        self.assertEqual([(start + 1, "first"), (start + 1, "second"), (start + 2, "second")], ticks_log)
+        self.assertTrue(self.clock_backtest.next_tick_time(first_iterator) != self.clock_backtest.next_tick_time(
+            first_iterator))
+
+    def test_backtest_out_of_band_tick_request(self):
+        ticks_log = []
+        strategy = TickRecorder("strategy", ticks_log)
+        strategy.set_tick_period(10)
+        connector = TickRecorder(
+            "connector",
+            ticks_log,
+            on_tick=lambda timestamp: strategy.request_tick() if timestamp == self.backtest_start_timestamp + 3 else None)
+        self.clock_backtest.add_iterator(connector)
+        self.clock_backtest.add_iterator(strategy)
+
+        self.clock_backtest.backtest_til(self.backtest_start_timestamp + 10)
+
+        start = self.backtest_start_timestamp
+        self.assertEqual([start + 3, start + 10], [timestamp for timestamp, name in ticks_log if name == "strategy"])
+
+    def test_realtime_out_of_band_tick_request_wakes_up_the_clock(self):
+        ticks_log = []
+        clock = Clock(ClockMode.REALTIME, 1.0)
+        strategy = TickRecorder("strategy", ticks_log)
+        strategy.set_tick_period(60)
+        clock.add_iterator(strategy)
+
+        request_times = []
+
+        async def request_tick():
+            await asyncio.sleep(0.1)
+            request_times.append(time.time())
+            strategy.request_tick()
+
+        with clock:
+            self.ev_loop.run_until_complete(asyncio.gather(clock.run_til(time.time() + 0.3), request_tick()))
+
+        # The strategy can also have a regular tick if the test runs across a minute boundary
+        out_of_band_ticks = [timestamp for timestamp, _ in ticks_log if timestamp % 60 != 0]
+        self.assertEqual(1, len(out_of_band_ticks))
+        self.assertAlmostEqual(request_times[0], out_of_band_ticks[0], delta=0.05)
+
+    def test_instrumentation_records_the_tick_durations(self):
+        ticks_log = []
+        instrumentation = ClockInstrumentation()
+        iterator = TickRecorder("iterator", ticks_log)
+        self.clock_backtest.add_iterator(iterator)
+
+        self.clock_backtest.backtest_til(self.backtest_start_timestamp + 3)
+        self.clock_backtest.set_instrumentation(instrumentation)
+        self.clock_backtest.backtest_til(self.backtest_start_timestamp + 5)
+        self.clock_backtest.set_instrumentation(None)
+        self.clock_backtest.backtest_til(self.backtest_start_timestamp + 6)
+
+        self.assertEqual(6, len(ticks_log))
+        self.assertEqual(2, instrumentation.iterator_stats["TickRecorder"].tick_duration.count)
+        self.assertEqual(0, instrumentation.tick_lateness.count)
+
+    def test_instrumentation_records_the_late_and_missed_ticks(self):
+        instrumentation = ClockInstrumentation()
+        clock = Clock(ClockMode.REALTIME, 0.05)
+        clock.set_instrumentation(instrumentation)
+        slow_iterator = TickRecorder("slow", [], on_tick=lambda timestamp: time.sleep(0.12))
+        clock.add_iterator(slow_iterator)
+
+        with clock:
+            self.ev_loop.run_until_complete(clock.run_til(time.time() + 0.5))
+
+        stats = instrumentation.iterator_stats["TickRecorder"]
+        self.assertGreater(stats.tick_duration.count, 1)
+        self.assertGreaterEqual(stats.tick_duration.percentile(50), 100)
+        self.assertGreater(stats.missed_ticks, 0)
+        self.assertGreater(instrumentation.tick_lateness.max, 50)
+
+    def test_event_driven_mode_is_only_available_in_backtest(self):
+        with self.assertRaises(ValueError):
+            Clock(ClockMode.REALTIME, self.tick_size, event_driven=True)
+
+    def test_event_driven_backtest_jumps_to_the_next_event(self):
+        ticks_log = []
+        start = self.backtest_start_timestamp
+        clock = Clock(ClockMode.BACKTEST, 1.0, start, self.backtest_end_timestamp, event_driven=True)
+        data_source = ReplayDataSource("data", ticks_log, [start + 10, start + 10.5, start + 600])
+        strategy = TickRecorder("strategy", ticks_log)
+        refresh_timer = TickRecorder("timer", ticks_log)
+        refresh_timer.set_tick_period(300)
+        clock.add_iterator(data_source)
+        clock.add_iterator(strategy)
+        clock.add_iterator(refresh_timer)
+
+        clock.backtest()
+
+        # Events between two ticks are processed on the following tick
+        self.assertEqual([(start + 10, start + 10), (start + 11, start + 10.5), (start + 600, start + 600)],
+                         data_source.processed_events)
+        timer_timestamps = [start + 300 * index for index in range(1, 13)]
+        self.assertEqual(timer_timestamps, [timestamp for timestamp, name in ticks_log if name == "timer"])
+        self.assertEqual([start + 10, start + 11] + timer_timestamps,
+                         [timestamp for timestamp, name in ticks_log if name == "strategy"])
+        # Iterators due on the same step are ticked in the order they were added
+        self.assertEqual([(start + 600, "data"), (start + 600, "strategy"), (start + 600, "timer")],
+                         [entry for entry in ticks_log if entry[0] == start + 600])
+        self.assertEqual(self.backtest_end_timestamp, clock.current_timestamp)
+        self.assertEqual(14 + 14 + 12, len(ticks_log))
+
+    def test_event_driven_backtest_til_end_of_data(self):
+        ticks_log = []
+        start = self.backtest_start_timestamp
+        clock = Clock(ClockMode.BACKTEST, 1.0, start, float("nan"), event_driven=True)
+        data_source = ReplayDataSource("data", ticks_log, [start + 5, start + 7])
+        clock.add_iterator(data_source)
+
+        clock.backtest()
+
+        self.assertEqual([(start + 5, "data"), (start + 7, "data")], ticks_log)
+        self.assertEqual(start + 7, clock.current_timestamp)
+
+    def test_event_driven_backtest_out_of_band_tick_request(self):
+        ticks_log = []
+        start = self.backtest_start_timestamp
+        clock = Clock(ClockMode.BACKTEST, 1.0, start, start + 100, event_driven=True)
+        strategy = TickRecorder("strategy", ticks_log)
+        strategy.set_tick_period(60)
+        data_source = ReplayDataSource("data", ticks_log, [start + 20])
+        data_source._on_tick = lambda timestamp: strategy.request_tick()
+        clock.add_iterator(data_source)
+        clock.add_iterator(strategy)
+
+        clock.backtest_til(start + 30)
+
+        self.assertEqual([(start + 20, "data"), (start + 20, "strategy")], ticks_log)
+        self.assertEqual(start + 30, clock.current_timestamp)
@@ -1,8 +1,10 @@
 import unittest
 import gc
+import time
 import weakref
 
 from hummingbot.core.pubsub import PubSub
+from hummingbot.core.event.event_forwarder import EventForwarder
 from hummingbot.core.event.event_logger import EventLogger
 
 from test.mock.mock_events import MockEventType, MockEvent
@@ -89,6 +91,54 @@ class PubSubTest(unittest.TestCase):
         listeners = self.pubsub.get_listeners(self.event_tag_zero)
         self.assertEqual(0, len(listeners))
 
+    def test_lapsed_listener_is_not_called_on_trigger_event(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_one)
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.listener_zero = None  # remove strong reference
+        gc.collect()
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+
+        self.assertEqual(2, len(self.listener_one.event_log))
+        self.assertEqual([self.listener_one], self.pubsub.get_listeners(self.event_tag_zero))
+
+    def test_listeners_changed_while_triggering_event(self):
+        def remove_listener_one(_):
+            self.pubsub.remove_listener(self.event_tag_zero, self.listener_one)
+            self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+
+        forwarder = EventForwarder(remove_listener_one)
+        self.pubsub.add_listener(self.event_tag_zero, forwarder)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_one)
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+
+        # The listeners set when the event is triggered receive it, the changes apply to the next events
+        self.assertEqual(1, len(self.listener_one.event_log))
+        self.assertEqual(1, len(self.listener_zero.event_log))
+
+    def test_trigger_event_benchmark(self):
+        listeners = [EventForwarder(lambda _: None) for _ in range(500)]
+        for listener in listeners:
+            self.pubsub.add_listener(self.event_tag_zero, listener)
+
+        def dispatch_time(invalidate_snapshot: bool) -> float:
+            best_time = float("inf")
+            for _ in range(5):
+                start = time.perf_counter()
+                for _ in range(20):
+                    if invalidate_snapshot:
+                        # Adding a registered listener again invalidates the listeners snapshot, so the trigger
+                        # walks the whole listeners collection (like when the snapshot was not cached)
+                        self.pubsub.add_listener(self.event_tag_zero, listeners[0])
+                    self.pubsub.trigger_event(self.event_tag_zero, self.event)
+                best_time = min(best_time, time.perf_counter() - start)
+            return best_time
+
+        self.assertLess(dispatch_time(invalidate_snapshot=False), dispatch_time(invalidate_snapshot=True))
+
 
 if __name__ == "__main__":
     unittest.main()
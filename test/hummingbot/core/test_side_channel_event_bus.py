@@ -0,0 +1,99 @@
+import asyncio
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from test.logger_mixin_for_test import LoggerMixinForTest
+from test.mock.mock_events import MockEvent, MockEventType
+
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.side_channel_event_bus import SideChannelEventBus, SideChannelEventForwarder
+from hummingbot.core.pubsub import PubSub
+
+
+class SideChannelEventBusTests(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.pubsub = PubSub()
+        self.event_bus = SideChannelEventBus(max_queue_size=5, batch_size=2)
+        self.set_loggers([self.event_bus.logger()])
+        self.received_events = []
+        self.forwarder = SideChannelEventForwarder(
+            self._process_event, name="recorder", event_bus=self.event_bus)
+        self.pubsub.add_listener(MockEventType.EVENT_ZERO, self.forwarder)
+
+    def tearDown(self) -> None:
+        self.event_bus.stop()
+        super().tearDown()
+
+    def _process_event(self, event_tag: int, caller: PubSub, event: MockEvent):
+        self.received_events.append((event_tag, caller, event))
+
+    def test_events_are_delivered_synchronously_when_the_bus_is_not_started(self):
+        self.pubsub.trigger_event(MockEventType.EVENT_ZERO, MockEvent(payload=1))
+
+        self.assertEqual([(MockEventType.EVENT_ZERO.value, self.pubsub, MockEvent(payload=1))], self.received_events)
+
+    async def test_events_are_delivered_asynchronously_in_order(self):
+        self.event_bus.start()
+        trading_listener = EventLogger()
+        self.pubsub.add_listener(MockEventType.EVENT_ZERO, trading_listener)
+
+        for payload in range(4):
+            self.pubsub.trigger_event(MockEventType.EVENT_ZERO, MockEvent(payload=payload))
+
+        # The trading listeners receive the events in the trigger call, the side channel consumers later
+        self.assertEqual(4, len(trading_listener.event_log))
+        self.assertEqual([], self.received_events)
+        self.assertEqual(4, self.event_bus.queue_length)
+
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        self.assertEqual([MockEvent(payload=payload) for payload in range(4)],
+                         [event for _, _, event in self.received_events])
+        self.assertEqual(0, self.event_bus.queue_length)
+        self.assertEqual(4, self.event_bus.delivered_events_count)
+        self.assertEqual(4, self.event_bus.max_queue_length)
+
+    async def test_full_queue_applies_backpressure_keeping_the_events_order(self):
+        self.event_bus.start()
+
+        for payload in range(6):
+            self.pubsub.trigger_event(MockEventType.EVENT_ZERO, MockEvent(payload=payload))
+
+        self.assertEqual([MockEvent(payload=payload) for payload in range(6)],
+                         [event for _, _, event in self.received_events])
+        self.assertEqual(1, self.event_bus.backpressure_flushes_count)
+        self.assertEqual(0, self.event_bus.queue_length)
+
+    async def test_full_queue_drops_the_events_of_consumers_accepting_losses(self):
+        self.event_bus.start()
+        dropped_events = []
+        forwarder = SideChannelEventForwarder(
+            lambda event_tag, caller, event: dropped_events.append(event),
+            name="notifier",
+            drop_on_overflow=True,
+            event_bus=self.event_bus)
+        self.pubsub.add_listener(MockEventType.EVENT_ONE, forwarder)
+
+        for payload in range(5):
+            self.pubsub.trigger_event(MockEventType.EVENT_ZERO, MockEvent(payload=payload))
+        self.pubsub.trigger_event(MockEventType.EVENT_ONE, MockEvent(payload=5))
+
+        self.assertEqual({"notifier": 1}, self.event_bus.dropped_events_count)
+        self.assertTrue(self.is_logged("WARNING", "The side channel event queue is full (5 events). "
+                                                  "Dropped events so far: {'notifier': 1}."))
+        self.event_bus.stop()
+        self.assertEqual(5, len(self.received_events))
+        self.assertEqual([], dropped_events)
+
+    def test_consumer_errors_are_logged(self):
+        forwarder = SideChannelEventForwarder(self._failing_consumer, name="failing", event_bus=self.event_bus)
+        self.pubsub.add_listener(MockEventType.EVENT_ONE, forwarder)
+
+        self.pubsub.trigger_event(MockEventType.EVENT_ONE, MockEvent(payload=1))
+
+        self.assertTrue(self.is_logged(
+            "ERROR", f"Unexpected error while delivering event {MockEventType.EVENT_ONE.value} to failing."))
+
+    def _failing_consumer(self, event_tag: int, caller: PubSub, event: MockEvent):
+        raise ValueError("Consumer error")
@@ -0,0 +1,94 @@
+from test.logger_mixin_for_test import LoggerMixinForTest
+from unittest import TestCase
+
+from hummingbot.core.py_time_iterator import PyTimeIterator
+from hummingbot.core.utils.clock_instrumentation import ClockInstrumentation
+
+
+class NamedIterator(PyTimeIterator):
+
+    def __init__(self, name: str):
+        super().__init__()
+        self.name = name
+
+
+class ClockInstrumentationTest(TestCase, LoggerMixinForTest):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.instrumentation = ClockInstrumentation(tick_duration_warning_threshold_ms=10,
+                                                    tick_lateness_warning_threshold_ms=50)
+        self.set_loggers([self.instrumentation.logger()])
+
+    def test_tick_durations_are_recorded_by_iterator(self):
+        connector = NamedIterator("binance")
+        strategy = PyTimeIterator()
+
+        self.instrumentation.record_tick_duration(connector, 1)
+        self.instrumentation.record_tick_duration(connector, 3)
+        self.instrumentation.record_tick_duration(strategy, 2)
+
+        stats = self.instrumentation.iterator_stats
+        self.assertEqual({"binance", "PyTimeIterator"}, set(stats))
+        self.assertEqual(2, stats["binance"].tick_duration.count)
+        self.assertEqual(3, stats["binance"].tick_duration.max)
+        self.assertEqual(1, stats["PyTimeIterator"].tick_duration.count)
+        self.assertTrue(self.instrumentation.has_samples)
+        self.assertEqual(0, len(self.log_records))
+
+    def test_iterators_with_the_same_name_are_recorded_separately(self):
+        first_connector = NamedIterator("binance")
+        second_connector = NamedIterator("binance")
+
+        self.instrumentation.record_tick_duration(first_connector, 1)
+        self.instrumentation.record_tick_duration(second_connector, 2)
+        self.instrumentation.record_tick_duration(second_connector, 3)
+        self.instrumentation.record_missed_ticks(second_connector, 1)
+
+        stats = self.instrumentation.iterator_stats
+        self.assertEqual({"binance", "binance#2"}, set(stats))
+        self.assertEqual(1, stats["binance"].tick_duration.count)
+        self.assertEqual(2, stats["binance#2"].tick_duration.count)
+        report = self.instrumentation.report()
+        self.assertEqual(0, report["iterators"]["binance"]["missed_ticks"])
+        self.assertEqual(1, report["iterators"]["binance#2"]["missed_ticks"])
+
+    def test_slow_tick_logs_a_rate_limited_warning(self):
+        connector = NamedIterator("binance")
+
+        self.instrumentation.record_tick_duration(connector, 25)
+        self.instrumentation.record_tick_duration(connector, 30)
+
+        self.assertTrue(self.is_logged(
+            "WARNING", "The clock tick of binance took 25.0 ms (warning threshold: 10 ms)."))
+        self.assertEqual(1, len(self.log_records))
+
+    def test_late_tick_logs_a_warning_with_the_missed_ticks(self):
+        connector = NamedIterator("binance")
+        self.instrumentation.record_missed_ticks(connector, 3)
+
+        self.instrumentation.record_tick_lateness(20)
+        self.instrumentation.record_tick_lateness(120)
+
+        self.assertEqual(2, self.instrumentation.tick_lateness.count)
+        self.assertEqual(3, self.instrumentation.iterator_stats["binance"].missed_ticks)
+        self.assertTrue(self.is_logged(
+            "WARNING",
+            "The clock tick started 120.0 ms late (warning threshold: 50 ms). Missed ticks so far: {'binance': 3}."))
+
+    def test_report_and_reset(self):
+        connector = NamedIterator("binance")
+        self.instrumentation.record_tick_duration(connector, 1)
+        self.instrumentation.record_missed_ticks(connector, 2)
+        self.instrumentation.record_tick_lateness(5)
+
+        report = self.instrumentation.report()
+
+        self.assertEqual(1, report["tick_lateness"]["count"])
+        self.assertEqual(1, report["iterators"]["binance"]["tick_duration"]["count"])
+        self.assertEqual(2, report["iterators"]["binance"]["missed_ticks"])
+
+        self.instrumentation.reset()
+
+        self.assertFalse(self.instrumentation.has_samples)
+        self.assertEqual(0, self.instrumentation.iterator_stats["binance"].missed_ticks)
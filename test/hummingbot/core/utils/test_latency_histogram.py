@@ -0,0 +1,41 @@
+from unittest import TestCase
+
+from hummingbot.core.utils.latency_histogram import LatencyHistogram
+
+
+class LatencyHistogramTest(TestCase):
+
+    def test_add_updates_statistics(self):
+        histogram = LatencyHistogram()
+        for value in [0.05, 1.5, 3, 20_000]:
+            histogram.add(value)
+
+        self.assertEqual(4, histogram.count)
+        self.assertEqual(20_000, histogram.max)
+        self.assertAlmostEqual((0.05 + 1.5 + 3 + 20_000) / 4, histogram.mean)
+        self.assertEqual(1, histogram.to_json()["overflow"])
+
+    def test_percentile_returns_bucket_upper_bound(self):
+        histogram = LatencyHistogram(bucket_bounds_ms=(1, 10, 100))
+        for _ in range(90):
+            histogram.add(0.5)
+        for _ in range(10):
+            histogram.add(50)
+
+        self.assertEqual(1, histogram.percentile(50))
+        self.assertEqual(1, histogram.percentile(90))
+        self.assertEqual(50, histogram.percentile(99))
+
+    def test_percentile_of_overflow_bucket_is_max_value(self):
+        histogram = LatencyHistogram(bucket_bounds_ms=(1,))
+        histogram.add(7)
+
+        self.assertEqual(7, histogram.percentile(99))
+
+    def test_reset(self):
+        histogram = LatencyHistogram()
+        histogram.add(3)
+        histogram.reset()
+
+        self.assertEqual(0, histogram.count)
+        self.assertEqual(0, histogram.percentile(50))
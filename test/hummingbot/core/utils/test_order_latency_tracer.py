@@ -0,0 +1,124 @@
+import asyncio
+from decimal import Decimal
+from test.mock.mock_exchange import MockExchange
+from unittest import TestCase
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.in_flight_order import InFlightOrder
+from hummingbot.core.utils.order_latency_tracer import (
+    EXCHANGE_CONFIRMATION,
+    REQUEST_SENT,
+    RESPONSE_RECEIVED,
+    THROTTLER_ACQUIRED,
+    TOTAL,
+    TRACKING_START,
+    OrderLatencyTracer,
+)
+
+
+class OrderLatencyTracerTest(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        OrderLatencyTracer.enable()
+        self.tracer = OrderLatencyTracer.for_connector("test_connector")
+        self.tracer.reset()
+
+    def tearDown(self) -> None:
+        OrderLatencyTracer.disable()
+        OrderLatencyTracer.reset_all()
+        super().tearDown()
+
+    def _order(self) -> InFlightOrder:
+        return InFlightOrder(
+            client_order_id="OID1",
+            trading_pair="COINALPHA-HBOT",
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1"),
+            price=Decimal("10"),
+            creation_timestamp=1640001112.0,
+        )
+
+    def test_for_connector_returns_same_tracer(self):
+        self.assertIs(self.tracer, OrderLatencyTracer.for_connector("test_connector"))
+
+    def test_full_trace_records_all_stages(self):
+        order = self._order()
+        self.tracer.record_decision(order.client_order_id)
+        self.tracer.start_trace(order)
+
+        trace = order.latency_trace
+        for stage in (THROTTLER_ACQUIRED, REQUEST_SENT, RESPONSE_RECEIVED, EXCHANGE_CONFIRMATION):
+            trace.stamp(stage)
+
+        self.assertIsNotNone(trace.decision)
+        for stage in (TRACKING_START, THROTTLER_ACQUIRED, REQUEST_SENT, RESPONSE_RECEIVED, EXCHANGE_CONFIRMATION, TOTAL):
+            self.assertEqual(1, self.tracer.histograms[stage].count)
+        self.assertIn("test_connector", OrderLatencyTracer.report_all())
+
+    def test_stages_are_only_stamped_once(self):
+        order = self._order()
+        self.tracer.start_trace(order)
+        order.latency_trace.stamp(REQUEST_SENT)
+        first_timestamp = order.latency_trace.request_sent
+        order.latency_trace.stamp(REQUEST_SENT)
+
+        self.assertEqual(first_timestamp, order.latency_trace.request_sent)
+        self.assertEqual(1, self.tracer.histograms[REQUEST_SENT].count)
+
+    def test_stamp_current_uses_trace_of_current_task(self):
+        order = self._order()
+        self.tracer.start_trace(order)
+
+        async def place_order():
+            OrderLatencyTracer.set_current_trace(order.latency_trace)
+            OrderLatencyTracer.stamp_current(REQUEST_SENT)
+
+        async def other_request():
+            OrderLatencyTracer.stamp_current(THROTTLER_ACQUIRED)
+
+        asyncio.get_event_loop().run_until_complete(asyncio.gather(place_order(), other_request()))
+
+        self.assertIsNotNone(order.latency_trace.request_sent)
+        self.assertIsNone(order.latency_trace.throttler_acquired)
+        self.assertIsNone(OrderLatencyTracer.current_trace())
+
+    def test_stamp_current_does_nothing_when_disabled(self):
+        order = self._order()
+        self.tracer.start_trace(order)
+        OrderLatencyTracer.disable()
+
+        token = OrderLatencyTracer.set_current_trace(order.latency_trace)
+        OrderLatencyTracer.stamp_current(REQUEST_SENT)
+        OrderLatencyTracer.reset_current_trace(token)
+
+        self.assertIsNone(order.latency_trace.request_sent)
+
+    def test_order_decision_is_discarded_if_the_order_creation_fails_before_tracking_the_order(self):
+        exchange = MockExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        tracer = exchange.latency_tracer
+
+        # There are no trading rules for the trading pair, so the order is not tracked
+        order_id = exchange.buy(
+            trading_pair="COINALPHA-HBOT", amount=Decimal("1"), order_type=OrderType.LIMIT, price=Decimal("10"))
+        asyncio.get_event_loop().run_until_complete(asyncio.sleep(0.01))
+
+        self.assertNotIn(order_id, exchange.in_flight_orders)
+
+        # An order tracked later with the same id does not get the discarded decision
+        order = InFlightOrder(
+            client_order_id=order_id,
+            trading_pair="COINALPHA-HBOT",
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1"),
+            price=Decimal("10"),
+            creation_timestamp=1640001112.0,
+        )
+        tracer.start_trace(order)
+
+        self.assertIsNone(order.latency_trace.decision)
+        self.assertEqual(0, tracer.histograms[TRACKING_START].count)
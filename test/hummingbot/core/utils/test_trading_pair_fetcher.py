@@ -9,6 +9,7 @@ from aioresponses import aioresponses
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.client.config.config_validators import validate_market_trading_pair
 from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.client.config.security import Security
 from hummingbot.client.settings import ConnectorSetting, ConnectorType
@@ -86,6 +87,87 @@ class TestTradingPairFetcher(unittest.TestCase):
         instance = TradingPairFetcher.get_instance()
         self.assertIs(instance, TradingPairFetcher.get_instance())
 
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._sf_shared_instance")
+    def test_trading_pairs_are_fetched_only_for_requested_connectors(self, _, mock_connector_settings):
+        connector = AsyncMock()
+        connector.all_trading_pairs.return_value = ["MOCK-HBOT"]
+        other_connector = AsyncMock()
+        mock_connector_settings.return_value = {
+            "mock_exchange_1": self.MockConnectorSetting(name="mock_exchange_1", connector=connector),
+            "mock_exchange_2": self.MockConnectorSetting(name="mock_exchange_2", connector=other_connector),
+        }
+
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.fetch_pairs_from_all_exchanges = True
+        trading_pair_fetcher = TradingPairFetcher(client_config_map)
+        self.async_run_with_timeout(asyncio.sleep(0))
+
+        self.assertTrue(trading_pair_fetcher.ready)
+        self.assertEqual({}, trading_pair_fetcher.trading_pairs)
+
+        trading_pair_fetcher.request_trading_pairs("mock_exchange_1")
+        trading_pair_fetcher.request_trading_pairs("mock_exchange_1")
+        self.async_run_with_timeout(trading_pair_fetcher._fetch_tasks["mock_exchange_1"])
+
+        self.assertEqual({"mock_exchange_1": ["MOCK-HBOT"]}, trading_pair_fetcher.trading_pairs)
+        connector.all_trading_pairs.assert_called_once()
+        other_connector.all_trading_pairs.assert_not_called()
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    def test_trading_pairs_are_validated_once_fetched_for_the_market(self, mock_connector_settings):
+        connector = AsyncMock()
+        connector.all_trading_pairs.return_value = ["MOCK-HBOT"]
+        mock_connector_settings.return_value = {
+            "mock_exchange_1": self.MockConnectorSetting(name="mock_exchange_1", connector=connector),
+        }
+        trading_pair_fetcher = TradingPairFetcher(ClientConfigAdapter(ClientConfigMap()))
+
+        with patch.object(TradingPairFetcher, "_sf_shared_instance", trading_pair_fetcher):
+            # The user is not blocked while the trading pairs are being fetched
+            self.assertIsNone(validate_market_trading_pair("mock_exchange_1", "BTC-USDT"))
+            self.assertFalse(trading_pair_fetcher.is_ready("mock_exchange_1"))
+            self.assertFalse(trading_pair_fetcher.ready)
+
+            self.async_run_with_timeout(trading_pair_fetcher._fetch_tasks["mock_exchange_1"])
+
+            self.assertTrue(trading_pair_fetcher.is_ready("mock_exchange_1"))
+            self.assertTrue(trading_pair_fetcher.ready)
+            self.assertIsNone(validate_market_trading_pair("mock_exchange_1", "MOCK-HBOT"))
+            self.assertEqual("BTC-USDT is not an active market on mock_exchange_1.",
+                             validate_market_trading_pair("mock_exchange_1", "BTC-USDT"))
+        connector.all_trading_pairs.assert_called_once()
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    def test_not_connected_exchanges_are_ready_without_fetching_trading_pairs(self, mock_connector_settings):
+        connector = AsyncMock()
+        connector_setting = self.MockConnectorSetting(name="mock_exchange_1", connector=connector)
+        connector_setting.connector_connected = MagicMock(return_value=False)
+        mock_connector_settings.return_value = {"mock_exchange_1": connector_setting}
+        trading_pair_fetcher = TradingPairFetcher(ClientConfigAdapter(ClientConfigMap()))
+
+        with patch.object(TradingPairFetcher, "_sf_shared_instance", trading_pair_fetcher):
+            self.assertIsNone(validate_market_trading_pair("mock_exchange_1", "MOCK-HBOT"))
+
+        self.assertTrue(trading_pair_fetcher.is_ready("mock_exchange_1"))
+        self.assertEqual({}, trading_pair_fetcher.trading_pairs)
+        connector.all_trading_pairs.assert_not_called()
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._sf_shared_instance")
+    def test_paper_trade_trading_pairs_are_fetched_from_parent_connector(self, _, mock_connector_settings):
+        connector = AsyncMock()
+        connector.all_trading_pairs.return_value = ["MOCK-HBOT"]
+        mock_connector_settings.return_value = {
+            "mock_exchange_1": self.MockConnectorSetting(name="mock_exchange_1", connector=connector),
+            "mock_paper_trade": self.MockConnectorSetting(name="mock_paper_trade", parent_name="mock_exchange_1")
+        }
+
+        trading_pair_fetcher = TradingPairFetcher(ClientConfigAdapter(ClientConfigMap()))
+        self.async_run_with_timeout(trading_pair_fetcher.fetch_trading_pairs("mock_paper_trade"))
+
+        self.assertEqual({"mock_paper_trade": ["MOCK-HBOT"]}, trading_pair_fetcher.trading_pairs)
+
     @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
     @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._sf_shared_instance")
     def test_fetched_connector_trading_pairs(self, _, mock_connector_settings):
@@ -100,6 +182,7 @@ class TestTradingPairFetcher(unittest.TestCase):
         client_config_map.fetch_pairs_from_all_exchanges = True
         trading_pair_fetcher = TradingPairFetcher(client_config_map)
         self.async_run_with_timeout(self.wait_until_trading_pair_fetcher_ready(trading_pair_fetcher), 1.0)
+        self.async_run_with_timeout(trading_pair_fetcher.fetch_all(client_config_map))
         trading_pairs = trading_pair_fetcher.trading_pairs
         self.assertEqual(2, len(trading_pairs))
         self.assertEqual({"mockConnector": ["MOCK-HBOT"], "mock_paper_trade": ["MOCK-HBOT"]}, trading_pairs)
@@ -121,6 +204,7 @@ class TestTradingPairFetcher(unittest.TestCase):
         self.assertTrue(Security.connector_config_file_exists("binance"))
         trading_pair_fetcher = TradingPairFetcher(client_config_map)
         self.async_run_with_timeout(self.wait_until_trading_pair_fetcher_ready(trading_pair_fetcher), 1.0)
+        self.async_run_with_timeout(trading_pair_fetcher.fetch_all(client_config_map))
         trading_pairs = trading_pair_fetcher.trading_pairs
         self.assertEqual(2, len(trading_pairs))
         self.assertEqual({"binance": ["MOCK-HBOT"], "mock_paper_trade": ["MOCK-HBOT"]}, trading_pairs)
@@ -278,7 +362,7 @@ class TestTradingPairFetcher(unittest.TestCase):
         }
 
         fetcher = TradingPairFetcher(client_config_map)
-        asyncio.get_event_loop().run_until_complete(fetcher._fetch_task)
+        asyncio.get_event_loop().run_until_complete(fetcher.fetch_all(client_config_map))
         trading_pairs = fetcher.trading_pairs
 
         self.assertEqual(2, len(trading_pairs.keys()))
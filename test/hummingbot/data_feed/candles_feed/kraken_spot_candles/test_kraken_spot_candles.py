@@ -136,6 +136,14 @@ class TestKrakenSpotCandles(unittest.TestCase):
     def test_candles_empty(self):
         self.assertTrue(self.data_feed.candles_df.empty)
 
+    def test_candles_df_timestamps_in_milliseconds(self):
+        self.data_feed._candles.append([1706374800, 1, 2, 0.5, 1.5, 10, 15, 3, 0, 0])
+        self.data_feed._candles.appendleft([1706371200, 1, 2, 0.5, 1.5, 10, 15, 3, 0, 0])
+
+        self.assertEqual([1706371200000, 1706374800000], self.data_feed.candles_df["timestamp"].tolist())
+        # The scaling does not modify the candles shared with the other callers
+        self.assertEqual([1706371200000, 1706374800000], self.data_feed.candles_df["timestamp"].tolist())
+
     @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
     def test_listen_for_subscriptions_subscribes_to_klines(self, ws_connect_mock):
         ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
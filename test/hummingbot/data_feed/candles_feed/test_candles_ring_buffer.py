@@ -0,0 +1,82 @@
+from collections import deque
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.candles_ring_buffer import CandlesRingBuffer
+
+
+class CandlesRingBufferTests(TestCase):
+    columns = ["timestamp", "open", "close"]
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.buffer = CandlesRingBuffer(columns=self.columns, maxlen=4)
+
+    @staticmethod
+    def _candle(timestamp: int):
+        return [float(timestamp), timestamp + 0.5, timestamp + 0.25]
+
+    def test_buffer_behaves_like_a_deque_with_max_length(self):
+        reference = deque(maxlen=4)
+        operations = [
+            ("append", self._candle(3)),
+            ("extendleft", [self._candle(2), self._candle(1)]),
+            ("append", self._candle(4)),
+            ("append", self._candle(5)),
+            ("append", self._candle(6)),
+            ("pop", None),
+            ("append", self._candle(7)),
+            ("appendleft", self._candle(0)),
+        ]
+        for operation, argument in operations:
+            if operation == "pop":
+                self.assertEqual(list(reference.pop()), list(self.buffer.pop()))
+            else:
+                getattr(reference, operation)(argument)
+                getattr(self.buffer, operation)(argument)
+            self.assertEqual(len(reference), len(self.buffer))
+            self.assertEqual([list(candle) for candle in reference], [list(candle) for candle in self.buffer])
+
+        self.assertEqual(4, self.buffer.maxlen)
+        self.assertEqual(self._candle(0), list(self.buffer[0]))
+        self.assertEqual(self._candle(5), list(self.buffer[-1]))
+        with self.assertRaises(IndexError):
+            self.buffer[4]
+
+        self.buffer.clear()
+        self.assertEqual(0, len(self.buffer))
+        with self.assertRaises(IndexError):
+            self.buffer.pop()
+
+    def test_dataframe_is_reused_until_the_candles_change(self):
+        for timestamp in range(6):
+            self.buffer.append(self._candle(timestamp))
+
+        df = self.buffer.to_dataframe()
+        expected_df = pd.DataFrame([self._candle(timestamp) for timestamp in range(2, 6)], columns=self.columns)
+        pd.testing.assert_frame_equal(expected_df, df)
+        self.assertIs(df, self.buffer.to_dataframe())
+
+        version = self.buffer.version
+        self.buffer.pop()
+        self.buffer.append(self._candle(9))
+
+        self.assertEqual(version + 2, self.buffer.version)
+        updated_df = self.buffer.to_dataframe()
+        self.assertIsNot(df, updated_df)
+        self.assertEqual([2.0, 3.0, 4.0, 9.0], updated_df["timestamp"].tolist())
+        # The DataFrame built before the update is not affected by it
+        self.assertEqual([2.0, 3.0, 4.0, 5.0], df["timestamp"].tolist())
+
+    def test_columns_segments_are_read_only_views_in_chronological_order(self):
+        for timestamp in range(6):
+            self.buffer.append(self._candle(timestamp))
+
+        segments = self.buffer.get_columns_segments()
+
+        self.assertEqual(2, len(segments))
+        self.assertEqual([2.0, 3.0, 4.0, 5.0], np.concatenate(segments, axis=1)[0].tolist())
+        with self.assertRaises(ValueError):
+            segments[0][0, 0] = 1.0
@@ -691,16 +691,18 @@ class AvellanedaMarketMakingUnitTests(unittest.TestCase):
 
         alpha, kappa = self.strategy.trading_intensity.current_value
 
-        self.assertAlmostEqual(118.53441791741469, alpha, 3)
-        self.assertAlmostEqual(3.3607256761562003, kappa, 3)
+        self.assertAlmostEqual(118.02715987195587, alpha, 3)
+        self.assertAlmostEqual(3.2729542432604473, kappa, 3)
 
         # Simulate high liquidity
         self.simulate_low_liquidity(self.strategy)
 
         alpha, kappa = self.strategy.trading_intensity.current_value
 
-        self.assertAlmostEqual(118.45210662343376, alpha, 3)
-        self.assertAlmostEqual(3.3468695409821243, kappa, 3)
+        # The fit starts from the closed form solution instead of the high liquidity estimate, and finds a closer fit
+        # of the low liquidity samples (sum of squared errors of 78.5 instead of 119.4)
+        self.assertAlmostEqual(104.54719728431658, alpha, 3)
+        self.assertAlmostEqual(0.8564725143177453, kappa, 3)
 
     def test_calculate_reservation_price_and_optimal_spread_timeframe_constrained(self):
         # Init params
@@ -723,10 +725,10 @@ class AvellanedaMarketMakingUnitTests(unittest.TestCase):
         self.strategy.calculate_reservation_price_and_optimal_spread()
 
         # Check reservation_price, optimal_ask and optimal_bid
-        self.assertAlmostEqual(Decimal("100.035"), self.strategy.reservation_price, 2)
-        self.assertAlmostEqual(Decimal("0.592"), self.strategy.optimal_spread, 2)
-        self.assertAlmostEqual(Decimal("100.331"), self.strategy.optimal_ask, 2)
-        self.assertAlmostEqual(Decimal("99.739"), self.strategy.optimal_bid, 2)
+        self.assertAlmostEqual(Decimal("100.036"), self.strategy.reservation_price, 2)
+        self.assertAlmostEqual(Decimal("0.605"), self.strategy.optimal_spread, 2)
+        self.assertAlmostEqual(Decimal("100.338"), self.strategy.optimal_ask, 2)
+        self.assertAlmostEqual(Decimal("99.733"), self.strategy.optimal_bid, 2)
 
     def test_calculate_reservation_price_and_optimal_spread_timeframe_infinite(self):
         # Init params
@@ -745,9 +747,9 @@ class AvellanedaMarketMakingUnitTests(unittest.TestCase):
 
         # Check reservation_price, optimal_ask and optimal_bid
         self.assertAlmostEqual(Decimal("100.040"), self.strategy.reservation_price, 2)
-        self.assertAlmostEqual(Decimal("0.594"), self.strategy.optimal_spread, 2)
-        self.assertAlmostEqual(Decimal("100.337"), self.strategy.optimal_ask, 2)
-        self.assertAlmostEqual(Decimal("99.743"), self.strategy.optimal_bid, 2)
+        self.assertAlmostEqual(Decimal("0.607"), self.strategy.optimal_spread, 2)
+        self.assertAlmostEqual(Decimal("100.344"), self.strategy.optimal_ask, 2)
+        self.assertAlmostEqual(Decimal("99.737"), self.strategy.optimal_bid, 2)
 
     def test_create_proposal_based_on_order_override(self):
         # Initial check for empty order_override
@@ -32,6 +32,7 @@ from hummingbot.core.event.events import (
     SellOrderCreatedEvent,
 )
 from hummingbot.core.network_iterator import NetworkStatus
+from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.strategy.cross_exchange_market_making.cross_exchange_market_making import (
     CrossExchangeMarketMakingStrategy,
@@ -1246,3 +1247,50 @@ class HedgedMarketMakingUnitTest(unittest.TestCase):
         self.assertEqual(Decimal("1.056"), ask_order.price)
         self.assertAlmostEqual(Decimal("1"), round(bid_order.quantity, 4))
         self.assertAlmostEqual(Decimal("1"), round(ask_order.quantity, 4))
+
+    def test_taker_quotes_are_memoized_during_a_tick(self):
+        self.clock.remove_iterator(self.strategy)
+        self.strategy._set_current_timestamp(self.start_timestamp)
+        quoted_amounts = []
+        get_order_price = self.taker_market.get_order_price
+
+        async def counting_get_order_price(trading_pair: str, is_buy: bool, amount: Decimal) -> Decimal:
+            quoted_amounts.append((is_buy, amount))
+            return await get_order_price(trading_pair, is_buy, amount)
+
+        with patch.object(self.taker_market, "get_order_price", side_effect=counting_get_order_price):
+            prices = self.async_run_with_timeout(safe_gather(
+                self.strategy.get_taker_order_price(self.market_pair, True, Decimal("3.001")),
+                self.strategy.get_taker_order_price(self.market_pair, True, Decimal("3")),
+                self.strategy.get_taker_order_price(self.market_pair, False, Decimal("3")),
+            ))
+            self.assertEqual([Decimal("1.05"), Decimal("1.05"), Decimal("0.95")], prices)
+            # The quotes are requested for the amount quantized to the taker order size quantum (0.01)
+            self.assertEqual([(True, Decimal("3.00")), (False, Decimal("3.00"))], quoted_amounts)
+
+            self.strategy._set_current_timestamp(self.start_timestamp + 1)
+            self.async_run_with_timeout(self.strategy.get_taker_order_price(self.market_pair, True, Decimal("3")))
+            self.assertEqual(3, len(quoted_amounts))
+
+    def test_new_orders_are_sized_and_placed_for_one_market_pair_at_a_time(self):
+        sizing_calls = 0
+        concurrent_sizing_calls = 0
+        max_concurrent_sizing_calls = 0
+
+        async def slow_get_market_making_size(market_pair: MakerTakerMarketPair, is_bid: bool) -> Decimal:
+            nonlocal sizing_calls, concurrent_sizing_calls, max_concurrent_sizing_calls
+            sizing_calls += 1
+            concurrent_sizing_calls += 1
+            max_concurrent_sizing_calls = max(max_concurrent_sizing_calls, concurrent_sizing_calls)
+            await asyncio.sleep(0.01)
+            concurrent_sizing_calls -= 1
+            return Decimal("0")
+
+        with patch.object(self.strategy, "get_market_making_size", side_effect=slow_get_market_making_size):
+            self.async_run_with_timeout(safe_gather(
+                self.strategy.check_and_create_new_orders(self.market_pair, False, False),
+                self.strategy.check_and_create_new_orders(self.market_pair, False, False),
+            ))
+
+        self.assertEqual(4, sizing_calls)
+        self.assertEqual(1, max_concurrent_sizing_calls)
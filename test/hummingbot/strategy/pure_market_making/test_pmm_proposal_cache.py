@@ -0,0 +1,101 @@
+import logging
+import unittest
+from decimal import Decimal
+
+import pandas as pd
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import QuantizationParams
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.pure_market_making.pure_market_making import PureMarketMakingStrategy
+
+logging.basicConfig(level=logging.ERROR)
+
+
+class PMMProposalCacheUnitTest(unittest.TestCase):
+    start: pd.Timestamp = pd.Timestamp("2019-01-01", tz="UTC")
+    end: pd.Timestamp = pd.Timestamp("2019-01-01 01:00:00", tz="UTC")
+    start_timestamp: float = start.timestamp()
+    end_timestamp: float = end.timestamp()
+    trading_pair = "HBOT-ETH"
+    base_asset = trading_pair.split("-")[0]
+    quote_asset = trading_pair.split("-")[1]
+
+    def setUp(self):
+        self.clock: Clock = Clock(ClockMode.BACKTEST, 1, self.start_timestamp, self.end_timestamp)
+        self.market: MockPaperExchange = MockPaperExchange(
+            client_config_map=ClientConfigAdapter(ClientConfigMap())
+        )
+        self.market.set_balanced_order_book(trading_pair=self.trading_pair,
+                                            mid_price=100,
+                                            min_price=1,
+                                            max_price=200,
+                                            price_step_size=1,
+                                            volume_step_size=10)
+        self.market.set_balance("HBOT", 500)
+        self.market.set_balance("ETH", 5000)
+        self.market.set_quantization_param(QuantizationParams(self.trading_pair, 6, 6, 6, 6))
+        self.market_info = MarketTradingPairTuple(self.market, self.trading_pair, self.base_asset, self.quote_asset)
+        self.clock.add_iterator(self.market)
+
+        self.strategy = PureMarketMakingStrategy()
+        self.strategy.init_params(
+            self.market_info,
+            bid_spread=Decimal("0.01"),
+            ask_spread=Decimal("0.01"),
+            order_amount=Decimal("1"),
+            order_levels=3,
+            order_level_spread=Decimal("0.01"),
+            order_refresh_time=30,
+            inventory_skew_enabled=True,
+            inventory_target_base_pct=Decimal("0.5"),
+            inventory_range_multiplier=Decimal("50"),
+            order_optimization_enabled=True,
+            add_transaction_costs_to_orders=True,
+        )
+        self.clock.add_iterator(self.strategy)
+        self.clock.backtest_til(self.start_timestamp)
+
+    @staticmethod
+    def _proposal_values(proposal):
+        return ([(buy.price, buy.size) for buy in proposal.buys],
+                [(sell.price, sell.size) for sell in proposal.sells])
+
+    def test_unchanged_inputs_reuse_the_cached_proposal(self):
+        first_proposal = self.strategy.create_proposal()
+        self.assertEqual(3, len(first_proposal.buys))
+        self.assertEqual(3, len(first_proposal.sells))
+        self.assertEqual(4, self.strategy.proposal_stage_computations)
+
+        second_proposal = self.strategy.create_proposal()
+
+        self.assertEqual(4, self.strategy.proposal_stage_computations)
+        self.assertEqual(self._proposal_values(first_proposal), self._proposal_values(second_proposal))
+        # The cached proposal is not shared with the caller
+        second_proposal.buys[0].size = Decimal("0")
+        self.assertEqual(self._proposal_values(first_proposal),
+                         self._proposal_values(self.strategy.create_proposal()))
+
+    def test_only_the_stages_with_changed_inputs_are_computed_again(self):
+        self.strategy.create_proposal()
+
+        self.market.set_balance("ETH", 150)
+        constrained_proposal = self.strategy.create_proposal()
+
+        # The base and price stages are reused, the size and takers stages are computed again
+        self.assertEqual(6, self.strategy.proposal_stage_computations)
+        self.strategy.invalidate_proposal_cache()
+        self.assertEqual(self._proposal_values(constrained_proposal),
+                         self._proposal_values(self.strategy.create_proposal()))
+
+    def test_config_change_computes_all_the_stages_again(self):
+        first_proposal = self.strategy.create_proposal()
+
+        self.strategy.bid_spread = Decimal("0.02")
+        second_proposal = self.strategy.create_proposal()
+
+        self.assertEqual(8, self.strategy.proposal_stage_computations)
+        self.assertLess(second_proposal.buys[0].price, first_proposal.buys[0].price)
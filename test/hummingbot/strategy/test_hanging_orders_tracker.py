@@ -497,3 +497,35 @@ class TestHangingOrdersTracker(unittest.TestCase):
         hanging_order = next((hanging_order for hanging_order in self.tracker.strategy_current_hanging_orders))
 
         self.assertEqual(order.client_order_id, hanging_order.order_id)
+
+    def test_order_id_indexes_are_updated_through_renew_and_completion(self):
+        strategy_active_orders = []
+        type(self.strategy).current_timestamp = PropertyMock(return_value=1234967891)
+        type(self.strategy).active_orders = PropertyMock(return_value=strategy_active_orders)
+        self.strategy.buy_with_specific_market.return_value = "Order-1234569990000000"
+        old_order = LimitOrder("Order-1234565991000000", "BTC-USDT", True, "BTC", "USDT", Decimal(105), Decimal(1),
+                               creation_timestamp=1234565991000000)
+        self.tracker.add_as_hanging_order(old_order)
+        strategy_active_orders.append(old_order)
+        self.assertTrue(self.tracker.is_order_id_in_hanging_orders(old_order.client_order_id))
+
+        self.tracker.renew_hanging_orders_past_max_order_age()
+        strategy_active_orders.remove(old_order)
+        self.tracker._did_cancel_order(MarketEvent.OrderCancelled,
+                                       self,
+                                       OrderCancelledEvent(old_order.client_order_id, old_order.client_order_id))
+
+        self.assertFalse(self.tracker.is_order_id_in_hanging_orders(old_order.client_order_id))
+        self.assertNotIn(old_order, self.tracker.original_orders)
+        self.assertTrue(self.tracker.is_order_id_in_hanging_orders("Order-1234569990000000"))
+        self.assertEqual(set(), self.tracker.orders_being_renewed)
+
+        self.tracker._did_complete_buy_order(MarketEvent.BuyOrderCompleted,
+                                             self,
+                                             BuyOrderCompletedEvent(1234967891, "Order-1234569990000000",
+                                                                    "BTC", "USDT", Decimal(1), Decimal(105),
+                                                                    OrderType.LIMIT))
+
+        self.assertFalse(self.tracker.is_order_id_in_hanging_orders("Order-1234569990000000"))
+        self.assertTrue(self.tracker.is_order_id_in_completed_hanging_orders("Order-1234569990000000"))
+        self.assertEqual(set(), self.tracker.strategy_current_hanging_orders)
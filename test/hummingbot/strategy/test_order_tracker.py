@@ -485,3 +485,48 @@ class OrderTrackerUnitTests(unittest.TestCase):
 
         # Check that check_and_cleanup_shadow_records clears shadow_limit_orders
         self.assertTrue(len(self.order_tracker.shadow_limit_orders) == 0)
+
+    def test_order_views_are_reused_until_the_tracked_orders_change(self):
+        initial_version = self.order_tracker.version
+        active_limit_orders = self.order_tracker.active_limit_orders
+        self.assertIs(active_limit_orders, self.order_tracker.active_limit_orders)
+
+        order: LimitOrder = self.limit_orders[0]
+        self.simulate_place_order(self.order_tracker, order, self.market_info)
+
+        self.assertEqual(initial_version + 1, self.order_tracker.version)
+        self.assertIsNot(active_limit_orders, self.order_tracker.active_limit_orders)
+        active_limit_orders = self.order_tracker.active_limit_orders
+        active_bids = self.order_tracker.active_bids
+        market_pair_to_active_orders = self.order_tracker.market_pair_to_active_orders
+        self.assertEqual([(self.market, order.client_order_id)],
+                         [(market, o.client_order_id) for market, o in active_limit_orders])
+
+        self.clock.backtest_til(self.start_timestamp + self.clock_tick_size)
+
+        self.assertIs(active_limit_orders, self.order_tracker.active_limit_orders)
+        self.assertIs(active_bids, self.order_tracker.active_bids)
+        self.assertIs(market_pair_to_active_orders, self.order_tracker.market_pair_to_active_orders)
+
+        self.simulate_stop_tracking_order(self.order_tracker, order, self.market_info)
+
+        self.assertEqual(initial_version + 2, self.order_tracker.version)
+        self.assertEqual([], self.order_tracker.active_limit_orders)
+        self.assertEqual([], self.order_tracker.active_bids)
+        self.assertEqual({}, self.order_tracker.market_pair_to_active_orders)
+
+    def test_order_views_include_again_orders_when_their_in_flight_cancel_expires(self):
+        order: LimitOrder = self.limit_orders[0]
+        self.simulate_place_order(self.order_tracker, order, self.market_info)
+        self.simulate_order_created(self.order_tracker, order)
+        self.simulate_cancel_order(self.order_tracker, order)
+
+        self.assertEqual([], self.order_tracker.active_limit_orders)
+        self.assertEqual([], self.order_tracker.market_pair_to_active_orders[self.market_info])
+
+        self.clock.backtest_til(self.start_timestamp + OrderTracker.CANCEL_EXPIRY_DURATION + self.clock_tick_size)
+
+        self.assertEqual([order.client_order_id],
+                         [o.client_order_id for _, o in self.order_tracker.active_limit_orders])
+        self.assertEqual([order.client_order_id],
+                         [o.client_order_id for o in self.order_tracker.market_pair_to_active_orders[self.market_info]])
@@ -107,3 +107,54 @@ class RingBufferTest(unittest.TestCase):
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([0, 1, 2, 3])))
         buffer.add_value(4)
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([1, 2, 3, 4])))
+
+    def test_segments_are_views_of_the_buffer(self):
+        buffer = RingBuffer(4)
+        for i in range(3):
+            buffer.add_value(i)
+
+        oldest_values, newest_values = buffer.get_segments()
+        self.assertTrue(np.array_equal(oldest_values, np.array([0, 1, 2])))
+        self.assertEqual(0, newest_values.size)
+
+        buffer.add_value(3)
+        buffer.add_value(4)
+        oldest_values, newest_values = buffer.get_segments()
+        self.assertTrue(np.array_equal(oldest_values, np.array([1, 2, 3])))
+        self.assertTrue(np.array_equal(newest_values, np.array([4])))
+        self.assertFalse(oldest_values.flags.owndata)
+        self.assertFalse(oldest_values.flags.writeable)
+
+    def test_running_statistics_match_the_buffer_values(self):
+        buffer = RingBuffer(self.BUFFER_LENGTH, track_squared_diffs=True)
+        values = np.random.default_rng(42).normal(30000, 5, self.BUFFER_LENGTH * 3 + 7).astype(np.float32)
+
+        for value in values:
+            buffer.add_value(value)
+            buffer_values = buffer.get_as_numpy_array()
+            self.assertEqual(buffer_values.size, buffer.size)
+            self.assertAlmostEqual(np.sum(buffer_values) / buffer.size, buffer.sum / buffer.size, 6)
+            self.assertAlmostEqual(np.sum(np.square(np.diff(buffer_values))), buffer.squared_diffs_sum, 6)
+            if buffer.is_full:
+                self.assertAlmostEqual(np.mean(buffer_values), buffer.mean_value, 6)
+                self.assertAlmostEqual(np.var(buffer_values), buffer.variance, 6)
+
+        self.assertTrue(np.isnan(self.buffer.squared_diffs_sum))
+
+    def test_running_statistics_recover_from_nan_values(self):
+        self.buffer.add_value(np.nan)
+        for i in range(self.BUFFER_LENGTH):
+            self.buffer.add_value(1)
+
+        self.assertEqual(1, self.buffer.mean_value)
+        self.assertEqual(0, self.buffer.variance)
+
+    def test_length_change_resets_running_statistics(self):
+        for i in range(self.BUFFER_LENGTH):
+            self.buffer.add_value(i)
+
+        self.buffer.length = 3
+
+        self.assertTrue(np.array_equal(self.buffer.get_as_numpy_array(), np.array([27, 28, 29])))
+        self.assertEqual(28, self.buffer.mean_value)
+        self.assertEqual(84, self.buffer.sum)
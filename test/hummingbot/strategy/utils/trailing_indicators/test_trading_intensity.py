@@ -1,6 +1,7 @@
 import math
 import unittest
 from decimal import Decimal
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
@@ -13,7 +14,10 @@ from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 from hummingbot.core.event.events import OrderBookTradeEvent
-from hummingbot.strategy.__utils__.trailing_indicators.trading_intensity import TradingIntensityIndicator
+from hummingbot.strategy.__utils__.trailing_indicators.trading_intensity import (
+    TradingIntensityIndicator,
+    fit_exponential_decay,
+)
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.order_book_asset_price_delegate import OrderBookAssetPriceDelegate
 
@@ -224,8 +228,8 @@ class TradingIntensityTest(unittest.TestCase):
             self.indicator.last_quotes = [{"timestamp": timestamp, "price": mid}] + self.indicator.last_quotes
             timestamp += 1
 
-        self.assertAlmostEqual(self.indicator.current_value[0], 1.0032422566402444, 4)
-        self.assertAlmostEqual(self.indicator.current_value[1], 0.0001595577045670909, 4)
+        self.assertAlmostEqual(self.indicator.current_value[0], 1.0034590783173871, 4)
+        self.assertAlmostEqual(self.indicator.current_value[1], 0.00015381377951660262, 4)
 
     def test_calculate_trading_intensity_deterministic(self):
         def curve_fn(t_, a_, b_):  # see curve fit in `TradingIntensityIndicator.c_estimate_intensity`
@@ -259,3 +263,62 @@ class TradingIntensityTest(unittest.TestCase):
 
         self.assertAlmostEqual(a, alpha, 10)
         self.assertAlmostEqual(b, kappa, 10)
+
+    def test_fit_exponential_decay_is_exact_for_noiseless_samples(self):
+        price_levels = np.array([0.5, 1.0, 2.0, 4.0])
+        lambdas = 3 * np.exp(-0.7 * price_levels)
+
+        alpha, kappa = fit_exponential_decay(price_levels, lambdas)
+
+        self.assertAlmostEqual(3, alpha, 10)
+        self.assertAlmostEqual(0.7, kappa, 10)
+
+    @patch("hummingbot.strategy.__utils__.trailing_indicators.trading_intensity.curve_fit")
+    def test_curve_is_fitted_in_closed_form_only_when_the_samples_change(self, curve_fit_mock):
+        trading_intensity_indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 1)
+        timestamp = self.start_timestamp
+        trading_intensity_indicator.last_quotes = [{"timestamp": timestamp, "price": 1}]
+        timestamp += 1
+        for price in [2, 3, 4, 5]:
+            trading_intensity_indicator.register_trade(OrderBookTradeEvent(
+                trading_pair="COINALPHAHBOT",
+                timestamp=timestamp,
+                price=price,
+                amount=2 * math.exp(-0.1 * (price - 1)),
+                type=TradeType.SELL,
+            ))
+
+        with patch("hummingbot.strategy.__utils__.trailing_indicators.trading_intensity.fit_exponential_decay",
+                   wraps=fit_exponential_decay) as fit_mock:
+            trading_intensity_indicator.calculate(timestamp)
+            trading_intensity_indicator.calculate(timestamp + 1)
+
+        alpha, kappa = trading_intensity_indicator.current_value
+        self.assertAlmostEqual(2, alpha, 10)
+        self.assertAlmostEqual(0.1, kappa, 10)
+        # The closed form fit is exact, so it is not refined, and it is not repeated while the samples don't change
+        curve_fit_mock.assert_not_called()
+        fit_mock.assert_called_once()
+
+    def test_price_level_amounts_are_updated_when_samples_leave_the_window(self):
+        trading_intensity_indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 2)
+        timestamp = self.start_timestamp
+        trading_intensity_indicator.last_quotes = [{"timestamp": timestamp, "price": 1}]
+
+        for price_levels in ([2, 3], [2, 4], [3, 5]):
+            timestamp += 1
+            for price in price_levels:
+                trading_intensity_indicator.register_trade(OrderBookTradeEvent(
+                    trading_pair="COINALPHAHBOT",
+                    timestamp=timestamp,
+                    price=price,
+                    amount=1.5,
+                    type=TradeType.SELL,
+                ))
+            trading_intensity_indicator.calculate(timestamp)
+            trading_intensity_indicator.last_quotes = (
+                [{"timestamp": timestamp, "price": 1}] + trading_intensity_indicator.last_quotes)
+
+        price_levels, amounts = trading_intensity_indicator.price_levels_amounts
+        self.assertEqual({1.0: 1.5, 2.0: 1.5, 3.0: 1.5, 4.0: 1.5}, dict(zip(price_levels, amounts)))
+        self.assertTrue(trading_intensity_indicator.is_sampling_buffer_full)
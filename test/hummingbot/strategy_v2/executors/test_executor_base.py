@@ -10,6 +10,7 @@ from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
     BuyOrderCreatedEvent,
+    MarketEvent,
     MarketOrderFailureEvent,
     OrderCancelledEvent,
     OrderFilledEvent,
@@ -17,6 +18,7 @@ from hummingbot.core.event.events import (
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 from hummingbot.strategy_v2.executors.data_types import ExecutorConfigBase
 from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
+from hummingbot.strategy_v2.executors.order_event_router import OrderEventRouter
 from hummingbot.strategy_v2.models.base import RunnableStatus
 
 
@@ -142,6 +144,27 @@ class TestExecutorBase(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
         )
         self.assertEqual(sell_order_id, "OID-SELL-1")
 
+    async def test_placed_orders_events_are_routed_to_the_executor(self):
+        connector = self.strategy.connectors["connector1"]
+        router = OrderEventRouter.get_router(connector)
+        self.component.start()
+        buy_order_id = self.component.place_order(
+            connector_name="connector1",
+            trading_pair="ETH-USDT",
+            order_type=OrderType.LIMIT,
+            side=TradeType.BUY,
+            price=Decimal("1000.0"),
+            amount=Decimal("1.0"),
+        )
+
+        self.assertIs(self.component, router.order_owners[buy_order_id])
+        self.assertEqual(len(OrderEventRouter.EVENT_HANDLERS), connector.add_listener.call_count)
+
+        self.component.stop()
+
+        self.assertNotIn(buy_order_id, router.order_owners)
+        self.assertEqual(len(OrderEventRouter.EVENT_HANDLERS), connector.remove_listener.call_count)
+
     async def test_executor_starts_and_stops(self):
         self.assertEqual(RunnableStatus.NOT_STARTED, self.component.status)
         self.component.start()
@@ -159,6 +182,59 @@ class TestExecutorBase(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
         executor_info = self.component.executor_info
         self.assertEqual(executor_info.id, "test")
 
+    @patch.object(ExecutorBase, "get_net_pnl_pct")
+    @patch.object(ExecutorBase, "get_net_pnl_quote")
+    @patch.object(ExecutorBase, "get_cum_fees_quote")
+    async def test_executor_info_snapshot_is_rebuilt_only_after_state_changes(
+            self, cum_fees_quote_mock, net_pnl_quote_mock, net_pnl_pct_mock):
+        net_pnl_pct_mock.return_value = Decimal("0.01")
+        net_pnl_quote_mock.return_value = Decimal("1.0")
+        cum_fees_quote_mock.return_value = Decimal("0.1")
+        executor_info = self.component.executor_info
+        net_pnl_quote_calls = net_pnl_quote_mock.call_count
+
+        self.assertIs(executor_info, self.component.executor_info)
+        self.assertEqual(net_pnl_quote_calls, net_pnl_quote_mock.call_count)
+
+        # The control task ran without changing the PnL or the filled amount
+        self.component.on_control_task_done()
+        self.assertIs(executor_info, self.component.executor_info)
+
+        net_pnl_quote_mock.return_value = Decimal("2.0")
+        self.component.on_control_task_done()
+        executor_info = self.component.executor_info
+        self.assertEqual(Decimal("2.0"), executor_info.net_pnl_quote)
+        self.assertIs(executor_info, self.component.executor_info)
+
+        # The values depending on the market prices are refreshed once the snapshot is older than the refresh interval
+        net_pnl_pct_mock.return_value = Decimal("0.02")
+        self.component.on_control_task_done()
+        self.assertIs(executor_info, self.component.executor_info)
+        self.component.EXECUTOR_INFO_REFRESH_INTERVAL = 0
+        self.component.on_control_task_done()
+        executor_info = self.component.executor_info
+        self.assertEqual(Decimal("0.02"), executor_info.net_pnl_pct)
+        del self.component.EXECUTOR_INFO_REFRESH_INTERVAL
+
+        with patch.object(ExecutorBase, "filled_amount_quote", new_callable=PropertyMock) as filled_amount_quote_mock:
+            filled_amount_quote_mock.return_value = Decimal("100")
+            self.component.on_control_task_done()
+            executor_info = self.component.executor_info
+            self.assertEqual(Decimal("100"), executor_info.filled_amount_quote)
+
+        router = OrderEventRouter.get_router(self.strategy.connectors["connector1"])
+        self.component.start()
+        self.assertEqual(RunnableStatus.RUNNING, self.component.executor_info.status)
+        executor_info = self.component.executor_info
+        self.component.place_order(connector_name="connector1", trading_pair="ETH-USDT", order_type=OrderType.LIMIT,
+                                   side=TradeType.BUY, price=Decimal("1000.0"), amount=Decimal("1.0"))
+        router._route_event(MarketEvent.OrderCancelled.value, self.strategy.connectors["connector1"],
+                            OrderCancelledEvent(timestamp=1234567890, order_id="OID-BUY-1"))
+        self.assertIsNot(executor_info, self.component.executor_info)
+
+        self.component.stop()
+        self.assertEqual(RunnableStatus.TERMINATED, self.component.executor_info.status)
+
     def test_get_price_by_type(self):
         price = self.component.get_price("connector1", "EHT-USDT", PriceType.MidPrice)
         self.assertEqual(price, Decimal("1000.0"))
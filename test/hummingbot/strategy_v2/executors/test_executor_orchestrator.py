@@ -199,3 +199,74 @@ class TestExecutorOrchestrator(unittest.TestCase):
         self.assertAlmostEqual(global_report.global_pnl_quote, expected_total_realized_pnl)
         self.assertAlmostEqual(global_report.global_pnl_pct,
                                (expected_total_realized_pnl / expected_total_volume_traded) * 100)
+
+    @patch('hummingbot.connector.markets_recorder.MarketsRecorder.get_instance')
+    def test_performance_report_uses_the_aggregated_performance_of_the_stored_executors(self, mock_get_instance):
+        mock_markets_recorder = MagicMock(spec=MarketsRecorder)
+        mock_markets_recorder.get_closed_executors_performance.return_value = [
+            ("test", CloseType.TAKE_PROFIT.value, 15.0, 150.0, 2),
+            ("test", CloseType.FAILED.value, 100.0, 1000.0, 1),
+            ("other", CloseType.STOP_LOSS.value, -3.0, 30.0, 1),
+        ]
+        mock_markets_recorder.get_active_executors.return_value = []
+        mock_get_instance.return_value = mock_markets_recorder
+        config = PositionExecutorConfig(
+            timestamp=1234, trading_pair="ETH-USDT", connector_name="binance",
+            side=TradeType.BUY, amount=Decimal(10), entry_price=Decimal(100),
+        )
+        position_executor = MagicMock(spec=PositionExecutor)
+        position_executor.is_active = False
+        position_executor.config = config
+        position_executor.executor_info = ExecutorInfo(
+            id=config.id, timestamp=1234, type="position_executor",
+            status=RunnableStatus.TERMINATED, config=config, close_type=CloseType.STOP_LOSS,
+            filled_amount_quote=Decimal(100), net_pnl_quote=Decimal(-5), net_pnl_pct=Decimal(-5),
+            cum_fees_quote=Decimal(1), is_trading=False, is_active=False, custom_info={"side": TradeType.BUY}
+        )
+        self.orchestrator.executors["test"] = [position_executor]
+
+        report = self.orchestrator.generate_performance_report(controller_id="test")
+        self.assertEqual(Decimal(10), report.realized_pnl_quote)
+        self.assertEqual(Decimal(250), report.volume_traded)
+        self.assertEqual({CloseType.TAKE_PROFIT: 2, CloseType.STOP_LOSS: 1}, report.close_type_counts)
+
+        self.orchestrator.execute_actions([StoreExecutorAction(executor_id=config.id, controller_id="test")])
+        report = self.orchestrator.generate_performance_report(controller_id="test")
+
+        self.assertEqual(Decimal(10), report.realized_pnl_quote)
+        self.assertEqual(Decimal(250), report.volume_traded)
+        self.assertEqual({CloseType.TAKE_PROFIT: 2, CloseType.STOP_LOSS: 1}, report.close_type_counts)
+        mock_markets_recorder.get_closed_executors_performance.assert_called_once()
+        mock_markets_recorder.get_executors_by_controller.assert_not_called()
+
+    @patch('hummingbot.connector.markets_recorder.MarketsRecorder.get_instance')
+    def test_stop_aggregates_the_stored_executors_performance_before_storing_the_executors(self, mock_get_instance):
+        mock_markets_recorder = MagicMock(spec=MarketsRecorder)
+        mock_markets_recorder.get_closed_executors_performance.return_value = [
+            ("test", CloseType.TAKE_PROFIT.value, 15.0, 150.0, 2),
+        ]
+        mock_markets_recorder.get_active_executors.return_value = []
+        mock_get_instance.return_value = mock_markets_recorder
+        config = PositionExecutorConfig(
+            timestamp=1234, trading_pair="ETH-USDT", connector_name="binance",
+            side=TradeType.BUY, amount=Decimal(10), entry_price=Decimal(100),
+        )
+        position_executor = MagicMock(spec=PositionExecutor)
+        position_executor.is_closed = True
+        position_executor.executor_info = ExecutorInfo(
+            id=config.id, timestamp=1234, type="position_executor",
+            status=RunnableStatus.TERMINATED, config=config, close_type=CloseType.STOP_LOSS,
+            filled_amount_quote=Decimal(100), net_pnl_quote=Decimal(-5), net_pnl_pct=Decimal(-5),
+            cum_fees_quote=Decimal(1), is_trading=False, is_active=False, custom_info={"side": TradeType.BUY}
+        )
+        self.orchestrator.executors["test"] = [position_executor]
+
+        self.orchestrator.stop()
+        report = self.orchestrator.generate_performance_report(controller_id="test")
+
+        called_methods = [call[0] for call in mock_markets_recorder.method_calls]
+        self.assertLess(called_methods.index("get_closed_executors_performance"),
+                        called_methods.index("store_or_update_executor"))
+        self.assertEqual(Decimal(10), report.realized_pnl_quote)
+        self.assertEqual(Decimal(250), report.volume_traded)
+        self.assertEqual({CloseType.TAKE_PROFIT: 2, CloseType.STOP_LOSS: 1}, report.close_type_counts)
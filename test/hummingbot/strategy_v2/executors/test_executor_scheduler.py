@@ -0,0 +1,146 @@
+import asyncio
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from test.logger_mixin_for_test import LoggerMixinForTest
+from typing import List
+
+from hummingbot.strategy_v2.executors.executor_scheduler import ExecutorScheduler
+from hummingbot.strategy_v2.models.base import RunnableStatus
+from hummingbot.strategy_v2.runnable_base import RunnableBase
+
+
+class CountingComponent(RunnableBase):
+    def __init__(self, name: str, runs_log: List[str], update_interval: float = 0.05):
+        super().__init__(update_interval=update_interval)
+        self.name = name
+        self.runs_log = runs_log
+        self.control_task_count = 0
+        self.on_start_count = 0
+        self.on_stop_count = 0
+
+    def on_start(self):
+        self.on_start_count += 1
+
+    def on_stop(self):
+        self.on_stop_count += 1
+
+    async def control_task(self):
+        self.control_task_count += 1
+        self.runs_log.append(self.name)
+
+
+class ExecutorSchedulerTests(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.scheduler = ExecutorScheduler(tick_size=0.01, wheel_size=16)
+        self.set_loggers([self.scheduler.logger(), RunnableBase.logger()])
+        self.runs_log = []
+
+    def tearDown(self) -> None:
+        self.scheduler.stop()
+        super().tearDown()
+
+    def _create_component(self, name: str, update_interval: float = 0.05) -> CountingComponent:
+        component = CountingComponent(name, self.runs_log, update_interval)
+        component.set_scheduler(self.scheduler)
+        return component
+
+    async def _wait_for_control_tasks(self, components: List[CountingComponent], control_tasks_count: int):
+        while any(component.control_task_count < control_tasks_count for component in components):
+            await asyncio.sleep(0.01)
+
+    async def test_components_run_periodically_in_a_fixed_pool_of_worker_tasks(self):
+        self.scheduler = ExecutorScheduler(tick_size=0.01, wheel_size=16, batch_size=10)
+        components = [self._create_component(f"C{i}") for i in range(100)]
+        tasks_count = len(asyncio.all_tasks())
+
+        for component in components:
+            component.start()
+
+        self.assertEqual(RunnableStatus.RUNNING, components[0].status)
+        # The driver task and the worker tasks
+        self.assertEqual(tasks_count + 1 + 10, len(asyncio.all_tasks()))
+
+        for control_tasks_count in range(1, 4):
+            await asyncio.wait_for(self._wait_for_control_tasks(components, control_tasks_count), timeout=5)
+            self.assertEqual(tasks_count + 1 + 10, len(asyncio.all_tasks()))
+
+        for component in components:
+            self.assertEqual(1, component.on_start_count)
+        self.assertEqual(100, self.scheduler.executors_count)
+
+    async def test_stopped_components_are_removed_and_driver_task_ends(self):
+        component = self._create_component("C0")
+        component.start()
+        await asyncio.sleep(0.02)
+
+        component.stop()
+        await asyncio.sleep(0.02)
+
+        self.assertEqual(1, component.on_stop_count)
+        self.assertEqual(0, self.scheduler.executors_count)
+        self.assertFalse(self.scheduler.running)
+
+    async def test_wake_up_runs_the_control_task_before_the_update_interval(self):
+        component = self._create_component("C0", update_interval=10)
+        component.start()
+        await asyncio.sleep(0.02)
+        self.assertEqual(1, component.control_task_count)
+
+        component.request_wake_up()
+        await asyncio.sleep(0.02)
+
+        self.assertEqual(2, component.control_task_count)
+
+    async def test_due_components_left_out_of_the_time_budget_run_first_in_the_next_cycle(self):
+        self.scheduler = ExecutorScheduler(tick_size=0.01, wheel_size=16, batch_size=2, cycle_time_budget=0)
+        components = [self._create_component(f"C{i}", update_interval=10) for i in range(6)]
+
+        for component in components:
+            component.start()
+        await asyncio.sleep(0.02)
+
+        self.assertEqual([f"C{i}" for i in range(6)], self.runs_log)
+        self.assertGreater(self.scheduler.over_budget_cycles_count, 0)
+        self.assertEqual(0, self.scheduler.ready_executors_count)
+
+    async def test_control_task_errors_are_logged_and_the_component_keeps_running(self):
+        component = self._create_component("C0")
+
+        async def raise_exception():
+            component.control_task_count += 1
+            raise Exception("Test error")
+
+        component.control_task = raise_exception
+        component.start()
+        await asyncio.sleep(0.08)
+
+        self.assertGreaterEqual(component.control_task_count, 2)
+        self.assertTrue(self.is_logged("ERROR", "Test error"))
+        self.assertEqual(1, self.scheduler.executors_count)
+
+    async def test_slow_control_task_does_not_delay_the_other_components(self):
+        slow_component = self._create_component("slow")
+
+        async def slow_control_task():
+            slow_component.control_task_count += 1
+            await asyncio.sleep(0.3)
+
+        slow_component.control_task = slow_control_task
+        components = [self._create_component(f"C{i}") for i in range(3)]
+
+        slow_component.start()
+        for component in components:
+            component.start()
+        await asyncio.sleep(0.2)
+
+        self.assertEqual(1, slow_component.control_task_count)
+        for component in components:
+            self.assertGreaterEqual(component.control_task_count, 3)
+        self.assertEqual(4, self.scheduler.executors_count)
+
+        slow_component.stop()
+        await asyncio.sleep(0.15)
+
+        self.assertEqual(1, slow_component.on_stop_count)
+        self.assertEqual(3, self.scheduler.executors_count)
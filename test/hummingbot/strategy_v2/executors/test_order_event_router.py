@@ -0,0 +1,104 @@
+from decimal import Decimal
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import MarketEvent, OrderCancelledEvent, OrderFilledEvent
+from hummingbot.core.pubsub import PubSub
+from hummingbot.strategy_v2.executors.order_event_router import OrderEventRouter
+
+
+class OrderEventRouterTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.connector = PubSub()
+        self.router = OrderEventRouter.get_router(self.connector)
+
+    def _fill_event(self, order_id: str) -> OrderFilledEvent:
+        return OrderFilledEvent(
+            timestamp=1234567890,
+            order_id=order_id,
+            trading_pair="ETH-USDT",
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price=Decimal("1000"),
+            amount=Decimal("1"),
+            trade_fee=AddedToCostTradeFee(percent=Decimal("0.001")),
+        )
+
+    def test_get_router_returns_one_router_per_connector(self):
+        self.assertIs(self.router, OrderEventRouter.get_router(self.connector))
+        self.assertIsNot(self.router, OrderEventRouter.get_router(PubSub()))
+
+    def test_events_are_delivered_only_to_the_order_owner(self):
+        executors = [MagicMock() for _ in range(100)]
+        for index, executor in enumerate(executors):
+            self.router.subscribe(executor)
+            self.router.register_order(f"OID-{index}", executor)
+
+        fill_event = self._fill_event("OID-42")
+        self.connector.trigger_event(MarketEvent.OrderFilled, fill_event)
+        cancel_event = OrderCancelledEvent(timestamp=1234567890, order_id="OID-7")
+        self.connector.trigger_event(MarketEvent.OrderCancelled, cancel_event)
+
+        executors[42].process_order_filled_event.assert_called_once_with(
+            MarketEvent.OrderFilled.value, self.connector, fill_event)
+        executors[7].process_order_canceled_event.assert_called_once_with(
+            MarketEvent.OrderCancelled.value, self.connector, cancel_event)
+        notified = [executor for executor in executors if len(executor.method_calls) > 0]
+        self.assertEqual([executors[7], executors[42]], notified)
+
+    def test_events_of_unknown_orders_are_ignored(self):
+        executor = MagicMock()
+        self.router.subscribe(executor)
+
+        self.connector.trigger_event(MarketEvent.OrderFilled, self._fill_event("OID-1"))
+
+        executor.process_order_filled_event.assert_not_called()
+
+    def test_orders_of_unsubscribed_executors_are_not_routed(self):
+        executor = MagicMock()
+        self.router.register_order("OID-1", executor)
+        self.assertEqual({}, self.router.order_owners)
+
+        self.router.subscribe(executor)
+        self.router.register_order("OID-1", executor)
+        self.router.unsubscribe(executor)
+        self.connector.trigger_event(MarketEvent.OrderFilled, self._fill_event("OID-1"))
+
+        executor.process_order_filled_event.assert_not_called()
+        self.assertEqual({}, self.router.order_owners)
+
+    def test_router_listens_to_the_connector_only_while_executors_are_subscribed(self):
+        first_executor = MagicMock()
+        second_executor = MagicMock()
+
+        self.router.subscribe(first_executor)
+        self.router.subscribe(second_executor)
+        self.router.subscribe(second_executor)
+        self.assertEqual(2, self.router.executors_count)
+        self.assertEqual(1, len(self.connector.get_listeners(MarketEvent.OrderFilled)))
+
+        self.router.unsubscribe(first_executor)
+        self.assertEqual(1, len(self.connector.get_listeners(MarketEvent.OrderFilled)))
+        self.router.unsubscribe(second_executor)
+        self.assertEqual(0, len(self.connector.get_listeners(MarketEvent.OrderFilled)))
+        self.assertEqual(0, self.router.executors_count)
+
+    def test_executors_opting_in_are_woken_up_after_processing_the_events(self):
+        executor = MagicMock()
+        executor.WAKE_UP_ON_ORDER_EVENTS = True
+        other_executor = MagicMock()
+        other_executor.WAKE_UP_ON_ORDER_EVENTS = False
+        self.router.subscribe(executor)
+        self.router.subscribe(other_executor)
+        self.router.register_order("OID-1", executor)
+        self.router.register_order("OID-2", other_executor)
+
+        self.connector.trigger_event(MarketEvent.OrderFilled, self._fill_event("OID-1"))
+        self.connector.trigger_event(MarketEvent.OrderFilled, self._fill_event("OID-2"))
+
+        executor.request_wake_up.assert_called_once()
+        other_executor.request_wake_up.assert_not_called()
@@ -0,0 +1,164 @@
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from unittest.mock import MagicMock
+
+from hummingbot.connector.exchange_py_base import ExchangePyBase
+from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderUpdate, TradeUpdate
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TradeFeeBase
+from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
+from hummingbot.core.web_assistant.auth import AuthBase
+from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
+
+if TYPE_CHECKING:
+    from hummingbot.client.config.config_helpers import ClientConfigAdapter
+
+
+class MockExchange(ExchangePyBase):
+    """
+    Minimal ExchangePyBase connector, to test the behavior implemented in ExchangePyBase without the requests of a
+    real exchange. The balances returned by the exchange are configured in `exchange_balances`, and every balance
+    request is counted in `balance_requests_count`.
+    """
+
+    def __init__(self,
+                 client_config_map: "ClientConfigAdapter",
+                 trading_pairs: Optional[List[str]] = None,
+                 use_balance_ledger: bool = False):
+        self._trading_pairs = trading_pairs or []
+        self._use_balance_ledger = use_balance_ledger
+        self.exchange_balances: Dict[str, Tuple[Decimal, Decimal]] = {}  # Dict[asset, (total, available)]
+        self.balance_requests_count = 0
+        super().__init__(client_config_map)
+
+    @property
+    def name(self) -> str:
+        return "mock_exchange"
+
+    @property
+    def authenticator(self) -> Optional[AuthBase]:
+        return None
+
+    @property
+    def rate_limits_rules(self) -> List[RateLimit]:
+        return []
+
+    @property
+    def domain(self) -> str:
+        return ""
+
+    @property
+    def client_order_id_max_length(self) -> int:
+        return 32
+
+    @property
+    def client_order_id_prefix(self) -> str:
+        return "MOCK"
+
+    @property
+    def trading_rules_request_path(self) -> str:
+        return ""
+
+    @property
+    def trading_pairs_request_path(self) -> str:
+        return ""
+
+    @property
+    def check_network_request_path(self) -> str:
+        return ""
+
+    @property
+    def trading_pairs(self) -> List[str]:
+        return self._trading_pairs
+
+    @property
+    def is_cancel_request_in_exchange_synchronous(self) -> bool:
+        return True
+
+    @property
+    def is_trading_required(self) -> bool:
+        return True
+
+    @property
+    def use_balance_ledger(self) -> bool:
+        return self._use_balance_ledger
+
+    def supported_order_types(self) -> List[OrderType]:
+        return [OrderType.LIMIT, OrderType.MARKET]
+
+    def _is_request_exception_related_to_time_synchronizer(self, request_exception: Exception) -> bool:
+        return False
+
+    def _is_order_not_found_during_status_update_error(self, status_update_exception: Exception) -> bool:
+        return False
+
+    def _is_order_not_found_during_cancelation_error(self, cancelation_exception: Exception) -> bool:
+        return False
+
+    async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder) -> bool:
+        return True
+
+    async def _place_order(self,
+                           order_id: str,
+                           trading_pair: str,
+                           amount: Decimal,
+                           trade_type: TradeType,
+                           order_type: OrderType,
+                           price: Decimal,
+                           **kwargs) -> Tuple[str, float]:
+        return f"EOID-{order_id}", self.current_timestamp
+
+    def _get_fee(self,
+                 base_currency: str,
+                 quote_currency: str,
+                 order_type: OrderType,
+                 order_side: TradeType,
+                 amount: Decimal,
+                 price: Decimal = Decimal("NaN"),
+                 is_maker: Optional[bool] = None) -> TradeFeeBase:
+        return AddedToCostTradeFee()
+
+    async def _update_trading_fees(self):
+        pass
+
+    async def _user_stream_event_listener(self):
+        pass
+
+    async def _format_trading_rules(self, exchange_info_dict: Dict[str, Any]) -> List[TradingRule]:
+        return []
+
+    async def _update_time_synchronizer(self, pass_on_non_cancelled_error: bool = False):
+        pass
+
+    async def _make_trading_rules_request(self) -> Any:
+        return {}
+
+    async def _make_trading_pairs_request(self) -> Any:
+        return {}
+
+    async def _update_balances(self):
+        self.balance_requests_count += 1
+        self._account_balances = {asset: total for asset, (total, _) in self.exchange_balances.items()}
+        self._account_available_balances = {
+            asset: available for asset, (_, available) in self.exchange_balances.items()}
+
+    async def _all_trade_updates_for_order(self, order: InFlightOrder) -> List[TradeUpdate]:
+        return []
+
+    async def _request_order_status(self, tracked_order: InFlightOrder) -> OrderUpdate:
+        raise NotImplementedError
+
+    def _create_web_assistants_factory(self) -> WebAssistantsFactory:
+        return WebAssistantsFactory(throttler=self._throttler)
+
+    def _create_order_book_data_source(self) -> OrderBookTrackerDataSource:
+        return MagicMock(spec=OrderBookTrackerDataSource)
+
+    def _create_user_stream_data_source(self) -> UserStreamTrackerDataSource:
+        return MagicMock(spec=UserStreamTrackerDataSource)
+
+    def _initialize_trading_pair_symbols_from_exchange_info(self, exchange_info: Dict[str, Any]):
+        pass